@@ -0,0 +1,218 @@
+"""Column-projected OHLCV loader for ws_dse_daily_prices.
+
+load_ohlcv() selects only the date and OHLCV columns, casts prices and volume
+to float8 in SQL (no Decimal objects) and copies the result into flat NumPy
+arrays, without building WsDseDailyPrice ORM objects or per-row dicts.
+Several tickers come back in one query as contiguous, date-ordered runs
+with an offsets index.
+
+Example:
+    bars = load_ohlcv(session, "GP", end_date=target_date, limit=220)
+    close = bars.close  # float64, oldest first
+
+    bars = load_ohlcv(session, ["GP", "BATBC"], start_date, end_date)
+    gp_close = bars.close[bars.slice("GP")]
+    df = bars.to_frame("BATBC")
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Double, cast, func, select
+from sqlalchemy.orm import Session
+
+from src.database.models import WsDseDailyPrice
+
+logger = logging.getLogger(__name__)
+
+PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass
+class OHLCVArrays:
+    """OHLCV bars for one or more tickers as flat arrays.
+
+    Bars of tickers[i] are rows offsets[i]:offsets[i + 1], oldest first.
+
+    Attributes:
+        tickers: Ticker symbols (tickers without bars have empty runs)
+        index: Mapping from ticker to position in tickers
+        offsets: (n_tickers + 1,) int64 run boundaries
+        dates: datetime64[D] bar dates
+        open, high, low, close, volume: float64 arrays
+    """
+
+    tickers: list[str]
+    index: dict[str, int]
+    offsets: np.ndarray
+    dates: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def slice(self, ticker: str) -> slice:
+        """Row range of a ticker's bars (empty if it has none).
+
+        Raises:
+            KeyError: If the ticker was not requested
+        """
+        i = self.index[ticker]
+        return slice(int(self.offsets[i]), int(self.offsets[i + 1]))
+
+    def count(self, ticker: str) -> int:
+        """Number of bars loaded for a ticker (0 if not loaded)."""
+        i = self.index.get(ticker)
+        return 0 if i is None else int(self.offsets[i + 1] - self.offsets[i])
+
+    def to_frame(self, ticker: str | None = None) -> pd.DataFrame:
+        """DataFrame with columns [date, open, high, low, close, volume].
+
+        Dates are datetime.date objects and volume is int64, as in the
+        ORM-based frames.
+
+        Args:
+            ticker: Ticker to extract (None: all bars, for a single-ticker load)
+        """
+        rows = self.slice(ticker) if ticker is not None else slice(None)
+        return pd.DataFrame(
+            {
+                "date": self.dates[rows].astype(object),
+                "open": self.open[rows],
+                "high": self.high[rows],
+                "low": self.low[rows],
+                "close": self.close[rows],
+                "volume": self.volume[rows].astype(np.int64),
+            }
+        )
+
+
+def load_ohlcv(
+    session: Session,
+    tickers: str | list[str] | None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    limit: int | None = None,
+) -> OHLCVArrays:
+    """Load OHLCV bars for one ticker or many in one query.
+
+    Args:
+        session: Database session
+        tickers: One ticker, a list of tickers, or None for every ticker
+        start_date: First bar date (inclusive, optional)
+        end_date: Last bar date (inclusive, optional)
+        limit: Keep only the most recent `limit` bars per ticker (optional)
+
+    Returns:
+        OHLCVArrays (requested tickers without bars have empty runs)
+    """
+    requested = [tickers] if isinstance(tickers, str) else tickers
+
+    columns = [
+        WsDseDailyPrice.txn_scrip.label("scrip"),
+        WsDseDailyPrice.txn_date.label("date"),
+        *(
+            cast(getattr(WsDseDailyPrice, f"txn_{name}"), Double).label(name)
+            for name in PRICE_COLUMNS
+        ),
+    ]
+    conditions = []
+    if requested is not None:
+        conditions.append(
+            WsDseDailyPrice.txn_scrip == requested[0]
+            if len(requested) == 1
+            else WsDseDailyPrice.txn_scrip.in_(requested)
+        )
+    if start_date is not None:
+        conditions.append(WsDseDailyPrice.txn_date >= start_date)
+    if end_date is not None:
+        conditions.append(WsDseDailyPrice.txn_date <= end_date)
+
+    if limit is None:
+        query = select(*columns).where(*conditions)
+        query = query.order_by(WsDseDailyPrice.txn_scrip, WsDseDailyPrice.txn_date)
+    else:
+        if requested is not None and len(requested) == 1:
+            # One ticker: plain ORDER BY ... LIMIT, no window over its whole history
+            recent = (
+                select(*columns)
+                .where(*conditions)
+                .order_by(WsDseDailyPrice.txn_date.desc())
+                .limit(limit)
+                .subquery()
+            )
+            keep = []
+        else:
+            recency = (
+                func.row_number()
+                .over(
+                    partition_by=WsDseDailyPrice.txn_scrip,
+                    order_by=WsDseDailyPrice.txn_date.desc(),
+                )
+                .label("recency")
+            )
+            recent = select(*columns, recency).where(*conditions).subquery()
+            keep = [recent.c.recency <= limit]
+        query = (
+            select(*(recent.c[name] for name in ("scrip", "date", *PRICE_COLUMNS)))
+            .where(*keep)
+            .order_by(recent.c.scrip, recent.c.date)
+        )
+
+    # Core execution: plain tuples, no ORM identity map or entity loading
+    rows = session.connection().execute(query).all()
+    return build_ohlcv_arrays(rows, requested)
+
+
+def build_ohlcv_arrays(rows: list, tickers: list[str] | None = None) -> OHLCVArrays:
+    """Build OHLCVArrays from (scrip, date, open, high, low, close, volume) rows.
+
+    Rows must be grouped by scrip and date-ordered within each scrip.
+
+    Args:
+        rows: Query result rows
+        tickers: Requested tickers; those without rows get empty runs at the end
+
+    Returns:
+        OHLCVArrays
+    """
+    count = len(rows)
+    dates = np.empty(count, dtype="datetime64[D]")
+    values = {name: np.empty(count, dtype=np.float64) for name in PRICE_COLUMNS}
+
+    found: list[str] = []
+    offsets = [0]
+    if count:
+        scrips, bar_dates, *columns = zip(*rows, strict=True)
+        dates[:] = bar_dates
+        for name, column in zip(PRICE_COLUMNS, columns, strict=True):
+            values[name][:] = column  # NULL -> NaN
+
+        previous = None
+        for i, scrip in enumerate(scrips):
+            if scrip != previous:
+                if previous is not None:
+                    offsets.append(i)
+                found.append(scrip)
+                previous = scrip
+        offsets.append(count)
+
+    found_set = set(found)
+    missing = [ticker for ticker in tickers or [] if ticker not in found_set]
+    all_tickers = found + missing
+    offsets.extend([count] * len(missing))
+
+    return OHLCVArrays(
+        tickers=all_tickers,
+        index={ticker: i for i, ticker in enumerate(all_tickers)},
+        offsets=np.asarray(offsets, dtype=np.int64),
+        dates=dates,
+        **values,
+    )
@@ -24,7 +24,8 @@ from sklearn.cluster import DBSCAN
 from sqlalchemy.orm import Session
 
 from src.database.connection import get_db_context
-from src.database.models import StockProfile, WsDseDailyPrice
+from src.database.market_data import load_ohlcv
+from src.database.models import StockProfile
 
 logger = logging.getLogger(__name__)
 
@@ -103,39 +104,18 @@ class StockCalibrator:
         end_date = datetime.now().date()
         start_date = end_date - timedelta(days=self.lookback_days)
 
-        data = (
-            session.query(WsDseDailyPrice)
-            .filter(
-                WsDseDailyPrice.txn_scrip == ticker,
-                WsDseDailyPrice.txn_date >= start_date,
-                WsDseDailyPrice.txn_date <= end_date,
-            )
-            .order_by(WsDseDailyPrice.txn_date)
-            .all()
-        )
+        bars = load_ohlcv(session, ticker, start_date, end_date)
 
-        if len(data) < 100:
+        if len(bars) < 100:
             logger.warning(
-                f"Insufficient data for {ticker}: {len(data)} days " f"(minimum 100 required)"
+                f"Insufficient data for {ticker}: {len(bars)} days " f"(minimum 100 required)"
             )
             return None
 
-        logger.info(f"Loaded {len(data)} days of data for {ticker}")
+        logger.info(f"Loaded {len(bars)} days of data for {ticker}")
 
         # Convert to DataFrame for easier manipulation
-        df = pd.DataFrame(
-            [
-                {
-                    "date": row.txn_date,
-                    "open": float(row.txn_open),
-                    "high": float(row.txn_high),
-                    "low": float(row.txn_low),
-                    "close": float(row.txn_close),
-                    "volume": int(row.txn_volume),
-                }
-                for row in data
-            ]
-        )
+        df = bars.to_frame()
 
         # 3. Find reversals
         reversals = self._find_reversals(df["close"])
@@ -182,7 +162,7 @@ class StockCalibrator:
         profile.support_levels = sr_levels["support"]
         profile.resistance_levels = sr_levels["resistance"]
         profile.last_calibrated_at = datetime.utcnow()
-        profile.calibration_period_days = len(data)
+        profile.calibration_period_days = len(bars)
 
         session.commit()
 
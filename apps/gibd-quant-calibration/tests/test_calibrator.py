@@ -0,0 +1,63 @@
+"""End-to-end calibration of a synthetic ticker against an in-memory database."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+pytest.importorskip("scipy")
+pytest.importorskip("sklearn")
+
+from src.database.models import Base, StockProfile, WsDseDailyPrice  # noqa: E402
+from src.profiling.calibrator import StockCalibrator  # noqa: E402
+
+BARS = 250
+
+
+@pytest.fixture
+def session():
+    """SQLite session holding 250 oscillating daily bars for GP, ending today."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[WsDseDailyPrice.__table__, StockProfile.__table__])
+    session = sessionmaker(bind=engine)()
+
+    rng = np.random.default_rng(3)
+    close = 100 + 8 * np.sin(np.arange(BARS) * 2 * np.pi / 24) + rng.normal(0, 0.5, BARS)
+    today = date.today()
+    session.add_all(
+        WsDseDailyPrice(
+            txn_date=today - timedelta(days=BARS - 1 - i),
+            txn_scrip="GP",
+            txn_open=round(float(close[i]), 2),
+            txn_high=round(float(close[i]) * 1.01, 2),
+            txn_low=round(float(close[i]) * 0.99, 2),
+            txn_close=round(float(close[i]), 2),
+            txn_volume=10_000 + 100 * (i % 7),
+        )
+        for i in range(BARS)
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+def test_calibrate_stock_stores_profile(session):
+    """calibrate_stock() runs every step and upserts the stock profile."""
+    profile = StockCalibrator().calibrate_stock("GP", session)
+
+    assert profile is not None
+    stored = session.query(StockProfile).filter_by(ticker="GP").one()
+    assert stored.calibration_period_days == BARS
+    assert stored.last_calibrated_at is not None
+    assert 30 <= float(stored.rsi_oversold) <= 50
+    assert 50 <= float(stored.rsi_overbought) <= 80
+    assert stored.volatility_category in ("low", "medium", "high")
+    assert stored.typical_volume > 0
+
+
+def test_calibrate_stock_skips_short_history(session):
+    """Tickers with fewer than 100 bars are not calibrated."""
+    assert StockCalibrator(lookback_days=60).calibrate_stock("GP", session) is None
+    assert session.query(StockProfile).count() == 0
@@ -13,6 +13,7 @@ import logging
 from datetime import date, datetime, timedelta
 from typing import Any
 
+from celery.signals import worker_process_shutdown
 from sqlalchemy import distinct
 
 from src.backtesting.analyzer import BacktestAnalyzer
@@ -20,13 +21,21 @@ from src.backtesting.outcome_tracker import SignalOutcomeTracker
 from src.celery_app import app
 from src.database.connection import get_db_context
 from src.database.models import MarketRegime, WsDseDailyPrice
+from src.fast_track.index_context import get_index_context_service
 from src.fast_track.signal_engine import AdaptiveSignalEngine
+from src.fast_track.signal_sink import get_signal_sink
 from src.regime import MarketRegimeDetector
 from src.tasks.exit_checker import ExitSignalChecker
 
 logger = logging.getLogger(__name__)
 
 
+@worker_process_shutdown.connect
+def flush_signal_sink(**kwargs) -> None:
+    """Write buffered signal_history rows before a worker process exits."""
+    get_signal_sink().close()
+
+
 @app.task(bind=True, max_retries=3, default_retry_delay=300)
 def analyze_single_stock(self, ticker: str) -> dict[str, Any]:
     """Celery task for single stock analysis.
@@ -342,16 +351,10 @@ def track_market_regime(self) -> dict[str, Any]:
         logger.info("Starting market regime detection")
 
         with get_db_context() as session:
-            # Fetch DSEX index data (200+ days for SMA calculation)
-            dsex_data = (
-                session.query(WsDseDailyPrice)
-                .filter(WsDseDailyPrice.txn_scrip == "DSEX")
-                .order_by(WsDseDailyPrice.txn_date.desc())
-                .limit(250)
-                .all()
-            )
+            # DSEX index data (200+ days for SMA calculation) from the shared index context
+            index_df = get_index_context_service().get_history(session, limit=250)
 
-            if not dsex_data or len(dsex_data) < 200:
+            if len(index_df) < 200:
                 logger.warning("Insufficient DSEX data for regime detection")
                 return {
                     "status": "insufficient_data",
@@ -359,21 +362,6 @@ def track_market_regime(self) -> dict[str, Any]:
                     "confidence": 0.5,
                 }
 
-            # Convert to DataFrame (reverse for chronological order)
-            dsex_data.reverse()
-            import pandas as pd
-
-            index_df = pd.DataFrame(
-                {
-                    "date": [row.txn_date for row in dsex_data],
-                    "open": [float(row.txn_open) for row in dsex_data],
-                    "high": [float(row.txn_high) for row in dsex_data],
-                    "low": [float(row.txn_low) for row in dsex_data],
-                    "close": [float(row.txn_close) for row in dsex_data],
-                    "volume": [int(row.txn_volume) for row in dsex_data],
-                }
-            )
-
             # Detect regime
             detector = MarketRegimeDetector()
             regime = detector.detect_regime(index_df)
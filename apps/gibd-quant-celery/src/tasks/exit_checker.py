@@ -22,6 +22,7 @@ from sqlalchemy.orm import Session
 
 from src.database.connection import get_db_context
 from src.database.models import Indicator, SignalHistory, WsDseDailyPrice
+from src.fast_track.index_context import get_index_context_service
 from src.sectors.manager import SectorManager
 
 logger = logging.getLogger(__name__)
@@ -335,9 +336,8 @@ class ExitSignalChecker:
             True if index breakdown detected, False otherwise
         """
         try:
-            # In production, would fetch DSEX data and calculate SMA200
-            # For now, return False (requires index data source)
-            return False
+            snapshot = get_index_context_service().get_snapshot(date.today(), session)
+            return bool(snapshot and snapshot.breakdown)
 
         except Exception as e:
             logger.error(f"Error checking index breakdown: {str(e)}")
@@ -5,19 +5,31 @@ Provides trading signal generation using AdaptiveSignalEngine.
 Integrates with Eureka for service discovery.
 """
 
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
+import asyncio
+import heapq
+import json
+import logging
 import os
 import sys
+import threading
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from engine.signal_engine import AdaptiveSignalEngine
+from api.runtime import RuntimeOverloaded, SignalRuntime
 from database.connection import get_db_context
 
+logger = logging.getLogger(__name__)
+
+SCAN_CHUNK_SIZE = int(os.getenv("SIGNAL_SCAN_CHUNK_SIZE", "50"))
+DISCONNECT_POLL_SECONDS = 1.0
+
 # Eureka registration
 try:
     from py_eureka_client import eureka_client
@@ -31,10 +43,25 @@ try:
 except Exception as e:
     print(f"Warning: Eureka registration failed: {e}")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the application-scoped signal runtime and warm its caches"""
+    runtime = SignalRuntime(
+        max_workers=int(os.getenv("SIGNAL_MAX_WORKERS", "4")),
+        max_queued=int(os.getenv("SIGNAL_MAX_QUEUED", "16"))
+    )
+    await asyncio.to_thread(runtime.start)
+    app.state.runtime = runtime
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(runtime.shutdown)
+
 app = FastAPI(
     title="GIBD Quant Signal Service",
     description="Trading signal generation with adaptive thresholds",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -46,6 +73,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.exception_handler(RuntimeOverloaded)
+async def runtime_overloaded_handler(request: Request, exc: RuntimeOverloaded):
+    """Reject requests beyond the per-process concurrency limit"""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"}
+    )
+
 # Request/Response models
 class SignalRequest(BaseModel):
     ticker: str
@@ -69,11 +105,13 @@ async def health():
     return {"status": "UP", "service": "gibd-quant-signal"}
 
 @app.post("/api/v1/signals/generate", response_model=SignalResponse)
-async def generate_signal(request: SignalRequest):
+async def generate_signal(request: SignalRequest, http_request: Request):
     """Generate trading signal for a ticker"""
+    runtime = http_request.app.state.runtime
     try:
-        engine = AdaptiveSignalEngine()
-        signal = engine.generate_signal(request.ticker, request.date)
+        signal = await runtime.run(
+            runtime.engine.generate_signal, request.ticker, request.date
+        )
 
         return SignalResponse(
             ticker=signal.ticker,
@@ -87,74 +125,169 @@ async def generate_signal(request: SignalRequest):
             volume_score=signal.volume_score,
             sector_score=signal.sector_score
         )
+    except RuntimeOverloaded:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _batch_signals(engine, tickers: list[str]) -> list[dict]:
+    """Generate minimal signals for tickers (runs on a runtime worker)"""
+    results = []
+
+    for ticker in tickers:
+        try:
+            signal = engine.generate_signal(ticker, detail="minimal")
+            results.append({
+                "ticker": signal.ticker,
+                "signal_type": signal.signal_type,
+                "total_score": signal.total_score,
+                "confidence": signal.confidence
+            })
+        except Exception as e:
+            results.append({
+                "ticker": ticker,
+                "error": str(e)
+            })
+
+    return results
+
 @app.post("/api/v1/signals/batch")
-async def generate_batch_signals(tickers: list[str]):
+async def generate_batch_signals(tickers: list[str], request: Request):
     """Generate signals for multiple tickers"""
+    runtime = request.app.state.runtime
     try:
-        engine = AdaptiveSignalEngine()
-        results = []
+        results = await runtime.run(_batch_signals, runtime.engine, tickers)
+        return {"results": results}
+    except RuntimeOverloaded:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+def _scan_universe() -> list[str]:
+    """Get every ticker with calculated indicators"""
+    with get_db_context() as session:
+        from database.models import Indicator
+        tickers = (
+            session.query(Indicator.scrip)
+            .filter(Indicator.status == "CALCULATED")
+            .distinct()
+            .all()
+        )
+    return sorted(t[0] for t in tickers)
+
+class TopSignals:
+    """Bounded min-heap keeping the `limit` strongest scan hits by |total_score|"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.scanned = 0
+        self._heap = []
+
+    def offer(self, item: dict) -> None:
+        if self.limit <= 0:
+            return
+        entry = (abs(item["total_score"]), item["ticker"], item)
+        if len(self._heap) < self.limit:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
 
-        for ticker in tickers:
-            try:
-                signal = engine.generate_signal(ticker)
-                results.append({
+    def results(self) -> list[dict]:
+        return [entry[2] for entry in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+def _scan_signals(engine, signal_type: str, top: TopSignals, emit=None, cancelled=None) -> None:
+    """Scan the full universe with the bulk engine (runs on a runtime worker)
+
+    Hits are kept in `top` and, when `emit` is given, passed to it as soon as
+    their chunk has been scored.
+    """
+    if cancelled is not None and cancelled.is_set():
+        logger.info("Scan cancelled before it started")
+        return
+    tickers = _scan_universe()
+    chunks = engine.iter_signals_bulk(tickers, detail="minimal", chunk_size=SCAN_CHUNK_SIZE)
+    for i, signals in enumerate(chunks, start=1):
+        top.scanned = min(i * SCAN_CHUNK_SIZE, len(tickers))
+        for signal in signals.values():
+            if signal_type == "all" or signal.signal_type == signal_type:
+                item = {
                     "ticker": signal.ticker,
                     "signal_type": signal.signal_type,
                     "total_score": signal.total_score,
                     "confidence": signal.confidence
-                })
-            except Exception as e:
-                results.append({
-                    "ticker": ticker,
-                    "error": str(e)
-                })
-
-        return {"results": results}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+                }
+                top.offer(item)
+                if emit is not None:
+                    emit(item)
+        if cancelled is not None and cancelled.is_set():
+            logger.info(f"Scan cancelled after {top.scanned}/{len(tickers)} tickers")
+            return
 
 @app.get("/api/v1/signals/scan")
 async def scan_signals(
+    request: Request,
     signal_type: str = "BUY",
     threshold: float = 0.4,
-    limit: int = 50
+    limit: int = 50,
+    stream: bool = False
 ):
-    """Scan all stocks for signals"""
-    try:
-        engine = AdaptiveSignalEngine(
-            buy_threshold=threshold if signal_type == "BUY" else 0.4,
-            sell_threshold=-threshold if signal_type == "SELL" else -0.4
-        )
+    """Scan all stocks for signals
+
+    Returns the `limit` strongest hits. With stream=true the response is
+    NDJSON: one {"type": "signal"} line per hit as it is found, then a
+    {"type": "summary"} line with the top results.
+    """
+    runtime = request.app.state.runtime
+    engine = runtime.engine_for(
+        buy_threshold=threshold if signal_type == "BUY" else 0.4,
+        sell_threshold=-threshold if signal_type == "SELL" else -0.4
+    )
+    top = TopSignals(limit)
 
-        # Get all active tickers from database
-        with get_db_context() as session:
-            from database.models import Indicator
-            tickers = session.query(Indicator.ticker).distinct().all()
-            tickers = [t[0] for t in tickers]
-
-        results = []
-        for ticker in tickers[:limit]:  # Limit for performance
-            try:
-                signal = engine.generate_signal(ticker)
-                if signal_type == "all" or signal.signal_type == signal_type:
-                    results.append({
-                        "ticker": signal.ticker,
-                        "signal_type": signal.signal_type,
-                        "total_score": signal.total_score,
-                        "confidence": signal.confidence
-                    })
-            except:
-                continue
-
-        # Sort by score
-        results.sort(key=lambda x: abs(x["total_score"]), reverse=True)
-        return {"results": results[:limit]}
+    if not stream:
+        try:
+            await runtime.run(_scan_signals, engine, signal_type, top)
+        except RuntimeOverloaded:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        return {"results": top.results(), "scanned": top.scanned}
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    cancelled = threading.Event()
+
+    def emit(item: dict) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, item)
+
+    # Admission happens here, before the streaming response starts
+    scan = runtime.submit(_scan_signals, engine, signal_type, top, emit, cancelled)
+    scan.add_done_callback(lambda _: queue.put_nowait(None))
+
+    async def watch_disconnect():
+        # The generator's finally never runs if the client leaves before
+        # streaming starts, so stop the admitted scan from here as well
+        while not scan.done():
+            if await request.is_disconnected():
+                cancelled.set()
+                return
+            await asyncio.sleep(DISCONNECT_POLL_SECONDS)
+
+    watcher = asyncio.create_task(watch_disconnect())
+
+    async def lines():
+        try:
+            while (item := await queue.get()) is not None:
+                yield json.dumps({"type": "signal", **item}) + "\n"
+            summary = {"type": "summary", "results": top.results(), "scanned": top.scanned}
+            if not scan.cancelled() and scan.exception() is not None:
+                summary["error"] = str(scan.exception())
+            yield json.dumps(summary) + "\n"
+        finally:
+            cancelled.set()
+            watcher.cancel()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 if __name__ == "__main__":
     import uvicorn
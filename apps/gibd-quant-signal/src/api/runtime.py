@@ -0,0 +1,203 @@
+"""Application-scoped signal runtime for the FastAPI service.
+
+SignalRuntime owns a long-lived AdaptiveSignalEngine whose caches (sector
+map, stock profiles, index context, peer state) are warmed once at startup,
+and a bounded worker pool that runs the engine's blocking SQLAlchemy work off
+the event loop. Admission is limited per process: at most max_workers calls
+run and max_queued wait; further calls are rejected with RuntimeOverloaded
+(served as HTTP 429) instead of stalling every in-flight request.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any
+
+from database.connection import get_db_context
+from engine.signal_engine import AdaptiveSignalEngine
+
+logger = logging.getLogger(__name__)
+
+
+class RuntimeOverloaded(Exception):
+    """Raised when the runtime's worker pool and queue are full."""
+
+
+class SignalRuntime:
+    """Warm signal engine plus a bounded executor for blocking engine calls.
+
+    Example:
+        runtime = SignalRuntime(max_workers=4, max_queued=16)
+        runtime.start()
+        signal = await runtime.run(runtime.engine.generate_signal, 'GP')
+        runtime.shutdown()
+    """
+
+    DEFAULT_MAX_WORKERS = 4
+    DEFAULT_MAX_QUEUED = 16
+    DEFAULT_MAX_ENGINES = 16
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+        max_engines: int = DEFAULT_MAX_ENGINES,
+    ):
+        """Initialize signal runtime.
+
+        Args:
+            max_workers: Worker threads running engine calls concurrently
+            max_queued: Calls allowed to wait for a worker before new calls
+                are rejected
+            max_engines: Custom-threshold engines kept by engine_for() (least
+                recently used are evicted)
+        """
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.max_engines = max_engines
+
+        self.engine: AdaptiveSignalEngine | None = None
+        # Custom-threshold engines, least recently used first
+        self._engines: OrderedDict[tuple[float, float], AdaptiveSignalEngine] = OrderedDict()
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight = 0
+        self._rejected = 0
+
+    def start(self) -> None:
+        """Create the engine and worker pool and warm the engine caches."""
+        start = time.time()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="signal-worker"
+        )
+        self.engine = AdaptiveSignalEngine()
+
+        try:
+            self.engine.sector_manager.get_all_sectors()
+            with get_db_context() as session:
+                self.engine.profile_cache.get_many([], session)
+                self.engine.index_context.refresh(session)
+        except Exception as e:
+            # Caches fill lazily on first use if warming fails
+            logger.error(f"Signal runtime cache warm-up failed: {e}")
+
+        logger.info(
+            f"Signal runtime started in {time.time() - start:.1f}s "
+            f"(workers={self.max_workers}, queue={self.max_queued})"
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker pool and flush buffered signal_history rows."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self.engine is not None:
+            self.engine.signal_sink.close()
+        logger.info("Signal runtime stopped")
+
+    def engine_for(
+        self, buy_threshold: float | None = None, sell_threshold: float | None = None
+    ) -> AdaptiveSignalEngine:
+        """Get an engine with custom signal thresholds.
+
+        Engines share the warm sector map and peer state of the default
+        engine; profiles, index context and the signal sink are process-wide.
+        At most max_engines custom-threshold engines are kept.
+
+        Args:
+            buy_threshold: Score threshold for BUY signals (default engine's if None)
+            sell_threshold: Score threshold for SELL signals (default engine's if None)
+
+        Returns:
+            AdaptiveSignalEngine
+        """
+        key = (
+            buy_threshold if buy_threshold is not None else self.engine.buy_threshold,
+            sell_threshold if sell_threshold is not None else self.engine.sell_threshold,
+        )
+        if key == (self.engine.buy_threshold, self.engine.sell_threshold):
+            return self.engine
+
+        engine = self._engines.get(key)
+        if engine is not None:
+            self._engines.move_to_end(key)
+            return engine
+
+        engine = AdaptiveSignalEngine(
+            buy_threshold=key[0],
+            sell_threshold=key[1],
+            sector_manager=self.engine.sector_manager,
+        )
+        engine.peer_states = self.engine.peer_states
+        self._engines[key] = engine
+        while len(self._engines) > self.max_engines:
+            self._engines.popitem(last=False)
+        return engine
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking call on the worker pool.
+
+        Args:
+            func: Blocking callable (e.g. engine.generate_signal)
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The callable's return value
+
+        Raises:
+            RuntimeOverloaded: If max_workers calls are running and max_queued
+                are already waiting
+        """
+        return await self.submit(func, *args, **kwargs)
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> asyncio.Future:
+        """Admit a blocking call and schedule it on the worker pool.
+
+        Admission is decided immediately, so callers can reject a request
+        before starting a (streaming) response. Must be called on the event loop.
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Future resolving to the callable's return value
+
+        Raises:
+            RuntimeOverloaded: If max_workers calls are running and max_queued
+                are already waiting
+        """
+        if self._executor is None:
+            raise RuntimeError("Signal runtime is not started")
+
+        # Counter is only touched on the event loop thread
+        if self._in_flight >= self.max_workers + self.max_queued:
+            self._rejected += 1
+            raise RuntimeOverloaded(
+                f"{self._in_flight} signal requests in flight "
+                f"(limit {self.max_workers + self.max_queued})"
+            )
+
+        self._in_flight += 1
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future: asyncio.Future) -> None:
+        """Free an admission slot when a call finishes."""
+        self._in_flight -= 1
+
+    def get_stats(self) -> dict[str, int]:
+        """Get admission counters."""
+        return {
+            "in_flight": self._in_flight,
+            "rejected": self._rejected,
+            "max_workers": self.max_workers,
+            "max_queued": self.max_queued,
+        }
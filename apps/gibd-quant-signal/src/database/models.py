@@ -5,6 +5,7 @@ Models:
 - Indicator: Read-only model for GIBD's indicators table (COMPUTED INDICATORS)
 - StockProfile: Stock-specific calibration data (ticker-based)
 - SignalHistory: Generated trading signals with outcomes (ticker-based)
+- SignalComponentScore: Weight-independent component scores per signal (ticker-based)
 - MarketRegime: Daily market regime classification
 """
 
@@ -14,6 +15,7 @@ from sqlalchemy import (
     Column,
     Date,
     DateTime,
+    Float,
     Index,
     Integer,
     Numeric,
@@ -183,6 +185,42 @@ class SignalHistory(Base):
         return f"<SignalHistory(ticker='{self.ticker}', date={self.signal_date}, type='{self.signal_type}')>"
 
 
+class SignalComponentScore(Base):
+    """Weight-independent component scores of a generated signal.
+
+    One row per ticker and signal date. Total scores for any weight vector are
+    a dot product with these columns, so candidate weights can be evaluated
+    against history without regenerating signals.
+    """
+
+    __tablename__ = "signal_component_scores"
+    __table_args__ = (
+        UniqueConstraint("ticker", "signal_date", name="uq_component_scores_ticker_date"),
+        Index("idx_component_scores_date", "signal_date"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    ticker = Column(Text, nullable=False)
+    signal_date = Column(Date, nullable=False)
+
+    # Component scores (-1.0 to +1.0)
+    momentum = Column(Float, nullable=False)
+    trend = Column(Float, nullable=False)
+    volume = Column(Float, nullable=False)
+    volatility = Column(Float, nullable=False)
+    sector = Column(Float, nullable=False)
+    support_resistance = Column(Float, nullable=False)
+    timeframe_alignment = Column(Float, nullable=False)
+
+    entry_price = Column(Numeric(12, 2), nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<SignalComponentScore(ticker='{self.ticker}', date={self.signal_date})>"
+
+
 class Company(Base):
     """DSE company information including sector classification.
 
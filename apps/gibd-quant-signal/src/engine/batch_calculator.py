@@ -12,6 +12,7 @@ from typing import Any
 
 import pandas as pd
 
+from src.engine.calculators import IndicatorResults
 from src.fast_track.indicator_pipeline import IndicatorPipeline
 
 logger = logging.getLogger(__name__)
@@ -24,7 +25,8 @@ class BatchCalculatorResults:
         successful: Number of successful calculations
         failed: Number of failed calculations
         total: Total number of calculations attempted
-        results: Dictionary mapping ticker to result dict
+        results: Dictionary mapping ticker to result dict (indicator series
+            are IndicatorResults arrays; see to_json_dict())
         errors: Dictionary mapping ticker to error message
     """
 
@@ -58,6 +60,23 @@ class BatchCalculatorResults:
         self.total += 1
         self.errors[ticker] = error
 
+    def to_json_dict(self, tail: int | None = None) -> dict[str, dict[str, Any]]:
+        """Get results with indicator series converted to JSON-safe lists.
+
+        Args:
+            tail: Only convert the last `tail` values of each series (None converts all)
+
+        Returns:
+            Dictionary mapping ticker to result dict
+        """
+        converted = {}
+        for ticker, result in self.results.items():
+            indicators = result.get("indicators")
+            if isinstance(indicators, IndicatorResults):
+                result = {**result, "indicators": indicators.to_json_dict(tail)}
+            converted[ticker] = result
+        return converted
+
     def get_summary(self) -> dict[str, Any]:
         """Get summary statistics.
 
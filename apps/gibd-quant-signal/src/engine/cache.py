@@ -0,0 +1,224 @@
+"""Two-tier result cache: in-process LRU with an optional Redis tier.
+
+TieredCache keeps recently used values in a bounded, thread-safe LRU and, when
+a Redis URL is configured and the redis package is installed, shares them
+across processes through Redis (pickled, with a TTL). Callers put everything
+that determines a value, including a data version, into the key, so stale
+entries are never read and simply age out. The in-process tier can also
+expire entries after a TTL and bound its memory by pickled size.
+
+Example:
+    cache = TieredCache(namespace="signal", redis_url=os.getenv("SIGNAL_CACHE_REDIS_URL"))
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        cache.set(key, value)
+"""
+
+import hashlib
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+try:
+    import redis
+except ImportError:  # Optional dependency: Redis tier disabled without it
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+
+def stable_hash(value: Any) -> str:
+    """Short hash of a value's repr, stable across processes.
+
+    Args:
+        value: Value with a deterministic repr (sort dict items first)
+
+    Returns:
+        16-character hex digest
+    """
+    return hashlib.sha1(repr(value).encode()).hexdigest()[:16]
+
+
+class TieredCache:
+    """Thread-safe LRU cache with an optional Redis second tier.
+
+    Attributes:
+        namespace: Prefix for Redis keys
+        max_entries: Maximum number of entries kept in process
+        redis_ttl_seconds: Expiry of Redis entries
+        ttl_seconds: Expiry of in-process entries (None: no expiry)
+        max_bytes: Bound on the pickled size of in-process entries (None: no bound)
+    """
+
+    DEFAULT_MAX_ENTRIES = 4096
+    DEFAULT_REDIS_TTL_SECONDS = 86400
+
+    def __init__(
+        self,
+        namespace: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        redis_url: str | None = None,
+        redis_ttl_seconds: int = DEFAULT_REDIS_TTL_SECONDS,
+        ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
+    ):
+        """Initialize tiered cache.
+
+        Args:
+            namespace: Prefix for Redis keys
+            max_entries: Maximum number of entries kept in process
+            redis_url: Redis URL for the shared tier (None for in-process only)
+            redis_ttl_seconds: Expiry of Redis entries
+            ttl_seconds: Expiry of in-process entries (None: no expiry)
+            max_bytes: Bound on the pickled size of in-process entries; least
+                recently used entries are evicted beyond it (None: no bound)
+        """
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+        # key -> (value, expiry as time.monotonic() or None, pickled size)
+        self._entries: OrderedDict[Hashable, tuple[Any, float | None, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+        self._redis = None
+        if redis_url:
+            if redis is None:
+                logger.warning(f"redis package not installed, {namespace} cache is in-process only")
+            else:
+                self._redis = redis.Redis.from_url(redis_url)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a cached value (None on a miss).
+
+        Args:
+            key: Hashable key with a deterministic repr
+
+        Returns:
+            Cached value, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] is None or entry[1] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return entry[0]
+                self._remove(key)
+                self._stats["expirations"] += 1
+
+        value, size = self._redis_get(key)
+        with self._lock:
+            if value is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["redis_hits"] += 1
+            self._store(key, value, size)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value in both tiers.
+
+        Args:
+            key: Hashable key with a deterministic repr
+            value: Picklable value (None is not cached)
+        """
+        if value is None:
+            return
+        payload = None
+        if self.max_bytes is not None or self._redis is not None:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._store(key, value, len(payload) if payload is not None else 0)
+            self._stats["sets"] += 1
+        if payload is not None:
+            self._redis_set(key, payload)
+
+    def clear(self) -> None:
+        """Drop all in-process entries (Redis entries expire on their own)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> dict:
+        """Get cache counters, size, memory and hit rate."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+            stats["bytes"] = self._bytes
+        stats["max_bytes"] = self.max_bytes
+        stats["redis_enabled"] = self._redis is not None
+        lookups = stats["hits"] + stats["redis_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["redis_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def _store(self, key: Hashable, value: Any, size: int = 0) -> None:
+        """Insert into the LRU and evict beyond the bounds (caller holds the lock)."""
+        if self.max_bytes is not None and size > self.max_bytes:
+            return  # Larger than the whole tier
+        self._remove(key)
+        expires = time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else None
+        self._entries[key] = (value, expires, size)
+        self._bytes += size
+
+        # Expired entries at the LRU end go first
+        now = time.monotonic()
+        while self._entries:
+            oldest_key, (_, oldest_expires, _) = next(iter(self._entries.items()))
+            if oldest_expires is None or oldest_expires > now:
+                break
+            self._remove(oldest_key)
+            self._stats["expirations"] += 1
+
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self._stats["evictions"] += 1
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop one entry if present (caller holds the lock)."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def _redis_key(self, key: Hashable) -> str:
+        return f"{self.namespace}:{stable_hash(key)}"
+
+    def _redis_get(self, key: Hashable) -> tuple[Any | None, int]:
+        """Get (value, pickled size) from Redis ((None, 0) on a miss)."""
+        if self._redis is None:
+            return None, 0
+        try:
+            payload = self._redis.get(self._redis_key(key))
+            if payload is None:
+                return None, 0
+            return pickle.loads(payload), len(payload)
+        except Exception as e:
+            logger.warning(f"Redis get failed for {self.namespace} cache: {e}")
+            return None, 0
+
+    def _redis_set(self, key: Hashable, payload: bytes) -> None:
+        if self._redis is None:
+            return
+        try:
+            self._redis.set(self._redis_key(key), payload, ex=self.redis_ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Redis set failed for {self.namespace} cache: {e}")
@@ -5,6 +5,12 @@ and multi-timeframe analysis.
 """
 
 from .indicator_calculator import IndicatorCalculator
+from .indicator_results import IndicatorResults
 from .multi_timeframe import InsufficientDataError, MultiTimeframeCalculator
 
-__all__ = ["IndicatorCalculator", "MultiTimeframeCalculator", "InsufficientDataError"]
+__all__ = [
+    "IndicatorCalculator",
+    "IndicatorResults",
+    "MultiTimeframeCalculator",
+    "InsufficientDataError",
+]
@@ -0,0 +1,149 @@
+"""Array-native indicator results.
+
+IndicatorResults is the mapping returned by IndicatorCalculator.calculate_all:
+indicator name -> NumPy array aligned with the input bars (oldest first). The
+arrays produced by the indicator graph are held as-is, with no per-value
+Python floats. Most consumers (trend detection, scoring, NLQ) only read the
+latest 5-50 values, so a result can be cut to its last `tail` bars; the
+suffix is copied so the full-length arrays can be freed. Pickling (result
+cache, process pools) writes all indicators as one float64 block.
+
+Lists and JSON-safe values are built only on request, at the API boundary.
+
+Example:
+    results = calculator.calculate_all(data, "GP", tail=50)
+    results["rsi"]  # np.ndarray with the last 50 RSI values
+    results.last("rsi")  # float or None
+    payload = results.to_json_dict(tail=5)  # {name: [float | None, ...]}
+"""
+
+from collections.abc import Iterator, Mapping
+
+import numpy as np
+
+
+class IndicatorResults(Mapping):
+    """Read-only mapping from indicator name to a NumPy array.
+
+    All arrays cover the same bars: the last `len(array)` of the `bars`
+    input bars.
+
+    Attributes:
+        bars: Number of input bars the indicators were calculated over
+    """
+
+    __slots__ = ("bars", "_arrays")
+
+    def __init__(self, arrays: dict[str, np.ndarray], bars: int):
+        """Wrap indicator arrays without copying them.
+
+        Args:
+            arrays: Indicator name -> array (all of the same length)
+            bars: Number of input bars the indicators were calculated over
+        """
+        self.bars = bars
+        self._arrays = arrays
+
+    @classmethod
+    def from_arrays(
+        cls, arrays: dict[str, np.ndarray], bars: int, tail: int | None = None
+    ) -> "IndicatorResults":
+        """Build results, keeping only the last `tail` bars if given.
+
+        Args:
+            arrays: Indicator name -> full-length array
+            bars: Number of input bars
+            tail: Bars to keep per indicator (None keeps all, zero-copy)
+
+        Raises:
+            ValueError: If tail is less than 1
+        """
+        results = cls(arrays, bars)
+        return results if tail is None else results.tail(tail)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._arrays[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._arrays)
+
+    def __len__(self) -> int:
+        return len(self._arrays)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._arrays
+
+    @property
+    def length(self) -> int:
+        """Number of bars held per indicator."""
+        return len(next(iter(self._arrays.values()))) if self._arrays else 0
+
+    def tail(self, count: int) -> "IndicatorResults":
+        """Results holding only the last `count` bars (the suffixes are copied).
+
+        Raises:
+            ValueError: If count is less than 1
+        """
+        if count < 1:
+            raise ValueError(f"tail must be >= 1, got {count}")
+        if count >= self.length:
+            return self
+        return IndicatorResults(
+            {name: array[-count:].copy() for name, array in self._arrays.items()}, self.bars
+        )
+
+    def last(self, name: str, default: float | None = None) -> float | None:
+        """Latest value of an indicator (default if missing or empty; NaN is returned as is)."""
+        array = self._arrays.get(name)
+        if array is None or len(array) == 0:
+            return default
+        return array[-1].item()
+
+    def to_dict(self, tail: int | None = None) -> dict[str, list]:
+        """Indicator name -> list of Python numbers (NaN kept), as calculate_all used to return.
+
+        Args:
+            tail: Only convert the last `tail` values (None converts all)
+        """
+        start = -tail if tail else None
+        return {name: array[start:].tolist() for name, array in self._arrays.items()}
+
+    def to_json_dict(self, tail: int | None = None) -> dict[str, list]:
+        """Like to_dict(), with NaN and infinities replaced by None (JSON-safe).
+
+        Args:
+            tail: Only convert the last `tail` values (None converts all)
+        """
+        start = -tail if tail else None
+        payload = {}
+        for name, array in self._arrays.items():
+            values = array[start:]
+            if values.dtype.kind == "f" and not np.isfinite(values).all():
+                values = np.where(np.isfinite(values), values, None)
+            payload[name] = values.tolist()
+        return payload
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the indicator arrays in bytes."""
+        return sum(array.nbytes for array in self._arrays.values())
+
+    def __getstate__(self) -> tuple:
+        # One float64 block instead of one pickled array per indicator
+        arrays = list(self._arrays.values())
+        dtypes = "".join(array.dtype.char for array in arrays)
+        block = np.array(arrays, dtype=np.float64) if arrays else np.empty((0, 0))
+        return self.bars, tuple(self._arrays), dtypes, block
+
+    def __setstate__(self, state: tuple) -> None:
+        self.bars, names, dtypes, block = state
+        self._arrays = {
+            name: row.astype(dtype, copy=False)
+            for name, dtype, row in zip(names, dtypes, block, strict=True)
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"IndicatorResults(indicators={len(self._arrays)}, length={self.length}, "
+            f"bars={self.bars})"
+        )
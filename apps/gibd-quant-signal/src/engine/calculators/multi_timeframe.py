@@ -2,14 +2,18 @@
 
 This module provides the MultiTimeframeCalculator class for calculating indicators
 across multiple timeframes (5d, 20d, 50d, 200d) to identify aligned signals
-and cross-timeframe patterns.
+and cross-timeframe patterns. All timeframe statistics come from one pass of
+the multi-window engine in src.engine.multi_window.
 """
 
 import logging
+from collections.abc import Sequence
 
 import numpy as np
 import pandas as pd
-import talib
+
+from src.engine.indicator_graph import ohlcv_sources
+from src.engine.multi_window import MultiWindowStats, multi_window_stats, rolling_means
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +29,8 @@ class MultiTimeframeCalculator:
 
     This calculator computes indicators for 5-day, 20-day, 50-day, and 200-day
     timeframes to enable multi-timeframe analysis for trend confirmation and
-    signal alignment detection.
+    signal alignment detection. For a (tickers x bars) panel, call
+    src.engine.multi_window.multi_window_stats() directly.
 
     Attributes:
         TIMEFRAMES: List of timeframe periods in days (5, 20, 50, 200).
@@ -80,13 +85,20 @@ class MultiTimeframeCalculator:
             f"[{ticker}] Starting multi-timeframe calculation with {len(data)} periods"
         )
 
+        # Every timeframe's RSI, mean close and mean volume in one pass
+        sources = ohlcv_sources(data, ("close", "volume"))
+        stats = multi_window_stats(
+            sources["close"], sources["volume"], windows=tuple(self.TIMEFRAMES)
+        )
+        dates = data["date"].array
+
         results = {}
         for timeframe in self.TIMEFRAMES:
             try:
                 tf_key = f"{timeframe}d"
                 self.logger.debug(f"[{ticker}] Calculating {tf_key} timeframe")
 
-                tf_result = self._calc_timeframe(data, timeframe, ticker)
+                tf_result = self._calc_timeframe(dates, timeframe, ticker, stats)
                 results[tf_key] = tf_result
 
                 self.logger.debug(f"[{ticker}] {tf_key} calculation complete: {tf_result}")
@@ -104,15 +116,19 @@ class MultiTimeframeCalculator:
 
         return results
 
-    def _calc_timeframe(self, data: pd.DataFrame, timeframe: int, ticker: str) -> dict:
-        """Calculate indicators for a specific timeframe.
+    def _calc_timeframe(
+        self, dates: Sequence, timeframe: int, ticker: str, stats: MultiWindowStats
+    ) -> dict:
+        """Build the result for a specific timeframe.
 
-        Calculates RSI for the given timeframe along with basic availability info.
+        Reports the timeframe RSI, mean close and mean volume (from the
+        multi-window pass in calculate()) along with basic availability info.
 
         Args:
-            data: Full DataFrame with OHLCV data.
+            dates: Bar dates of the full data, oldest first.
             timeframe: Number of days for this timeframe window.
             ticker: Stock ticker symbol for logging.
+            stats: multi_window_stats() result for the data
 
         Returns:
             Dictionary with timeframe calculation results:
@@ -122,41 +138,38 @@ class MultiTimeframeCalculator:
                 'available': bool,
                 'start_date': str,
                 'end_date': str,
-                'rsi': float or None  # Only if RSI calculation succeeds
+                'rsi': float or None,  # None if the RSI is undefined (NaN bars)
+                'sma': float or None,  # Mean close over the window
+                'avg_volume': float or None  # Mean volume over the window
             }
 
         Raises:
             InsufficientDataError: If not enough data for this timeframe.
         """
-        if len(data) < timeframe:
+        if len(dates) < timeframe:
             raise InsufficientDataError(
-                f"[{ticker}] Insufficient data for {timeframe}d: " f"{len(data)} periods available"
+                f"[{ticker}] Insufficient data for {timeframe}d: " f"{len(dates)} periods available"
             )
 
-        # Get the window of data for this timeframe
-        window_data = data.tail(timeframe)
-
         result = {
             "timeframe": timeframe,
-            "data_points": len(window_data),
+            "data_points": timeframe,
             "available": True,
-            "start_date": str(window_data.iloc[0]["date"]),
-            "end_date": str(window_data.iloc[-1]["date"]),
+            "start_date": str(dates[-timeframe]),
+            "end_date": str(dates[-1]),
         }
 
-        # Calculate RSI for this timeframe if method exists
-        rsi_method_name = f"_calc_rsi_{timeframe}d"
-        if hasattr(self, rsi_method_name):
-            try:
-                rsi_method = getattr(self, rsi_method_name)
-                rsi_value = rsi_method(data, ticker)
-                result["rsi"] = rsi_value
-                self.logger.debug(f"[{ticker}] {timeframe}d timeframe RSI: {rsi_value}")
-            except Exception as e:
-                self.logger.warning(
-                    f"[{ticker}] Could not calculate RSI for {timeframe}d: {str(e)}"
-                )
-                result["rsi"] = None
+        rsi_value = float(stats.rsi[timeframe][0])
+        if np.isnan(rsi_value):
+            self.logger.warning(f"[{ticker}] Could not calculate RSI for {timeframe}d")
+            rsi_value = None
+        else:
+            self.logger.debug(f"[{ticker}] {timeframe}d timeframe RSI: {rsi_value}")
+        result["rsi"] = rsi_value
+
+        for key, values in (("sma", stats.sma), ("avg_volume", stats.avg_volume)):
+            value = float(values[timeframe][0])
+            result[key] = None if np.isnan(value) else value
 
         return result
 
@@ -185,10 +198,20 @@ class MultiTimeframeCalculator:
         """
         self.logger.debug(f"[{ticker}] Calculating all SMAs")
 
+        periods = {"sma_20": 20, "sma_50": 50, "sma_200": 200}
+        for name, period in periods.items():
+            if len(data) < period:
+                self.logger.warning(
+                    f"[{ticker}] Insufficient data for SMA {period}: "
+                    f"{len(data)} periods available"
+                )
+        available = [period for period in periods.values() if len(data) >= period]
+
+        # One prefix sum over the close array serves every period
+        means = rolling_means(ohlcv_sources(data, ("close",))["close"], available)
         return {
-            "sma_20": self._calc_sma_20(data, ticker),
-            "sma_50": self._calc_sma_50(data, ticker),
-            "sma_200": self._calc_sma_200(data, ticker),
+            name: means[period][0] if period in means else None
+            for name, period in periods.items()
         }
 
     def check_alignment(self, indicators: dict) -> str:
@@ -286,33 +309,32 @@ class MultiTimeframeCalculator:
             }
 
         try:
-            volumes = data["volume"].values.astype(np.float64)
+            stats = multi_window_stats(volume=ohlcv_sources(data, ("volume",))["volume"])
 
-            # Calculate average volumes for each timeframe
-            avg_volume_5d = float(np.mean(volumes[-5:])) if len(volumes) >= 5 else 0
-            avg_volume_20d = float(np.mean(volumes[-20:])) if len(volumes) >= 20 else 0
-            avg_volume_50d = float(np.mean(volumes[-50:])) if len(volumes) >= 50 else 0
-            avg_volume_200d = float(np.mean(volumes[-200:])) if len(volumes) >= 200 else 0
+            # Average volumes for each timeframe (0 when the window is not covered)
+            averages = {
+                window: float(stats.avg_volume[window][0]) if stats.available(window)[0] else 0
+                for window in stats.windows
+            }
+            avg_volume_5d = averages[5]
+            avg_volume_20d = averages[20]
+            avg_volume_50d = averages[50]
+            avg_volume_200d = averages[200]
 
             # Current and recent average volumes
-            current_volume = float(volumes[-1])
-            recent_avg = float(np.mean(volumes[-20:]))
-
-            # Detect volume trend using linear regression on last 20 periods
-            if len(volumes) >= 20:
-                volume_20 = volumes[-20:]
-                x = np.arange(len(volume_20))
-                slope = np.polyfit(x, volume_20, 1)[0]
-                volume_change_rate = slope / recent_avg if recent_avg > 0 else 0
-
-                if volume_change_rate > 0.05:
-                    trend = "increasing"
-                elif volume_change_rate < -0.05:
-                    trend = "decreasing"
-                else:
-                    trend = "stable"
+            current_volume = float(stats.current_volume[0])
+            recent_avg = avg_volume_20d
+
+            # Volume trend from the least-squares slope over the last 20 periods
+            slope = float(stats.volume_slope[0])
+            volume_change_rate = slope / recent_avg if recent_avg > 0 else 0
+
+            if volume_change_rate > 0.05:
+                trend = "increasing"
+            elif volume_change_rate < -0.05:
+                trend = "decreasing"
             else:
-                trend = "unknown"
+                trend = "stable"
 
             # Detect volume spikes (current > 3x average)
             spike_threshold = recent_avg * 3.0 if recent_avg > 0 else 0
@@ -380,201 +402,3 @@ class MultiTimeframeCalculator:
                 )
 
         return availability
-
-    def _calc_rsi_5d(self, data: pd.DataFrame, ticker: str) -> float | None:
-        """Calculate RSI for 5-day timeframe.
-
-        Args:
-            data: Full DataFrame with OHLCV data.
-            ticker: Stock ticker symbol for logging.
-
-        Returns:
-            Latest RSI value (0-100) or None if insufficient data.
-
-        Raises:
-            InsufficientDataError: If less than 5 periods available.
-        """
-        if len(data) < 5:
-            raise InsufficientDataError(
-                f"[{ticker}] Insufficient data for 5d RSI: {len(data)} periods available"
-            )
-
-        # Get the last 5 days of close prices
-        window_close = data["close"].tail(5).values.astype(np.float64)
-
-        try:
-            # TA-Lib requires at least period+1 data points for RSI
-            # For RSI with period 14, we need at least 15 points
-            # For 5-day window, calculate RSI with period 2
-            # (minimum meaningful for 5 days)
-            if len(window_close) >= 3:
-                rsi_values = talib.RSI(window_close, timeperiod=2)
-                latest_rsi = float(rsi_values[-1])
-
-                self.logger.debug(f"[{ticker}] 5d RSI calculated: {latest_rsi:.2f}")
-                return latest_rsi
-            else:
-                self.logger.warning(f"[{ticker}] Insufficient data for 5d RSI calculation")
-                return None
-        except Exception as e:
-            self.logger.error(f"[{ticker}] Error calculating 5d RSI: {str(e)}")
-            raise
-
-    def _calc_rsi_20d(self, data: pd.DataFrame, ticker: str) -> float | None:
-        """Calculate RSI for 20-day timeframe.
-
-        Args:
-            data: Full DataFrame with OHLCV data.
-            ticker: Stock ticker symbol for logging.
-
-        Returns:
-            Latest RSI value (0-100) or None if insufficient data.
-        """
-        if len(data) < 20:
-            raise InsufficientDataError(
-                f"[{ticker}] Insufficient data for 20d RSI: {len(data)} periods available"
-            )
-
-        # Get the last 20 days of close prices
-        window_close = data["close"].tail(20).values.astype(np.float64)
-
-        try:
-            rsi_values = talib.RSI(window_close, timeperiod=14)
-            latest_rsi = float(rsi_values[-1])
-
-            self.logger.debug(f"[{ticker}] 20d RSI calculated: {latest_rsi:.2f}")
-            return latest_rsi
-        except Exception as e:
-            self.logger.error(f"[{ticker}] Error calculating 20d RSI: {str(e)}")
-            raise
-
-    def _calc_rsi_50d(self, data: pd.DataFrame, ticker: str) -> float | None:
-        """Calculate RSI for 50-day timeframe.
-
-        Args:
-            data: Full DataFrame with OHLCV data.
-            ticker: Stock ticker symbol for logging.
-
-        Returns:
-            Latest RSI value (0-100) or None if insufficient data.
-        """
-        if len(data) < 50:
-            raise InsufficientDataError(
-                f"[{ticker}] Insufficient data for 50d RSI: {len(data)} periods available"
-            )
-
-        # Get the last 50 days of close prices
-        window_close = data["close"].tail(50).values.astype(np.float64)
-
-        try:
-            rsi_values = talib.RSI(window_close, timeperiod=14)
-            latest_rsi = float(rsi_values[-1])
-
-            self.logger.debug(f"[{ticker}] 50d RSI calculated: {latest_rsi:.2f}")
-            return latest_rsi
-        except Exception as e:
-            self.logger.error(f"[{ticker}] Error calculating 50d RSI: {str(e)}")
-            raise
-
-    def _calc_rsi_200d(self, data: pd.DataFrame, ticker: str) -> float | None:
-        """Calculate RSI for 200-day timeframe.
-
-        Args:
-            data: Full DataFrame with OHLCV data.
-            ticker: Stock ticker symbol for logging.
-
-        Returns:
-            Latest RSI value (0-100) or None if insufficient data.
-        """
-        if len(data) < 200:
-            raise InsufficientDataError(
-                f"[{ticker}] Insufficient data for 200d RSI: " f"{len(data)} periods available"
-            )
-
-        # Get the last 200 days of close prices
-        window_close = data["close"].tail(200).values.astype(np.float64)
-
-        try:
-            rsi_values = talib.RSI(window_close, timeperiod=14)
-            latest_rsi = float(rsi_values[-1])
-
-            self.logger.debug(f"[{ticker}] 200d RSI calculated: {latest_rsi:.2f}")
-            return latest_rsi
-        except Exception as e:
-            self.logger.error(f"[{ticker}] Error calculating 200d RSI: {str(e)}")
-            raise
-
-    def _calc_sma_20(self, data: pd.DataFrame, ticker: str) -> np.ndarray | None:
-        """Calculate SMA 20 for the full dataset.
-
-        Args:
-            data: Full DataFrame with OHLCV data.
-            ticker: Stock ticker symbol for logging.
-
-        Returns:
-            Array of SMA 20 values or None if error.
-        """
-        if len(data) < 20:
-            self.logger.warning(
-                f"[{ticker}] Insufficient data for SMA 20: {len(data)} periods available"
-            )
-            return None
-
-        try:
-            close_prices = data["close"].values.astype(np.float64)
-            sma_20 = talib.SMA(close_prices, timeperiod=20)
-            self.logger.debug(f"[{ticker}] SMA 20 calculated")
-            return sma_20
-        except Exception as e:
-            self.logger.error(f"[{ticker}] Error calculating SMA 20: {str(e)}")
-            return None
-
-    def _calc_sma_50(self, data: pd.DataFrame, ticker: str) -> np.ndarray | None:
-        """Calculate SMA 50 for the full dataset.
-
-        Args:
-            data: Full DataFrame with OHLCV data.
-            ticker: Stock ticker symbol for logging.
-
-        Returns:
-            Array of SMA 50 values or None if error.
-        """
-        if len(data) < 50:
-            self.logger.warning(
-                f"[{ticker}] Insufficient data for SMA 50: {len(data)} periods available"
-            )
-            return None
-
-        try:
-            close_prices = data["close"].values.astype(np.float64)
-            sma_50 = talib.SMA(close_prices, timeperiod=50)
-            self.logger.debug(f"[{ticker}] SMA 50 calculated")
-            return sma_50
-        except Exception as e:
-            self.logger.error(f"[{ticker}] Error calculating SMA 50: {str(e)}")
-            return None
-
-    def _calc_sma_200(self, data: pd.DataFrame, ticker: str) -> np.ndarray | None:
-        """Calculate SMA 200 for the full dataset.
-
-        Args:
-            data: Full DataFrame with OHLCV data.
-            ticker: Stock ticker symbol for logging.
-
-        Returns:
-            Array of SMA 200 values or None if error.
-        """
-        if len(data) < 200:
-            self.logger.warning(
-                f"[{ticker}] Insufficient data for SMA 200: {len(data)} periods available"
-            )
-            return None
-
-        try:
-            close_prices = data["close"].values.astype(np.float64)
-            sma_200 = talib.SMA(close_prices, timeperiod=200)
-            self.logger.debug(f"[{ticker}] SMA 200 calculated")
-            return sma_200
-        except Exception as e:
-            self.logger.error(f"[{ticker}] Error calculating SMA 200: {str(e)}")
-            return None
@@ -0,0 +1,361 @@
+"""Sampled drift auditor for incremental indicator state.
+
+IncrementalCalculator state is updated in place every day for weeks; rounding
+or a missed/restated bar can make its Wilder/EMA averages drift away from
+what a full TA-Lib computation over the same history gives. DriftAuditor
+re-computes a rotating sample of tickers in full (during idle time, from a
+background thread or on demand), compares the values implied by each state
+against TA-Lib, reseeds states that are out of tolerance and keeps drift
+metrics for monitoring.
+
+Every cached ticker is audited once per len(universe) / sample_size batches.
+
+Example:
+    auditor = DriftAuditor(calculator, load_history=pipeline._fetch_data)
+    auditor.start(interval_seconds=300)  # Or call auditor.audit_batch()
+    auditor.get_stats()["drift_rate"]
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.engine.incremental_calculator import (
+    IncrementalCalculator,
+    IncrementalState,
+    talib_reference,
+)
+from src.engine.state_store import as_date
+
+logger = logging.getLogger(__name__)
+
+# Indicators whose latest value is carried by the state itself
+AUDITED_INDICATORS = (
+    "rsi",
+    "sma_20",
+    "sma_50",
+    "sma_200",
+    "ema_12",
+    "ema_26",
+    "macd",
+    "macd_signal",
+    "atr",
+    "adx",
+    "plus_di",
+    "minus_di",
+)
+
+
+def state_values(state: IncrementalState) -> dict[str, float]:
+    """Latest indicator values implied by a committed state.
+
+    RSI and DI are derived from the smoothed averages with TA-Lib's formulas,
+    so the comparison isolates drift in the state rather than output rounding.
+
+    Args:
+        state: Committed incremental state
+
+    Returns:
+        Dict mapping indicator name to value (indicators without state omitted)
+    """
+    values: dict[str, float] = {}
+
+    if state.avg_gain is not None and state.avg_loss is not None:
+        total = state.avg_gain + state.avg_loss
+        values["rsi"] = 100 * state.avg_gain / total if total != 0 else 0.0
+
+    for name, window in (
+        ("sma_20", state.sma_20_window),
+        ("sma_50", state.sma_50_window),
+        ("sma_200", state.sma_200_window),
+    ):
+        if window is not None and window.full:
+            values[name] = window.mean()
+
+    for name, value in (
+        ("ema_12", state.ema_12),
+        ("ema_26", state.ema_26),
+        ("macd", state.macd_line),
+        ("macd_signal", state.macd_signal),
+        ("atr", state.prev_atr),
+        ("adx", state.prev_adx),
+    ):
+        if value is not None:
+            values[name] = float(value)
+
+    if state.prev_tr_smooth and state.adx_bars >= IncrementalCalculator.ADX_PERIOD:
+        values["plus_di"] = 100 * state.prev_plus_dm / state.prev_tr_smooth
+        values["minus_di"] = 100 * state.prev_minus_dm / state.prev_tr_smooth
+
+    return values
+
+
+class DriftAuditor:
+    """Rotating full-recalculation audit of IncrementalCalculator states.
+
+    Attributes:
+        calculator: Audited IncrementalCalculator
+        sample_size: Tickers audited per batch
+        tolerance: Maximum allowed absolute difference per indicator
+        history_days: Bars requested from load_history per ticker
+        reseed: Whether drifted states are rebuilt from the loaded history
+    """
+
+    DEFAULT_SAMPLE_SIZE = 20
+    DEFAULT_TOLERANCE = 0.1
+    DEFAULT_HISTORY_DAYS = 500
+    DEFAULT_INTERVAL_SECONDS = 300.0
+
+    def __init__(
+        self,
+        calculator: IncrementalCalculator,
+        load_history: Callable[[str, int], pd.DataFrame | None],
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        tolerance: float = DEFAULT_TOLERANCE,
+        history_days: int = DEFAULT_HISTORY_DAYS,
+        reseed: bool = True,
+        is_idle: Callable[[], bool] | None = None,
+    ):
+        """Initialize drift auditor.
+
+        Args:
+            calculator: IncrementalCalculator whose cached states are audited
+            load_history: Callable (ticker, lookback) returning the most recent
+                OHLCV rows (date, open, high, low, close, volume), oldest first,
+                or None (e.g. IndicatorPipeline._fetch_data)
+            sample_size: Tickers audited per batch
+            tolerance: Maximum allowed absolute difference per indicator
+            history_days: Bars requested per ticker (more bars bring the
+                TA-Lib seed closer to the state's)
+            reseed: Whether drifted states are rebuilt from the loaded history
+            is_idle: Optional callable; the background thread skips a batch
+                when it returns False
+
+        Raises:
+            ValueError: If sample_size or history_days is too small
+        """
+        if sample_size < 1:
+            raise ValueError(f"sample_size must be >= 1, got {sample_size}")
+        if history_days < 220:
+            raise ValueError(f"history_days must be >= 220, got {history_days}")
+
+        self.calculator = calculator
+        self.load_history = load_history
+        self.sample_size = sample_size
+        self.tolerance = tolerance
+        self.history_days = history_days
+        self.reseed = reseed
+        self.is_idle = is_idle
+
+        self._cursor = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker: threading.Thread | None = None
+
+        self._stats = {
+            "batches": 0,
+            "audited": 0,
+            "drifted": 0,
+            "reseeded": 0,
+            "skipped": 0,
+            "failed": 0,
+        }
+        self._max_drift: dict[str, float] = {}
+        self._last_batch: dict[str, Any] = {}
+
+    def audit_ticker(self, ticker: str) -> dict[str, Any]:
+        """Compare one ticker's state against a full TA-Lib computation.
+
+        A state marked needs_reseed has no extended indicators to compare and
+        is reseeded from history (when reseeding is enabled).
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Dict with audit result:
+            {
+                "ticker": str,
+                "status": "ok" | "drift" | "skipped" | "failed",
+                "max_drift": float,
+                "drift": {indicator: abs difference},
+                "reseeded": bool
+            }
+        """
+        result: dict[str, Any] = {
+            "ticker": ticker,
+            "max_drift": 0.0,
+            "drift": {},
+            "reseeded": False,
+        }
+
+        if self.calculator.get_cached_state(ticker) is None:
+            return {**result, "status": "skipped", "reason": "no cached state"}
+
+        try:
+            history = self.load_history(ticker, self.history_days)
+        except Exception as e:
+            logger.error(f"[{ticker}] Drift audit history load failed: {e}")
+            return {**result, "status": "failed", "reason": str(e)}
+
+        # Hold the calculator's lock so no bar is applied between the state
+        # read and a reseed from history ending on that state's date
+        with self.calculator.state_lock:
+            state = self.calculator.get_cached_state(ticker)
+            if state is None:
+                return {**result, "status": "skipped", "reason": "no cached state"}
+            return self._compare(ticker, state, history, result)
+
+    def _compare(
+        self,
+        ticker: str,
+        state: IncrementalState,
+        history: pd.DataFrame | None,
+        result: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Compare a state with TA-Lib over the history and reseed it on drift.
+
+        The caller holds the calculator's state_lock.
+        """
+        last_date = as_date(state.last_date)
+        if history is not None and len(history):
+            history = history[pd.to_datetime(history["date"]).dt.date <= last_date]
+        if history is None or len(history) < 220:
+            return {**result, "status": "skipped", "reason": "insufficient history"}
+        if as_date(history["date"].iloc[-1]) != last_date:
+            return {**result, "status": "skipped", "reason": "history does not reach state date"}
+
+        if state.needs_reseed:
+            # Extended indicators were never seeded; there is nothing to compare
+            if self.reseed:
+                self.calculator.reseed_state(ticker, history.reset_index(drop=True))
+                result["reseeded"] = True
+            return {**result, "status": "drift", "reason": "state needs reseed"}
+
+        reference = talib_reference(history)
+        values = state_values(state)
+        drift = {}
+        for name in AUDITED_INDICATORS:
+            expected = reference[name][-1]
+            if name in values and not np.isnan(expected):
+                drift[name] = abs(values[name] - float(expected))
+        max_drift = max(drift.values(), default=0.0)
+        result.update(drift=drift, max_drift=max_drift)
+
+        if max_drift <= self.tolerance:
+            return {**result, "status": "ok"}
+
+        worst = max(drift, key=drift.get)
+        logger.warning(
+            f"[{ticker}] Incremental state drifted: {worst} off by {drift[worst]:.4f} "
+            f"(tolerance {self.tolerance})"
+        )
+        if self.reseed:
+            self.calculator.reseed_state(ticker, history.reset_index(drop=True))
+            result["reseeded"] = True
+        return {**result, "status": "drift"}
+
+    def audit_batch(self, sample_size: int | None = None) -> list[dict[str, Any]]:
+        """Audit the next tickers in rotation.
+
+        Args:
+            sample_size: Tickers to audit (default: self.sample_size)
+
+        Returns:
+            List of audit_ticker() results
+        """
+        with self._lock:
+            start_time = time.perf_counter()
+            results = [self.audit_ticker(ticker) for ticker in self._next_sample(sample_size)]
+
+            statuses = [result["status"] for result in results]
+            audited = statuses.count("ok") + statuses.count("drift")
+            self._stats["batches"] += 1
+            self._stats["audited"] += audited
+            self._stats["drifted"] += statuses.count("drift")
+            self._stats["reseeded"] += sum(result["reseeded"] for result in results)
+            self._stats["skipped"] += statuses.count("skipped")
+            self._stats["failed"] += statuses.count("failed")
+            for result in results:
+                for name, diff in result["drift"].items():
+                    self._max_drift[name] = max(self._max_drift.get(name, 0.0), diff)
+
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            self._last_batch = {
+                "at": datetime.now().isoformat(),
+                "tickers": len(results),
+                "audited": audited,
+                "drifted": [result["ticker"] for result in results if result["status"] == "drift"],
+                "max_drift": max((result["max_drift"] for result in results), default=0.0),
+                "elapsed_ms": elapsed_ms,
+            }
+
+        logger.info(
+            f"Drift audit: {audited}/{len(results)} tickers audited, "
+            f"{len(self._last_batch['drifted'])} drifted, in {elapsed_ms:.0f}ms"
+        )
+        return results
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get drift metrics.
+
+        Returns:
+            Dict with counters, drift_rate (drifted / audited), the largest
+            drift seen per indicator and a summary of the last batch
+        """
+        with self._lock:
+            audited = self._stats["audited"]
+            return {
+                **self._stats,
+                "drift_rate": self._stats["drifted"] / audited if audited else 0.0,
+                "max_drift": dict(self._max_drift),
+                "last_batch": dict(self._last_batch),
+                "tolerance": self.tolerance,
+                "running": self._worker is not None and self._worker.is_alive(),
+            }
+
+    def start(self, interval_seconds: float = DEFAULT_INTERVAL_SECONDS) -> None:
+        """Audit one batch every interval_seconds on a background thread.
+
+        Batches are skipped while is_idle() returns False.
+        """
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._stop.clear()
+        self._worker = threading.Thread(
+            target=self._run, args=(interval_seconds,), name="drift-auditor", daemon=True
+        )
+        self._worker.start()
+        logger.info(f"Drift auditor started (every {interval_seconds:.0f}s)")
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background thread (the running batch finishes first)."""
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+            self._worker = None
+
+    def _run(self, interval_seconds: float) -> None:
+        while not self._stop.wait(interval_seconds):
+            if self.is_idle is not None and not self.is_idle():
+                continue
+            try:
+                self.audit_batch()
+            except Exception as e:
+                logger.error(f"Drift audit batch failed: {e}")
+
+    def _next_sample(self, sample_size: int | None) -> list[str]:
+        """Next tickers in rotation over the calculator's cached tickers."""
+        tickers = sorted(self.calculator.cached_tickers())
+        if not tickers:
+            return []
+        count = min(sample_size or self.sample_size, len(tickers))
+        start = self._cursor % len(tickers)
+        self._cursor = (start + count) % len(tickers)
+        return (tickers[start:] + tickers[:start])[:count]
@@ -7,8 +7,12 @@ indicators using rolling window math instead of full recalculation. This achieve
 Phase 5 Optimization - EPIC 5.1: Incremental Indicator Calculation
 """
 
+import functools
 import logging
+import threading
 import time
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import date
 from typing import Any
@@ -16,15 +20,31 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
+from src.engine import indicator_kernels as kernels
+from src.engine.ring_buffer import RingBuffer
+from src.engine.state_store import IncrementalStateStore, as_date
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _locked(method: Callable) -> Callable:
+    """Run an IncrementalCalculator method while holding its state_lock."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.state_lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+@dataclass(slots=True)
 class IncrementalState:
     """State container for incremental calculations.
 
     Stores previous indicator values and rolling window data needed
-    for efficient incremental updates.
+    for efficient incremental updates. Rolling windows are fixed-size
+    ring buffers with running mean/variance, so every update is O(1).
     """
 
     ticker: str
@@ -37,9 +57,9 @@ class IncrementalState:
     prev_close: float | None = None
 
     # SMA state (rolling window)
-    sma_20_window: list[float] | None = None  # Last 20 closes
-    sma_50_window: list[float] | None = None  # Last 50 closes
-    sma_200_window: list[float] | None = None  # Last 200 closes
+    sma_20_window: RingBuffer | None = None  # Last 20 closes
+    sma_50_window: RingBuffer | None = None  # Last 50 closes
+    sma_200_window: RingBuffer | None = None  # Last 200 closes
 
     # EMA state
     ema_12: float | None = None
@@ -48,22 +68,83 @@ class IncrementalState:
     # MACD state
     macd_line: float | None = None
     macd_signal: float | None = None  # 9-period EMA of MACD line
-    macd_signal_window: list[float] | None = None  # Last 9 MACD values for signal update
+    macd_signal_window: RingBuffer | None = None  # Last 9 MACD values for signal update
 
     # Bollinger Bands state
     bb_middle: float | None = None  # Same as SMA 20
-    bb_window: list[float] | None = None  # Last 20 closes for std dev
+    bb_window: RingBuffer | None = None  # Last 20 closes for std dev
 
     # ATR state (Wilder's smoothing)
     prev_atr: float | None = None
     prev_high: float | None = None
     prev_low: float | None = None
 
-    # ADX state
+    # ADX state (Wilder's smoothing, TA-Lib seeding)
     prev_adx: float | None = None
-    prev_plus_dm: float | None = None
-    prev_minus_dm: float | None = None
-    prev_tr_smooth: float | None = None
+    prev_plus_dm: float | None = None  # Smoothed +DM
+    prev_minus_dm: float | None = None  # Smoothed -DM
+    prev_tr_smooth: float | None = None  # Smoothed true range
+    adx_bars: int = 0  # Bars folded into the smoothing so far (warm-up counter)
+    dx_sum: float = 0.0  # Sum of DX values while seeding the first ADX
+
+    # Stochastic state
+    stoch_high_window: RingBuffer | None = None  # Last 5 highs
+    stoch_low_window: RingBuffer | None = None  # Last 5 lows
+    stoch_fastk_window: RingBuffer | None = None  # Last 3 fast %K values
+    stoch_slowk_window: RingBuffer | None = None  # Last 3 slow %K values
+
+    # CCI state
+    cci_window: RingBuffer | None = None  # Last 20 typical prices
+
+    # MFI state
+    prev_typical: float | None = None
+    mfi_pos_window: RingBuffer | None = None  # Last 14 positive money flows
+    mfi_neg_window: RingBuffer | None = None  # Last 14 negative money flows
+
+    # OBV state
+    obv: float | None = None
+
+    # Exported without ADX/Stochastic/CCI/OBV/MFI state (e.g. by
+    # MarketIncrementalEngine); rebuilt from history when history is available
+    needs_reseed: bool = False
+
+    def memory_bytes(self) -> int:
+        """Approximate memory footprint in bytes, including window buffers."""
+        total = object.__sizeof__(self)
+        for name in self.__slots__:
+            value = getattr(self, name)
+            total += value.nbytes if isinstance(value, RingBuffer) else 0
+        return total
+
+    def copy(self) -> "IncrementalState":
+        """Independent copy of the state (window buffers are duplicated)."""
+        values = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            values[name] = value.copy() if isinstance(value, RingBuffer) else value
+        return IncrementalState(**values)
+
+
+@dataclass(slots=True)
+class ProvisionalBar:
+    """A peeked partial bar and the state it produced (reused by commit_bar)."""
+
+    bar: dict[str, Any]
+    base: IncrementalState  # Committed state the peek started from
+    base_date: date
+    state: IncrementalState  # Copy of base advanced by the bar
+    indicators: dict[str, Any]
+
+
+@dataclass(slots=True)
+class JournalEntry:
+    """One applied bar and the state just before it (for rollback)."""
+
+    bar: dict[str, Any]
+    state: IncrementalState
+
+
+BAR_FIELDS = ("open", "high", "low", "close", "volume")
 
 
 class IncrementalCalculator:
@@ -79,6 +160,37 @@ class IncrementalCalculator:
     - MACD (EMA-based)
     - Bollinger Bands (rolling std dev)
     - ATR (Wilder's smoothing)
+    - ADX, +DI, -DI (Wilder's smoothing)
+    - Stochastic %K/%D (5, 3, 3)
+    - CCI (rolling typical price)
+    - Momentum (from the SMA 20 window)
+    - OBV (running total)
+    - MFI (rolling money flows)
+
+    ADX/DI, Stochastic, CCI, OBV and MFI follow TA-Lib's definitions and
+    seeding, so values match IndicatorCalculator (see
+    validate_incremental_accuracy).
+
+    With a state store, states are checkpointed after every update and
+    restored on a ticker's first update (or eagerly with restore_states()),
+    so a restarted worker stays on the incremental path without reloading
+    history. A snapshot that does not end on the bar before the update (or
+    on the last bar of the history passed with it) is discarded.
+
+    Each ticker also keeps an in-memory journal of its last `journal_size`
+    bars with the state before each one. A restated or late bar within the
+    journal rolls the state back to just before that bar and replays only
+    the following journaled bars (see restate_bars()), instead of a full
+    reinitialization. The journal is not persisted; after a restore it fills
+    up again as new bars arrive.
+
+    During trading hours, peek_indicators() evaluates a partial bar on a copy
+    of the committed state, so it can be called repeatedly without
+    corrupting the averages; commit_bar() finalizes the closing bar.
+
+    Every public method that reads or replaces states holds state_lock (a
+    reentrant lock), so another thread can hold it to read a state and
+    replace it atomically (e.g. DriftAuditor's compare and reseed).
 
     Usage:
         calculator = IncrementalCalculator()
@@ -115,15 +227,61 @@ class IncrementalCalculator:
     # ATR period
     ATR_PERIOD = 14
 
-    def __init__(self):
-        """Initialize the incremental calculator."""
+    # ADX period
+    ADX_PERIOD = 14
+
+    # Stochastic (fast %K period, slow %K and %D smoothing)
+    STOCH_FASTK_PERIOD = 5
+    STOCH_SLOWK_PERIOD = 3
+    STOCH_SLOWD_PERIOD = 3
+
+    # CCI period and Lambert constant
+    CCI_PERIOD = 20
+    CCI_CONSTANT = 0.015
+
+    # Momentum period (must be < SMA 20 window)
+    MOM_PERIOD = 10
+
+    # MFI period
+    MFI_PERIOD = 14
+
+    # Bars kept per ticker for rollback of restated bars
+    JOURNAL_SIZE = 10
+
+    def __init__(
+        self,
+        state_store: IncrementalStateStore | None = None,
+        journal_size: int = JOURNAL_SIZE,
+    ):
+        """Initialize the incremental calculator.
+
+        Args:
+            state_store: Optional persistent store for state checkpoints
+            journal_size: Bars journaled per ticker for rollback (0 disables)
+
+        Raises:
+            ValueError: If journal_size is negative
+        """
+        if journal_size < 0:
+            raise ValueError(f"journal_size must be >= 0, got {journal_size}")
+
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.state_store = state_store
+        self.journal_size = journal_size
+        self.state_lock = threading.RLock()
 
         # State cache: ticker -> IncrementalState
         self._state_cache: dict[str, IncrementalState] = {}
 
+        # Rollback journal: ticker -> last journal_size bars, oldest first
+        self._journal: dict[str, deque[JournalEntry]] = {}
+
+        # Latest intraday peek per ticker
+        self._provisional: dict[str, ProvisionalBar] = {}
+
         self.logger.info("IncrementalCalculator initialized")
 
+    @_locked
     def update_indicators(
         self,
         ticker: str,
@@ -137,6 +295,12 @@ class IncrementalCalculator:
         state exists, it initializes from historical data. Otherwise, it updates
         only the new day's values using previous state.
 
+        A bar dated on or before the state date is treated as a restatement:
+        if it differs from the bar already applied (or fills a missing day)
+        and falls within the journal, the state is rolled back and the later
+        journaled bars are replayed (method "restated", with their refreshed
+        values under "replayed").
+
         Args:
             ticker: Stock ticker symbol
             new_day_data: Dict with new day's OHLCV data:
@@ -153,7 +317,7 @@ class IncrementalCalculator:
                 "ticker": str,
                 "date": date,
                 "calculation_time_ms": float,
-                "method": "incremental" | "full",
+                "method": "incremental" | "restated" | "failed",
                 "indicators": {
                     "rsi": float,
                     "sma_20": float,
@@ -168,6 +332,15 @@ class IncrementalCalculator:
                     "bb_middle": float,
                     "bb_lower": float,
                     "atr": float,
+                    "adx": float,
+                    "plus_di": float,
+                    "minus_di": float,
+                    "stoch_k": float,
+                    "stoch_d": float,
+                    "cci": float,
+                    "momentum": float,
+                    "obv": float,
+                    "mfi": float,
                     ...
                 }
             }
@@ -180,20 +353,25 @@ class IncrementalCalculator:
         self.logger.debug(f"[{ticker}] Starting incremental indicator update")
 
         # Validate new day data
-        required_keys = ["date", "open", "high", "low", "close", "volume"]
-        for key in required_keys:
-            if key not in new_day_data:
-                raise ValueError(f"new_day_data missing required key: {key}")
+        bar = self._normalize_bar(new_day_data)
+        new_date = bar["date"]
 
-        new_date = new_day_data["date"]
-        float(new_day_data["open"])
-        new_high = float(new_day_data["high"])
-        new_low = float(new_day_data["low"])
-        new_close = float(new_day_data["close"])
-        int(new_day_data["volume"])
-
-        # Check for cached state
+        # Check for cached state, then for a persisted snapshot
         state = self._state_cache.get(ticker)
+        if state is None:
+            state = self._restore_state(ticker, new_date, historical_data)
+
+        if state is not None and state.needs_reseed:
+            if historical_data is not None and len(historical_data) >= 220:
+                self.logger.info(f"[{ticker}] State lacks extended indicators, reseeding")
+                self._journal.pop(ticker, None)
+                self._provisional.pop(ticker, None)
+                state = None
+            else:
+                self.logger.debug(f"[{ticker}] State lacks extended indicators, no history given")
+
+        if state is not None and as_date(new_date) <= as_date(state.last_date):
+            return self._restate_single(ticker, bar, start_time)
 
         if state is None:
             # No cached state - need to initialize from historical data
@@ -216,6 +394,332 @@ class IncrementalCalculator:
             state = self._initialize_state(ticker, historical_data)
             self._state_cache[ticker] = state
 
+        self._record(ticker, state, bar)
+        indicators = self._apply_bar(state, bar)
+
+        if self.state_store is not None:
+            try:
+                self.state_store.save(state)
+            except Exception as e:
+                self.logger.error(f"[{ticker}] Failed to checkpoint incremental state: {e}")
+
+        # Calculate elapsed time
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+        self.logger.info(
+            f"[{ticker}] Incremental update complete in {elapsed_ms:.2f}ms "
+            f"(RSI={indicators['rsi']:.2f}, SMA20={indicators['sma_20']:.2f})"
+        )
+
+        return {
+            "ticker": ticker,
+            "date": new_date,
+            "calculation_time_ms": elapsed_ms,
+            "method": "incremental",
+            "indicators": indicators,
+        }
+
+    @_locked
+    def peek_indicators(self, ticker: str, partial_bar: dict[str, Any]) -> dict[str, Any]:
+        """Calculate indicators for a provisional (intraday) bar without committing it.
+
+        The bar is applied to a copy of the committed state, so repeated
+        calls during the session leave the state untouched. The latest peek
+        is kept so commit_bar() can finalize it without recomputing.
+
+        Args:
+            ticker: Stock ticker symbol
+            partial_bar: OHLCV dict of the bar so far (same keys as new_day_data);
+                must be dated after the committed state
+
+        Returns:
+            Dictionary with provisional indicator values:
+            {
+                "ticker": str,
+                "date": date,
+                "calculation_time_ms": float,
+                "method": "provisional" | "failed",
+                "indicators": {...}
+            }
+        """
+        start_time = time.perf_counter()
+        bar = self._normalize_bar(partial_bar)
+        result = {"ticker": ticker, "date": bar["date"], "indicators": {}}
+
+        base = self._state_cache.get(ticker)
+        if base is None:
+            base = self._restore_state(ticker, bar["date"], None)
+        if base is None or as_date(bar["date"]) <= as_date(base.last_date):
+            error = (
+                "No cached state"
+                if base is None
+                else f"Bar date is not after state date {base.last_date}"
+            )
+            return {
+                **result,
+                "method": "failed",
+                "error": error,
+                "calculation_time_ms": (time.perf_counter() - start_time) * 1000,
+            }
+
+        state = base.copy()
+        indicators = self._apply_bar(state, bar)
+        self._provisional[ticker] = ProvisionalBar(
+            bar=bar,
+            base=base,
+            base_date=as_date(base.last_date),
+            state=state,
+            indicators=indicators,
+        )
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self.logger.debug(
+            f"[{ticker}] Provisional update for {bar['date']} in {elapsed_ms:.2f}ms"
+        )
+        return {
+            **result,
+            "method": "provisional",
+            "indicators": indicators,
+            "calculation_time_ms": elapsed_ms,
+        }
+
+    @_locked
+    def commit_bar(self, ticker: str, bar: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Finalize the closing bar into the committed state.
+
+        If the bar matches the latest peek and the committed state has not
+        changed since, the peeked state is adopted as is; otherwise the bar
+        goes through update_indicators().
+
+        Args:
+            ticker: Stock ticker symbol
+            bar: Closing OHLCV dict (None commits the latest peeked bar)
+
+        Returns:
+            Same result dict as update_indicators()
+        """
+        start_time = time.perf_counter()
+        provisional = self._provisional.pop(ticker, None)
+        if bar is None:
+            if provisional is None:
+                return {
+                    "ticker": ticker,
+                    "date": None,
+                    "calculation_time_ms": (time.perf_counter() - start_time) * 1000,
+                    "method": "failed",
+                    "error": "No provisional bar to commit",
+                    "indicators": {},
+                }
+            bar = provisional.bar
+        else:
+            bar = self._normalize_bar(bar)
+
+        if (
+            provisional is None
+            or provisional.bar != bar
+            or self._state_cache.get(ticker) is not provisional.base
+            or as_date(provisional.base.last_date) != provisional.base_date
+        ):
+            return self.update_indicators(ticker, bar)
+
+        # The peeked state is the committed state advanced by this bar
+        self._record(ticker, provisional.base, bar, copy=False)
+        self._state_cache[ticker] = provisional.state
+
+        if self.state_store is not None:
+            try:
+                self.state_store.save(provisional.state)
+            except Exception as e:
+                self.logger.error(f"[{ticker}] Failed to checkpoint incremental state: {e}")
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self.logger.info(
+            f"[{ticker}] Committed provisional bar {bar['date']} in {elapsed_ms:.2f}ms"
+        )
+        return {
+            "ticker": ticker,
+            "date": bar["date"],
+            "calculation_time_ms": elapsed_ms,
+            "method": "incremental",
+            "indicators": provisional.indicators,
+        }
+
+    @_locked
+    def restate_bars(self, ticker: str, bars: list[dict[str, Any]]) -> dict[str, Any]:
+        """Apply corrected, late or new bars, rolling back the state if needed.
+
+        The state is rolled back to just before the earliest given bar using
+        the journal, then the given bars and the later journaled bars are
+        applied in date order. Bars identical to the ones already applied are
+        ignored. Cost is O(bars replayed), not O(history).
+
+        Args:
+            ticker: Stock ticker symbol
+            bars: OHLCV dicts (same keys as update_indicators new_day_data)
+
+        Returns:
+            Dict with restatement results:
+            {
+                "ticker": str,
+                "method": "restated" | "unchanged" | "failed",
+                "calculation_time_ms": float,
+                "rolled_back": int,  # Journaled bars undone
+                "results": [{"date": date, "indicators": {...}}, ...]  # Date order
+            }
+        """
+        start_time = time.perf_counter()
+        result: dict[str, Any] = {"ticker": ticker, "rolled_back": 0, "results": []}
+
+        bars_by_date = {}
+        for bar in bars:
+            bar = self._normalize_bar(bar)
+            bars_by_date[as_date(bar["date"])] = bar
+
+        state = self._state_cache.get(ticker)
+        if state is None and bars_by_date:
+            state = self._restore_state(ticker, min(bars_by_date), None)
+        if state is None:
+            return {
+                **result,
+                "method": "failed",
+                "error": "No cached state to restate",
+                "calculation_time_ms": (time.perf_counter() - start_time) * 1000,
+            }
+
+        journal = self._journal.get(ticker, deque())
+        applied = {as_date(entry.bar["date"]): entry.bar for entry in journal}
+        changed = {
+            bar_date: bar
+            for bar_date, bar in bars_by_date.items()
+            if bar_date not in applied
+            or any(bar[key] != applied[bar_date][key] for key in BAR_FIELDS)
+        }
+        if not changed:
+            return {
+                **result,
+                "method": "unchanged",
+                "calculation_time_ms": (time.perf_counter() - start_time) * 1000,
+            }
+
+        earliest = min(changed)
+        replay: dict[date, dict[str, Any]] = {}
+        if earliest <= as_date(state.last_date):
+            if not journal or as_date(journal[0].state.last_date) >= earliest:
+                oldest = as_date(journal[0].bar["date"]) if journal else None
+                self.logger.warning(
+                    f"[{ticker}] Cannot restate {earliest}: outside the rollback journal "
+                    f"(oldest bar {oldest}); state needs reinitialization"
+                )
+                return {
+                    **result,
+                    "method": "failed",
+                    "error": f"Bar {earliest} is older than the rollback journal",
+                    "calculation_time_ms": (time.perf_counter() - start_time) * 1000,
+                }
+
+            # Roll back to the state before the first journaled bar on/after earliest
+            while journal and as_date(journal[-1].bar["date"]) >= earliest:
+                entry = journal.pop()
+                replay[as_date(entry.bar["date"])] = entry.bar
+                state = entry.state
+            result["rolled_back"] = len(replay)
+
+        replay.update(changed)
+        for bar_date in sorted(replay):
+            bar = replay[bar_date]
+            self._record(ticker, state, bar)
+            indicators = self._apply_bar(state, bar)
+            result["results"].append({"date": bar["date"], "indicators": indicators})
+        self._state_cache[ticker] = state
+
+        if self.state_store is not None:
+            try:
+                self.state_store.save(state)
+            except Exception as e:
+                self.logger.error(f"[{ticker}] Failed to checkpoint incremental state: {e}")
+
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self.logger.info(
+            f"[{ticker}] Restated {len(changed)} bar(s) from {earliest}: rolled back "
+            f"{result['rolled_back']}, applied {len(replay)} in {elapsed_ms:.2f}ms"
+        )
+        return {**result, "method": "restated", "calculation_time_ms": elapsed_ms}
+
+    def _restate_single(
+        self, ticker: str, bar: dict[str, Any], start_time: float
+    ) -> dict[str, Any]:
+        """Handle an update_indicators() bar dated on or before the state date."""
+        restated = self.restate_bars(ticker, [bar])
+        result = {
+            "ticker": ticker,
+            "date": bar["date"],
+            "calculation_time_ms": (time.perf_counter() - start_time) * 1000,
+            "indicators": {},
+        }
+
+        if restated["method"] == "unchanged":
+            self.logger.warning(f"[{ticker}] Bar {bar['date']} already applied, skipping")
+            return {**result, "method": "failed", "error": "Bar already applied"}
+        if restated["method"] == "failed":
+            return {**result, "method": "failed", "error": restated["error"]}
+
+        first, *replayed = restated["results"]
+        return {
+            **result,
+            "method": "restated",
+            "indicators": first["indicators"],
+            "replayed": replayed,
+        }
+
+    @staticmethod
+    def _normalize_bar(bar: dict[str, Any]) -> dict[str, Any]:
+        """Validate an OHLCV dict and coerce prices to float and volume to int.
+
+        Raises:
+            ValueError: If a required key is missing
+        """
+        for key in ("date", *BAR_FIELDS):
+            if key not in bar:
+                raise ValueError(f"new_day_data missing required key: {key}")
+        return {
+            "date": bar["date"],
+            "open": float(bar["open"]),
+            "high": float(bar["high"]),
+            "low": float(bar["low"]),
+            "close": float(bar["close"]),
+            "volume": int(bar["volume"]),
+        }
+
+    def _record(
+        self, ticker: str, state: IncrementalState, bar: dict[str, Any], copy: bool = True
+    ) -> None:
+        """Journal a bar with the state it is about to be applied to.
+
+        The state is copied unless copy is False (the caller no longer mutates it).
+        """
+        if self.journal_size == 0:
+            return
+        journal = self._journal.get(ticker)
+        if journal is None:
+            journal = self._journal[ticker] = deque(maxlen=self.journal_size)
+        journal.append(JournalEntry(bar=bar, state=state.copy() if copy else state))
+
+    def _apply_bar(self, state: IncrementalState, bar: dict[str, Any]) -> dict[str, Any]:
+        """Advance the state by one bar.
+
+        Args:
+            state: State to update in place
+            bar: Normalized OHLCV dict
+
+        Returns:
+            Dict of indicator values for the bar
+        """
+        new_date = bar["date"]
+        new_high = bar["high"]
+        new_low = bar["low"]
+        new_close = bar["close"]
+        new_volume = float(bar["volume"])
+
         # Perform incremental updates
         indicators: dict[str, Any] = {}
 
@@ -230,6 +734,7 @@ class IncrementalCalculator:
         indicators["sma_20"] = sma_20
         indicators["sma_50"] = sma_50
         indicators["sma_200"] = sma_200
+        indicators["momentum"] = self._momentum(state, new_close)
 
         # EMA updates
         ema_12 = self._update_ema(state.ema_12, new_close, self.EMA_FAST)
@@ -253,6 +758,11 @@ class IncrementalCalculator:
         atr = self._update_atr(state, new_high, new_low, new_close)
         indicators["atr"] = atr
 
+        # ADX, Stochastic, CCI, OBV and MFI updates
+        indicators.update(
+            self._update_extended(state, new_high, new_low, new_close, new_volume)
+        )
+
         # Update state with new values
         state.last_date = new_date
         state.prev_rsi = rsi
@@ -265,21 +775,7 @@ class IncrementalCalculator:
         state.prev_high = new_high
         state.prev_low = new_low
 
-        # Calculate elapsed time
-        elapsed_ms = (time.perf_counter() - start_time) * 1000
-
-        self.logger.info(
-            f"[{ticker}] Incremental update complete in {elapsed_ms:.2f}ms "
-            f"(RSI={rsi:.2f}, SMA20={sma_20:.2f})"
-        )
-
-        return {
-            "ticker": ticker,
-            "date": new_date,
-            "calculation_time_ms": elapsed_ms,
-            "method": "incremental",
-            "indicators": indicators,
-        }
+        return indicators
 
     def _initialize_state(self, ticker: str, data: pd.DataFrame) -> IncrementalState:
         """Initialize incremental state from historical data.
@@ -299,14 +795,19 @@ class IncrementalCalculator:
         closes = data["close"].values.astype(float)
         highs = data["high"].values.astype(float)
         lows = data["low"].values.astype(float)
+        volumes = (
+            data["volume"].values.astype(float)
+            if "volume" in data.columns
+            else np.zeros(len(closes))
+        )
 
         # Initialize RSI state (Wilder's smoothing)
         avg_gain, avg_loss, rsi = self._calculate_initial_rsi(closes)
 
         # Initialize SMA windows
-        sma_20_window = list(closes[-20:])
-        sma_50_window = list(closes[-50:])
-        sma_200_window = list(closes[-200:]) if len(closes) >= 200 else list(closes)
+        sma_20_window = RingBuffer.from_values(closes, 20)
+        sma_50_window = RingBuffer.from_values(closes, 50)
+        sma_200_window = RingBuffer.from_values(closes, 200)
 
         # Initialize EMAs
         ema_12 = self._calculate_initial_ema(closes, self.EMA_FAST)
@@ -320,17 +821,17 @@ class IncrementalCalculator:
             if len(macd_values) >= self.MACD_SIGNAL_PERIOD
             else macd_line
         )
-        macd_signal_window = list(macd_values[-self.MACD_SIGNAL_PERIOD :])
+        macd_signal_window = RingBuffer.from_values(macd_values, self.MACD_SIGNAL_PERIOD)
 
         # Initialize Bollinger Bands
-        bb_window = list(closes[-self.BB_PERIOD :])
+        bb_window = RingBuffer.from_values(closes, self.BB_PERIOD)
 
         # Initialize ATR (Wilder's smoothing)
         prev_atr = self._calculate_initial_atr(highs, lows, closes)
 
         last_date = data["date"].iloc[-1] if "date" in data.columns else date.today()
 
-        return IncrementalState(
+        state = IncrementalState(
             ticker=ticker,
             last_date=last_date,
             prev_rsi=rsi,
@@ -345,12 +846,14 @@ class IncrementalCalculator:
             macd_line=macd_line,
             macd_signal=macd_signal,
             macd_signal_window=macd_signal_window,
-            bb_middle=np.mean(bb_window),
+            bb_middle=bb_window.mean(),
             bb_window=bb_window,
             prev_atr=prev_atr,
             prev_high=highs[-1],
             prev_low=lows[-1],
         )
+        self._initialize_extended(state, highs, lows, closes, volumes)
+        return state
 
     def _calculate_initial_rsi(self, closes: np.ndarray) -> tuple[float, float, float]:
         """Calculate initial RSI and store Wilder's smoothed averages.
@@ -364,31 +867,10 @@ class IncrementalCalculator:
         if len(closes) < self.RSI_PERIOD + 1:
             return 0.0, 0.0, 50.0
 
-        # Calculate price changes
-        changes = np.diff(closes)
-
-        # Separate gains and losses
-        gains = np.where(changes > 0, changes, 0)
-        losses = np.where(changes < 0, -changes, 0)
-
-        # First average (simple average of first N periods)
-        first_avg_gain = np.mean(gains[: self.RSI_PERIOD])
-        first_avg_loss = np.mean(losses[: self.RSI_PERIOD])
-
-        # Wilder's smoothing for remaining periods
-        avg_gain = first_avg_gain
-        avg_loss = first_avg_loss
-
-        for i in range(self.RSI_PERIOD, len(gains)):
-            avg_gain = (avg_gain * (self.RSI_PERIOD - 1) + gains[i]) / self.RSI_PERIOD
-            avg_loss = (avg_loss * (self.RSI_PERIOD - 1) + losses[i]) / self.RSI_PERIOD
-
-        # Calculate RSI
-        if avg_loss == 0:
-            rsi = 100.0
-        else:
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
+        avg_gain, avg_loss = kernels.rsi_averages(closes, self.RSI_PERIOD, smoothing="wilder")
+        avg_gain = float(avg_gain[0, -1])
+        avg_loss = float(avg_loss[0, -1])
+        rsi = float(kernels.rsi_from_averages(avg_gain, avg_loss))
 
         return avg_gain, avg_loss, rsi
 
@@ -431,14 +913,14 @@ class IncrementalCalculator:
 
         return round(rsi, 4)
 
-    def _update_sma(self, window: list[float] | None, new_value: float, period: int) -> float:
-        """Update SMA using rolling window subtraction/addition.
+    def _update_sma(self, window: RingBuffer | None, new_value: float, period: int) -> float:
+        """Update SMA in O(1) from the window's running mean.
 
         Formula:
             SMA_new = SMA_old + (new_value - oldest_value) / window
 
         Args:
-            window: List of previous values in the window
+            window: Ring buffer of previous values in the window
             new_value: New value to add
             period: SMA period
 
@@ -448,16 +930,12 @@ class IncrementalCalculator:
         if window is None:
             return new_value
 
+        window.push(new_value)
         if len(window) < period:
-            # Window not full yet - add value and calculate simple average
-            window.append(new_value)
-            return sum(window) / len(window)
-
-        # Rolling update: remove oldest, add newest
-        window.pop(0)
-        window.append(new_value)
+            # Window not full yet - simple average of the values so far
+            return window.mean()
 
-        return round(sum(window) / len(window), 4)
+        return round(window.mean(), 4)
 
     def _update_ema(self, prev_ema: float | None, new_value: float, period: int) -> float:
         """Update EMA using exponential smoothing.
@@ -495,15 +973,7 @@ class IncrementalCalculator:
         if len(closes) < period:
             return float(np.mean(closes))
 
-        # Start with SMA for first period
-        ema = np.mean(closes[:period])
-
-        # Apply EMA formula for remaining
-        multiplier = 2 / (period + 1)
-        for close in closes[period:]:
-            ema = (close - ema) * multiplier + ema
-
-        return float(ema)
+        return float(kernels.ema(closes, period, seed="sma")[0, -1])
 
     def _calculate_macd_history(self, closes: np.ndarray) -> list[float]:
         """Calculate MACD line history for signal line initialization.
@@ -514,27 +984,11 @@ class IncrementalCalculator:
         Returns:
             List of MACD line values
         """
-        macd_values = []
-        ema_12 = None
-        ema_26 = None
-
-        for i, close in enumerate(closes):
-            if i < self.EMA_SLOW:
-                # Not enough data for MACD
-                if i >= self.EMA_FAST:
-                    ema_12 = np.mean(closes[: i + 1])
-                continue
-
-            if ema_12 is None:
-                ema_12 = np.mean(closes[i - self.EMA_FAST + 1 : i + 1])
-                ema_26 = np.mean(closes[i - self.EMA_SLOW + 1 : i + 1])
-            else:
-                ema_12 = self._update_ema(ema_12, close, self.EMA_FAST)
-                ema_26 = self._update_ema(ema_26, close, self.EMA_SLOW)
-
-            macd_values.append(ema_12 - ema_26)
-
-        return macd_values
+        macd_line, _, _ = kernels.macd(
+            closes, self.EMA_FAST, self.EMA_SLOW, self.MACD_SIGNAL_PERIOD, seed="sma"
+        )
+        values = macd_line[0]
+        return values[~np.isnan(values)].tolist()
 
     def _update_macd(
         self, state: IncrementalState, ema_12: float, ema_26: float
@@ -560,9 +1014,7 @@ class IncrementalCalculator:
 
         # Update signal window
         if state.macd_signal_window is not None:
-            if len(state.macd_signal_window) >= self.MACD_SIGNAL_PERIOD:
-                state.macd_signal_window.pop(0)
-            state.macd_signal_window.append(macd_line)
+            state.macd_signal_window.push(macd_line)
 
         # Histogram = MACD - Signal
         macd_hist = macd_line - macd_signal
@@ -585,15 +1037,13 @@ class IncrementalCalculator:
             return new_close + 10, new_close, new_close - 10
 
         # Update window
-        if len(state.bb_window) >= self.BB_PERIOD:
-            state.bb_window.pop(0)
-        state.bb_window.append(new_close)
+        state.bb_window.push(new_close)
 
         # Calculate middle band (SMA)
-        middle = np.mean(state.bb_window)
+        middle = state.bb_window.mean()
 
         # Calculate standard deviation
-        std = np.std(state.bb_window)
+        std = state.bb_window.std()
 
         # Calculate bands
         upper = middle + (self.BB_STD_DEV * std)
@@ -617,22 +1067,8 @@ class IncrementalCalculator:
         if len(closes) < self.ATR_PERIOD + 1:
             return float(np.mean(highs - lows))
 
-        # Calculate True Range
-        tr = []
-        for i in range(1, len(closes)):
-            high_low = highs[i] - lows[i]
-            high_prev_close = abs(highs[i] - closes[i - 1])
-            low_prev_close = abs(lows[i] - closes[i - 1])
-            tr.append(max(high_low, high_prev_close, low_prev_close))
-
-        # First ATR is simple average
-        atr = np.mean(tr[: self.ATR_PERIOD])
-
-        # Wilder's smoothing for remaining
-        for i in range(self.ATR_PERIOD, len(tr)):
-            atr = (atr * (self.ATR_PERIOD - 1) + tr[i]) / self.ATR_PERIOD
-
-        return float(atr)
+        atr = kernels.atr(highs, lows, closes, self.ATR_PERIOD, smoothing="wilder")
+        return float(atr[0, -1])
 
     def _update_atr(
         self, state: IncrementalState, new_high: float, new_low: float, new_close: float
@@ -665,8 +1101,289 @@ class IncrementalCalculator:
 
         return round(new_atr, 4)
 
+    def _momentum(self, state: IncrementalState, new_close: float) -> float | None:
+        """Momentum from the SMA 20 window (call after the new close is pushed).
+
+        Formula:
+            MOM = close - close[MOM_PERIOD bars ago]
+        """
+        if state.sma_20_window is None or len(state.sma_20_window) <= self.MOM_PERIOD:
+            return None
+        return round(new_close - state.sma_20_window.ago(self.MOM_PERIOD), 4)
+
+    def _initialize_extended(
+        self,
+        state: IncrementalState,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        volumes: np.ndarray,
+    ) -> None:
+        """Seed ADX, Stochastic, CCI, OBV and MFI state by replaying history.
+
+        Replaying every bar through the incremental updates reproduces
+        TA-Lib's seeding exactly (ADX and OBV depend on the whole history).
+        Leaves prev_high/prev_low/prev_close on the last bar.
+
+        Args:
+            state: State being initialized
+            highs: Array of high prices
+            lows: Array of low prices
+            closes: Array of closing prices
+            volumes: Array of volumes
+        """
+        state.prev_adx = None
+        state.prev_plus_dm = 0.0
+        state.prev_minus_dm = 0.0
+        state.prev_tr_smooth = 0.0
+        state.adx_bars = 0
+        state.dx_sum = 0.0
+        state.stoch_high_window = RingBuffer(self.STOCH_FASTK_PERIOD)
+        state.stoch_low_window = RingBuffer(self.STOCH_FASTK_PERIOD)
+        state.stoch_fastk_window = RingBuffer(self.STOCH_SLOWK_PERIOD)
+        state.stoch_slowk_window = RingBuffer(self.STOCH_SLOWD_PERIOD)
+        state.cci_window = RingBuffer(self.CCI_PERIOD)
+        state.prev_typical = None
+        state.mfi_pos_window = RingBuffer(self.MFI_PERIOD)
+        state.mfi_neg_window = RingBuffer(self.MFI_PERIOD)
+        state.obv = None
+
+        state.prev_high = state.prev_low = state.prev_close = None
+        for high, low, close, volume in zip(
+            highs.tolist(), lows.tolist(), closes.tolist(), volumes.tolist(), strict=True
+        ):
+            self._update_extended(state, high, low, close, volume)
+            state.prev_high, state.prev_low, state.prev_close = high, low, close
+
+    def _update_extended(
+        self,
+        state: IncrementalState,
+        new_high: float,
+        new_low: float,
+        new_close: float,
+        new_volume: float,
+    ) -> dict[str, float | None]:
+        """Update ADX/DI, Stochastic, CCI, OBV and MFI.
+
+        Must run before prev_high/prev_low/prev_close move to the new bar.
+        Values still warming up are None; states without extended fields
+        (needs_reseed, e.g. exported by MarketIncrementalEngine) yield no
+        values until they are reseeded.
+
+        Args:
+            state: Current incremental state
+            new_high: New high price
+            new_low: New low price
+            new_close: New closing price
+            new_volume: New volume
+
+        Returns:
+            Dict of extended indicator values
+        """
+        if state.stoch_high_window is None:
+            return {}
+
+        adx, plus_di, minus_di = self._update_adx(state, new_high, new_low, new_close)
+        stoch_k, stoch_d = self._update_stoch(state, new_high, new_low, new_close)
+        typical = (new_high + new_low + new_close) / 3
+        return {
+            "adx": adx,
+            "plus_di": plus_di,
+            "minus_di": minus_di,
+            "stoch_k": stoch_k,
+            "stoch_d": stoch_d,
+            "cci": self._update_cci(state, typical),
+            "obv": self._update_obv(state, new_close, new_volume),
+            "mfi": self._update_mfi(state, typical, new_volume),
+        }
+
+    def _update_adx(
+        self, state: IncrementalState, new_high: float, new_low: float, new_close: float
+    ) -> tuple[float | None, float | None, float | None]:
+        """Update ADX and directional indicators using Wilder's smoothing.
+
+        Formula (TA-Lib):
+            TR/+DM/-DM sums start from the first (period - 1) bars, then
+            S = S - S / period + value
+            +DI = 100 * S(+DM) / S(TR), -DI = 100 * S(-DM) / S(TR)
+            DX = 100 * |+DI - -DI| / (+DI + -DI)
+            ADX starts as the mean of the first `period` DX values, then
+            ADX = (ADX_prev * (period - 1) + DX) / period
+
+        Args:
+            state: Current incremental state
+            new_high: New high price
+            new_low: New low price
+            new_close: New closing price
+
+        Returns:
+            Tuple of (adx, plus_di, minus_di); None while warming up
+        """
+        if state.prev_close is None or state.prev_high is None or state.prev_low is None:
+            return None, None, None
+        if state.prev_tr_smooth is None or state.prev_plus_dm is None:
+            return None, None, None
+
+        period = self.ADX_PERIOD
+        up_move = new_high - state.prev_high
+        down_move = state.prev_low - new_low
+        plus_dm = up_move if up_move > 0 and up_move > down_move else 0.0
+        minus_dm = down_move if down_move > 0 and down_move > up_move else 0.0
+        tr = max(
+            new_high - new_low, abs(new_high - state.prev_close), abs(new_low - state.prev_close)
+        )
+
+        state.adx_bars += 1
+        if state.adx_bars < period:
+            # Seeding: plain sums over the first (period - 1) bars
+            state.prev_tr_smooth += tr
+            state.prev_plus_dm += plus_dm
+            state.prev_minus_dm += minus_dm
+            return None, None, None
+
+        state.prev_tr_smooth += tr - state.prev_tr_smooth / period
+        state.prev_plus_dm += plus_dm - state.prev_plus_dm / period
+        state.prev_minus_dm += minus_dm - state.prev_minus_dm / period
+
+        plus_di = minus_di = 0.0
+        dx = None
+        if state.prev_tr_smooth != 0:
+            plus_di = 100 * state.prev_plus_dm / state.prev_tr_smooth
+            minus_di = 100 * state.prev_minus_dm / state.prev_tr_smooth
+            di_sum = plus_di + minus_di
+            if di_sum != 0:
+                dx = 100 * abs(plus_di - minus_di) / di_sum
+
+        if state.adx_bars < 2 * period - 1:
+            state.dx_sum += dx or 0.0
+        elif state.adx_bars == 2 * period - 1:
+            state.prev_adx = (state.dx_sum + (dx or 0.0)) / period
+        elif dx is not None:
+            state.prev_adx = (state.prev_adx * (period - 1) + dx) / period
+
+        adx = round(state.prev_adx, 4) if state.prev_adx is not None else None
+        return adx, round(plus_di, 4), round(minus_di, 4)
+
+    def _update_stoch(
+        self, state: IncrementalState, new_high: float, new_low: float, new_close: float
+    ) -> tuple[float | None, float | None]:
+        """Update slow Stochastic %K and %D.
+
+        Formula:
+            fast %K = 100 * (close - lowest low) / (highest high - lowest low)
+            %K = SMA(fast %K, 3), %D = SMA(%K, 3)
+
+        Args:
+            state: Current incremental state
+            new_high: New high price
+            new_low: New low price
+            new_close: New closing price
+
+        Returns:
+            Tuple of (stoch_k, stoch_d); None while warming up
+        """
+        state.stoch_high_window.push(new_high)
+        state.stoch_low_window.push(new_low)
+        if not state.stoch_high_window.full:
+            return None, None
+
+        highest = state.stoch_high_window.max()
+        lowest = state.stoch_low_window.min()
+        fast_k = 100 * (new_close - lowest) / (highest - lowest) if highest != lowest else 0.0
+
+        state.stoch_fastk_window.push(fast_k)
+        if not state.stoch_fastk_window.full:
+            return None, None
+        slow_k = state.stoch_fastk_window.mean()
+
+        state.stoch_slowk_window.push(slow_k)
+        if not state.stoch_slowk_window.full:
+            return round(slow_k, 4), None
+        return round(slow_k, 4), round(state.stoch_slowk_window.mean(), 4)
+
+    def _update_cci(self, state: IncrementalState, typical: float) -> float | None:
+        """Update Commodity Channel Index.
+
+        Formula:
+            CCI = (TP - SMA(TP)) / (0.015 * mean absolute deviation of TP)
+
+        Args:
+            state: Current incremental state
+            typical: New typical price ((high + low + close) / 3)
+
+        Returns:
+            Updated CCI value; None while warming up
+        """
+        state.cci_window.push(typical)
+        if not state.cci_window.full:
+            return None
+
+        deviation = typical - state.cci_window.mean()
+        mean_deviation = state.cci_window.mean_abs_deviation()
+        if deviation == 0 or mean_deviation == 0:
+            return 0.0
+        return round(deviation / (self.CCI_CONSTANT * mean_deviation), 4)
+
+    def _update_obv(self, state: IncrementalState, new_close: float, new_volume: float) -> float:
+        """Update On-Balance Volume (starts at the first bar's volume, as TA-Lib).
+
+        Args:
+            state: Current incremental state
+            new_close: New closing price
+            new_volume: New volume
+
+        Returns:
+            Updated OBV value
+        """
+        if state.obv is None or state.prev_close is None:
+            state.obv = new_volume
+        elif new_close > state.prev_close:
+            state.obv += new_volume
+        elif new_close < state.prev_close:
+            state.obv -= new_volume
+        return state.obv
+
+    def _update_mfi(
+        self, state: IncrementalState, typical: float, new_volume: float
+    ) -> float | None:
+        """Update Money Flow Index.
+
+        Formula:
+            money flow = TP * volume, positive when TP rises, negative when it falls
+            MFI = 100 * positive flow / (positive flow + negative flow)
+
+        Args:
+            state: Current incremental state
+            typical: New typical price ((high + low + close) / 3)
+            new_volume: New volume
+
+        Returns:
+            Updated MFI value; None while warming up
+        """
+        prev_typical = state.prev_typical
+        state.prev_typical = typical
+        if prev_typical is None:
+            return None
+
+        flow = typical * new_volume
+        state.mfi_pos_window.push(flow if typical > prev_typical else 0.0)
+        state.mfi_neg_window.push(flow if typical < prev_typical else 0.0)
+        if not state.mfi_pos_window.full:
+            return None
+
+        positive = state.mfi_pos_window.sum()
+        total = positive + state.mfi_neg_window.sum()
+        if total < 1:
+            return 0.0
+        return round(100 * positive / total, 4)
+
+    @_locked
     def get_cached_state(self, ticker: str) -> IncrementalState | None:
-        """Get cached state for a ticker.
+        """Get the in-memory state for a ticker.
+
+        Persisted snapshots are not loaded here: they are restored by the
+        ticker's next update, which checks them against the new bar and any
+        historical data given (or eagerly by restore_states()).
 
         Args:
             ticker: Stock ticker symbol
@@ -676,95 +1393,275 @@ class IncrementalCalculator:
         """
         return self._state_cache.get(ticker)
 
-    def clear_state(self, ticker: str | None = None):
+    @_locked
+    def restore_states(self, tickers: list[str] | None = None) -> int:
+        """Eagerly restore persisted snapshots into the state cache.
+
+        States already in memory are kept.
+
+        Args:
+            tickers: Tickers to restore (None restores all)
+
+        Returns:
+            Number of states restored
+        """
+        if self.state_store is None:
+            return 0
+
+        start_time = time.perf_counter()
+        restored = 0
+        for ticker, state in self.state_store.load_many(IncrementalState, tickers).items():
+            if ticker not in self._state_cache:
+                self._state_cache[ticker] = state
+                restored += 1
+
+        self.logger.info(
+            f"Restored {restored} incremental states in "
+            f"{(time.perf_counter() - start_time) * 1000:.1f}ms"
+        )
+        return restored
+
+    @_locked
+    def checkpoint(self) -> int:
+        """Persist every cached state in one transaction.
+
+        Returns:
+            Number of states written (0 without a state store)
+        """
+        if self.state_store is None:
+            return 0
+        return self.state_store.save_many(self._state_cache.values())
+
+    def _restore_state(
+        self, ticker: str, new_date: Any, historical_data: pd.DataFrame | None
+    ) -> IncrementalState | None:
+        """Restore a persisted snapshot if it directly precedes the new bar.
+
+        The snapshot must be older than the new bar and, when historical data
+        with dates is given, end on its last bar before the new one; otherwise
+        it is discarded and the state is rebuilt from history.
+        """
+        if self.state_store is None:
+            return None
+
+        state = self.state_store.load(ticker, IncrementalState)
+        if state is None:
+            return None
+
+        bar_date = as_date(new_date)
+        last_date = as_date(state.last_date)
+        if last_date >= bar_date:
+            self.logger.info(
+                f"[{ticker}] Persisted state ({last_date}) is not older than bar {bar_date}, "
+                "discarding"
+            )
+            return None
+
+        if historical_data is not None and "date" in historical_data.columns:
+            history_dates = pd.to_datetime(historical_data["date"]).dt.date
+            prior = history_dates[history_dates < bar_date]
+            if len(prior) and prior.max() != last_date:
+                self.logger.info(
+                    f"[{ticker}] Persisted state ({last_date}) does not match history "
+                    f"({prior.max()}), discarding"
+                )
+                return None
+
+        self._state_cache[ticker] = state
+        self.logger.debug(f"[{ticker}] Restored incremental state from {last_date}")
+        return state
+
+    def cached_tickers(self) -> list[str]:
+        """Tickers with a state in memory."""
+        return list(self._state_cache)
+
+    @_locked
+    def reseed_state(self, ticker: str, historical_data: pd.DataFrame) -> IncrementalState:
+        """Replace a ticker's state with one rebuilt from history.
+
+        The journal and any provisional bar are dropped, and the new state
+        is checkpointed.
+
+        Args:
+            ticker: Stock ticker symbol
+            historical_data: DataFrame with 220+ days ending on the last applied bar
+
+        Returns:
+            The rebuilt IncrementalState
+        """
+        state = self._initialize_state(ticker, historical_data)
+        self._state_cache[ticker] = state
+        self._journal.pop(ticker, None)
+        self._provisional.pop(ticker, None)
+
+        if self.state_store is not None:
+            try:
+                self.state_store.save(state)
+            except Exception as e:
+                self.logger.error(f"[{ticker}] Failed to checkpoint incremental state: {e}")
+
+        self.logger.info(f"[{ticker}] Reseeded incremental state from {len(historical_data)} days")
+        return state
+
+    @_locked
+    def clear_state(self, ticker: str | None = None, persisted: bool = False):
         """Clear cached state.
 
         Args:
             ticker: Optional ticker to clear. If None, clears all.
+            persisted: Also delete the snapshots in the state store (default:
+                False, so a later update can still restore them)
         """
         if ticker is None:
             self._state_cache.clear()
+            self._journal.clear()
+            self._provisional.clear()
             self.logger.info("Cleared all incremental state")
         elif ticker in self._state_cache:
             del self._state_cache[ticker]
+            self._journal.pop(ticker, None)
+            self._provisional.pop(ticker, None)
             self.logger.info(f"[{ticker}] Cleared incremental state")
 
+        if persisted and self.state_store is not None:
+            self.state_store.delete(ticker)
+
     def get_state_info(self) -> dict[str, Any]:
         """Get information about cached states.
 
         Returns:
             Dict with state information
         """
+        state_bytes = sum(state.memory_bytes() for state in self._state_cache.values())
+        journal_entries = sum(len(journal) for journal in self._journal.values())
+        journal_bytes = sum(
+            entry.state.memory_bytes() for journal in self._journal.values() for entry in journal
+        )
         return {
             "cached_tickers": list(self._state_cache.keys()),
             "total_cached": len(self._state_cache),
+            "persistent": self.state_store is not None,
+            "state_bytes": state_bytes,
+            "bytes_per_ticker": state_bytes / len(self._state_cache) if self._state_cache else 0,
+            "journal_size": self.journal_size,
+            "journal_entries": journal_entries,
+            "journal_bytes": journal_bytes,
         }
 
 
+def talib_reference(historical_data: pd.DataFrame) -> dict[str, np.ndarray]:
+    """Full TA-Lib series for every indicator with an incremental form.
+
+    Uses the same parameters as IndicatorCalculator and IncrementalCalculator.
+
+    Args:
+        historical_data: DataFrame with high/low/close/volume columns
+
+    Returns:
+        Dict mapping indicator name to its full series
+
+    Raises:
+        ImportError: If talib is not installed
+    """
+    import talib
+
+    closes = historical_data["close"].values.astype(float)
+    highs = historical_data["high"].values.astype(float)
+    lows = historical_data["low"].values.astype(float)
+    volumes = historical_data["volume"].values.astype(float)
+    calc = IncrementalCalculator
+
+    macd, macd_signal, macd_hist = talib.MACD(
+        closes,
+        fastperiod=calc.EMA_FAST,
+        slowperiod=calc.EMA_SLOW,
+        signalperiod=calc.MACD_SIGNAL_PERIOD,
+    )
+    stoch_k, stoch_d = talib.STOCH(
+        highs,
+        lows,
+        closes,
+        fastk_period=calc.STOCH_FASTK_PERIOD,
+        slowk_period=calc.STOCH_SLOWK_PERIOD,
+        slowd_period=calc.STOCH_SLOWD_PERIOD,
+    )
+    return {
+        "rsi": talib.RSI(closes, timeperiod=calc.RSI_PERIOD),
+        "sma_20": talib.SMA(closes, timeperiod=20),
+        "sma_50": talib.SMA(closes, timeperiod=50),
+        "sma_200": talib.SMA(closes, timeperiod=200),
+        "ema_12": talib.EMA(closes, timeperiod=calc.EMA_FAST),
+        "ema_26": talib.EMA(closes, timeperiod=calc.EMA_SLOW),
+        "macd": macd,
+        "macd_signal": macd_signal,
+        "macd_hist": macd_hist,
+        "atr": talib.ATR(highs, lows, closes, timeperiod=calc.ATR_PERIOD),
+        "adx": talib.ADX(highs, lows, closes, timeperiod=calc.ADX_PERIOD),
+        "plus_di": talib.PLUS_DI(highs, lows, closes, timeperiod=calc.ADX_PERIOD),
+        "minus_di": talib.MINUS_DI(highs, lows, closes, timeperiod=calc.ADX_PERIOD),
+        "stoch_k": stoch_k,
+        "stoch_d": stoch_d,
+        "cci": talib.CCI(highs, lows, closes, timeperiod=calc.CCI_PERIOD),
+        "momentum": talib.MOM(closes, timeperiod=calc.MOM_PERIOD),
+        "obv": talib.OBV(closes, volumes),
+        "mfi": talib.MFI(highs, lows, closes, volumes, timeperiod=calc.MFI_PERIOD),
+    }
+
+
 def validate_incremental_accuracy(
     calculator: IncrementalCalculator,
     ticker: str,
     historical_data: pd.DataFrame,
     tolerance: float = 0.1,
+    test_days: int = 10,
 ) -> dict[str, Any]:
     """Validate incremental calculation accuracy against full calculation.
 
-    Compares incremental RSI/SMA/EMA values against talib full calculation
-    to ensure accuracy within tolerance.
+    Initializes from the first 220 days, then compares each incremental
+    indicator over the following bars against the talib full calculation
+    (with IndicatorCalculator's parameters) to ensure accuracy within tolerance.
+
+    The bars are replayed on a separate calculator without a state store, so
+    the given calculator's cached and persisted states are left untouched.
 
     Args:
-        calculator: IncrementalCalculator instance
+        calculator: IncrementalCalculator instance (its journal size is used)
         ticker: Stock ticker symbol
-        historical_data: DataFrame with 220+ days of data
+        historical_data: DataFrame with 221+ days of data
         tolerance: Maximum allowed difference (default: 0.1)
+        test_days: Number of incremental bars to compare (default: 10)
 
     Returns:
         Dict with validation results:
         {
             "valid": bool,
-            "rsi_diff": float,
-            "sma_20_diff": float,
-            "ema_12_diff": float,
+            "rsi_max_diff": float,
+            "sma_20_max_diff": float,
+            "ema_12_max_diff": float,
+            "adx_max_diff": float,
+            ...
             "details": {...}
         }
     """
+    init_days = 220
+    if len(historical_data) <= init_days:
+        return {"valid": False, "error": f"Need more than {init_days} days of data"}
+
+    # Get full calculation for comparison
     try:
-        import talib
+        full = talib_reference(historical_data)
     except ImportError:
         return {"valid": False, "error": "talib not available for validation"}
 
-    # Initialize from first 200 days
-    init_data = historical_data.iloc[:200].copy()
-    test_data = historical_data.iloc[200:210].copy()  # Test 10 days
-
-    # Initialize calculator
-    calculator.clear_state(ticker)
+    init_data = historical_data.iloc[:init_days].copy()
+    test_data = historical_data.iloc[init_days : init_days + test_days].copy()
 
-    # Get full calculation for comparison
-    closes = historical_data["close"].values.astype(float)
-    full_rsi = talib.RSI(closes, timeperiod=14)
-    full_sma_20 = talib.SMA(closes, timeperiod=20)
-    full_ema_12 = talib.EMA(closes, timeperiod=12)
-
-    # Initialize
-    calculator.update_indicators(
-        ticker=ticker,
-        new_day_data={
-            "date": init_data["date"].iloc[-1] if "date" in init_data.columns else date.today(),
-            "open": float(init_data["open"].iloc[-1]),
-            "high": float(init_data["high"].iloc[-1]),
-            "low": float(init_data["low"].iloc[-1]),
-            "close": float(init_data["close"].iloc[-1]),
-            "volume": int(init_data["volume"].iloc[-1]),
-        },
-        historical_data=init_data,
-    )
+    # Private calculator, so validation never replaces live or persisted states
+    calculator = IncrementalCalculator(journal_size=calculator.journal_size)
 
-    # Test incremental updates
-    max_rsi_diff = 0.0
-    max_sma_diff = 0.0
-    max_ema_diff = 0.0
+    max_diffs = dict.fromkeys(full, 0.0)
 
+    # Initialize from the first init_days bars, then update bar by bar
     for i, (_idx, row) in enumerate(test_data.iterrows()):
         result = calculator.update_indicators(
             ticker=ticker,
@@ -776,29 +1673,27 @@ def validate_incremental_accuracy(
                 "close": float(row["close"]),
                 "volume": int(row["volume"]),
             },
+            historical_data=init_data if i == 0 else None,
         )
+        if result["method"] != "incremental":
+            return {"valid": False, "error": result.get("error", "Incremental update failed")}
 
         # Compare with full calculation
-        test_idx = 200 + i
-        if not np.isnan(full_rsi[test_idx]):
-            rsi_diff = abs(result["indicators"]["rsi"] - full_rsi[test_idx])
-            max_rsi_diff = max(max_rsi_diff, rsi_diff)
-
-        if not np.isnan(full_sma_20[test_idx]):
-            sma_diff = abs(result["indicators"]["sma_20"] - full_sma_20[test_idx])
-            max_sma_diff = max(max_sma_diff, sma_diff)
-
-        if not np.isnan(full_ema_12[test_idx]):
-            ema_diff = abs(result["indicators"]["ema_12"] - full_ema_12[test_idx])
-            max_ema_diff = max(max_ema_diff, ema_diff)
+        test_idx = init_days + i
+        for name, series in full.items():
+            value = result["indicators"].get(name)
+            if np.isnan(series[test_idx]):
+                continue
+            if value is None:
+                max_diffs[name] = float("inf")
+                continue
+            max_diffs[name] = max(max_diffs[name], float(abs(value - series[test_idx])))
 
-    valid = max_rsi_diff <= tolerance and max_sma_diff <= tolerance and max_ema_diff <= tolerance
+    valid = all(diff <= tolerance for diff in max_diffs.values())
 
     return {
         "valid": valid,
-        "rsi_max_diff": max_rsi_diff,
-        "sma_20_max_diff": max_sma_diff,
-        "ema_12_max_diff": max_ema_diff,
+        **{f"{name}_max_diff": diff for name, diff in max_diffs.items()},
         "tolerance": tolerance,
         "details": {
             "days_tested": len(test_data),
@@ -0,0 +1,360 @@
+"""Shared DSEX index context for signal generation, exit checks and regime tracking.
+
+IndexContextService loads the DSEX series once, then only appends bars for
+new trading dates. SMA 50/200 and Wilder ATR/ADX are maintained incrementally
+as bars arrive and an immutable IndexSnapshot is kept for every bar, so
+callers can read the index context for any date without touching the
+database.
+
+Example:
+    service = get_index_context_service()
+    snapshot = service.get_snapshot(date.today(), session)
+    if snapshot and snapshot.breakdown:
+        ...
+"""
+
+import bisect
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date
+
+import pandas as pd
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from src.database.models import WsDseDailyPrice
+
+logger = logging.getLogger(__name__)
+
+INDEX_TICKER = "DSEX"
+
+
+@dataclass(frozen=True)
+class IndexSnapshot:
+    """Immutable index context as of one trading date.
+
+    Attributes:
+        index_date: Date of the index bar
+        close: Index close
+        sma_50: 50-bar SMA (None until 50 bars are available)
+        sma_200: 200-bar SMA (None until 200 bars are available)
+        atr: Wilder ATR 14 (None until warmed up)
+        adx: Wilder ADX 14 (None until warmed up)
+        trend: "bullish", "bearish" or "neutral" from close/SMA alignment
+        breakdown: True when the index closed below its SMA 200
+        regime: "bull", "bear" or "sideways"
+    """
+
+    index_date: date
+    close: float
+    sma_50: float | None
+    sma_200: float | None
+    atr: float | None
+    adx: float | None
+    trend: str
+    breakdown: bool
+    regime: str
+
+    @property
+    def atr_ratio(self) -> float | None:
+        """ATR as a fraction of the index close."""
+        if self.atr is None or self.close == 0:
+            return None
+        return self.atr / self.close
+
+    def confidence_adjustment(self, signal_type: str) -> float:
+        """Confidence adjustment for a signal given the index trend.
+
+        Signals aligned with the index trend get a small boost; signals
+        against it are penalized. HOLD signals are unaffected.
+        """
+        if signal_type == "HOLD" or self.trend == "neutral":
+            return 0.0
+
+        aligned = (signal_type == "BUY") == (self.trend == "bullish")
+        return 0.05 if aligned else -0.10
+
+    def to_dict(self) -> dict:
+        """JSON-serializable representation for decision trees."""
+        return {
+            "index_date": self.index_date.isoformat(),
+            "close": self.close,
+            "sma_50": self.sma_50,
+            "sma_200": self.sma_200,
+            "atr": self.atr,
+            "adx": self.adx,
+            "trend": self.trend,
+            "breakdown": self.breakdown,
+            "regime": self.regime,
+        }
+
+
+@dataclass
+class _IndexState:
+    """Incrementally maintained SMA/ATR/ADX state for the index series."""
+
+    period: int = 14
+    window_50: deque = field(default_factory=lambda: deque(maxlen=50))
+    window_200: deque = field(default_factory=lambda: deque(maxlen=200))
+    sum_50: float = 0.0
+    sum_200: float = 0.0
+
+    prev_high: float | None = None
+    prev_low: float | None = None
+    prev_close: float | None = None
+
+    warmup_tr: list[float] = field(default_factory=list)
+    warmup_plus_dm: list[float] = field(default_factory=list)
+    warmup_minus_dm: list[float] = field(default_factory=list)
+    warmup_dx: list[float] = field(default_factory=list)
+
+    tr_smooth: float | None = None
+    plus_dm_smooth: float = 0.0
+    minus_dm_smooth: float = 0.0
+    atr: float | None = None
+    adx: float | None = None
+
+    def update(self, high: float, low: float, close: float) -> None:
+        """Apply one new bar."""
+        self.sum_50 += close - (self.window_50[0] if len(self.window_50) == 50 else 0.0)
+        self.window_50.append(close)
+        self.sum_200 += close - (self.window_200[0] if len(self.window_200) == 200 else 0.0)
+        self.window_200.append(close)
+
+        if self.prev_close is not None:
+            self._update_directional(high, low)
+
+        self.prev_high = high
+        self.prev_low = low
+        self.prev_close = close
+
+    def _update_directional(self, high: float, low: float) -> None:
+        """Update Wilder ATR/ADX from the new bar and the previous one."""
+        period = self.period
+        tr = max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+        up_move = high - self.prev_high
+        down_move = self.prev_low - low
+        plus_dm = up_move if up_move > down_move and up_move > 0 else 0.0
+        minus_dm = down_move if down_move > up_move and down_move > 0 else 0.0
+
+        if self.tr_smooth is None:
+            self.warmup_tr.append(tr)
+            self.warmup_plus_dm.append(plus_dm)
+            self.warmup_minus_dm.append(minus_dm)
+            if len(self.warmup_tr) < period:
+                return
+            self.tr_smooth = sum(self.warmup_tr)
+            self.plus_dm_smooth = sum(self.warmup_plus_dm)
+            self.minus_dm_smooth = sum(self.warmup_minus_dm)
+            self.atr = self.tr_smooth / period
+            self.warmup_tr.clear()
+            self.warmup_plus_dm.clear()
+            self.warmup_minus_dm.clear()
+        else:
+            self.tr_smooth = self.tr_smooth - self.tr_smooth / period + tr
+            self.plus_dm_smooth = self.plus_dm_smooth - self.plus_dm_smooth / period + plus_dm
+            self.minus_dm_smooth = self.minus_dm_smooth - self.minus_dm_smooth / period + minus_dm
+            self.atr = (self.atr * (period - 1) + tr) / period
+
+        if self.tr_smooth == 0:
+            return
+
+        plus_di = 100 * self.plus_dm_smooth / self.tr_smooth
+        minus_di = 100 * self.minus_dm_smooth / self.tr_smooth
+        di_sum = plus_di + minus_di
+        dx = 100 * abs(plus_di - minus_di) / di_sum if di_sum > 0 else 0.0
+
+        if self.adx is None:
+            self.warmup_dx.append(dx)
+            if len(self.warmup_dx) == period:
+                self.adx = sum(self.warmup_dx) / period
+                self.warmup_dx.clear()
+        else:
+            self.adx = (self.adx * (period - 1) + dx) / period
+
+    def snapshot(self, index_date: date) -> IndexSnapshot:
+        """Build an immutable snapshot of the current state."""
+        close = self.prev_close
+        sma_50 = self.sum_50 / 50 if len(self.window_50) == 50 else None
+        sma_200 = self.sum_200 / 200 if len(self.window_200) == 200 else None
+
+        if sma_50 is not None and sma_200 is not None and close > sma_50 > sma_200:
+            trend = "bullish"
+        elif sma_50 is not None and sma_200 is not None and close < sma_50 < sma_200:
+            trend = "bearish"
+        elif sma_50 is not None and sma_200 is None:
+            trend = "bullish" if close > sma_50 else "bearish"
+        else:
+            trend = "neutral"
+
+        if self.adx is not None and self.adx >= 25 and trend == "bullish":
+            regime = "bull"
+        elif self.adx is not None and self.adx >= 25 and trend == "bearish":
+            regime = "bear"
+        else:
+            regime = "sideways"
+
+        return IndexSnapshot(
+            index_date=index_date,
+            close=close,
+            sma_50=sma_50,
+            sma_200=sma_200,
+            atr=self.atr,
+            adx=self.adx,
+            trend=trend,
+            breakdown=sma_200 is not None and close < sma_200,
+            regime=regime,
+        )
+
+
+class IndexContextService:
+    """Cached DSEX series with incrementally maintained index context.
+
+    The series is loaded in full on first use; afterwards only bars newer
+    than the last loaded date are fetched, and the database is checked for
+    new dates at most once every refresh_check_seconds.
+    """
+
+    DEFAULT_REFRESH_CHECK_SECONDS = 300
+
+    def __init__(
+        self,
+        index_ticker: str = INDEX_TICKER,
+        refresh_check_seconds: float = DEFAULT_REFRESH_CHECK_SECONDS,
+    ):
+        """Initialize index context service.
+
+        Args:
+            index_ticker: Index symbol in ws_dse_daily_prices (default: DSEX)
+            refresh_check_seconds: Minimum interval between new-date checks
+        """
+        self.index_ticker = index_ticker
+        self.refresh_check_seconds = refresh_check_seconds
+
+        self._state = _IndexState()
+        # (dates, bars, snapshots), replaced as a whole on refresh so readers
+        # never see one list ahead of the others
+        self._series: tuple[
+            list[date], list[tuple[float, float, float, float, int]], list[IndexSnapshot]
+        ] = ([], [], [])
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    def get_snapshot(self, target_date: date, session: Session) -> IndexSnapshot | None:
+        """Get the index context as of a date.
+
+        Args:
+            target_date: Date to get the context for
+            session: Database session (only used when new bars may exist)
+
+        Returns:
+            Snapshot for the latest index bar on or before target_date, or
+            None if no index data is available
+        """
+        self.refresh(session)
+
+        dates, _, snapshots = self._series
+        position = bisect.bisect_right(dates, target_date)
+        if position == 0:
+            return None
+        return snapshots[position - 1]
+
+    def get_history(self, session: Session, limit: int | None = None) -> pd.DataFrame:
+        """Get the cached index series as an OHLCV DataFrame.
+
+        Args:
+            session: Database session (only used when new bars may exist)
+            limit: Optional number of most recent bars to return
+
+        Returns:
+            DataFrame with date/open/high/low/close/volume columns in
+            chronological order
+        """
+        self.refresh(session)
+
+        dates, bars, _ = self._series
+        if limit:
+            dates, bars = dates[-limit:], bars[-limit:]
+        return pd.DataFrame(
+            {
+                "date": dates,
+                "open": [bar[0] for bar in bars],
+                "high": [bar[1] for bar in bars],
+                "low": [bar[2] for bar in bars],
+                "close": [bar[3] for bar in bars],
+                "volume": [bar[4] for bar in bars],
+            }
+        )
+
+    def refresh(self, session: Session, force: bool = False) -> int:
+        """Append index bars newer than the last loaded date.
+
+        Args:
+            session: Database session
+            force: Skip the refresh throttle
+
+        Returns:
+            Number of new bars applied
+        """
+        now = time.monotonic()
+        if not force and self._series[0] and now - self._last_check < self.refresh_check_seconds:
+            return 0
+
+        with self._lock:
+            dates, bars, snapshots = self._series
+            if not force and dates and now - self._last_check < self.refresh_check_seconds:
+                return 0
+            self._last_check = now
+
+            last_date = dates[-1] if dates else None
+            if last_date is not None:
+                latest = (
+                    session.query(func.max(WsDseDailyPrice.txn_date))
+                    .filter(WsDseDailyPrice.txn_scrip == self.index_ticker)
+                    .scalar()
+                )
+                if latest is None or latest <= last_date:
+                    return 0
+
+            query = session.query(
+                WsDseDailyPrice.txn_date,
+                WsDseDailyPrice.txn_open,
+                WsDseDailyPrice.txn_high,
+                WsDseDailyPrice.txn_low,
+                WsDseDailyPrice.txn_close,
+                WsDseDailyPrice.txn_volume,
+            ).filter(WsDseDailyPrice.txn_scrip == self.index_ticker)
+            if last_date is not None:
+                query = query.filter(WsDseDailyPrice.txn_date > last_date)
+            rows = query.order_by(WsDseDailyPrice.txn_date).all()
+            if not rows:
+                return 0
+
+            dates, bars, snapshots = list(dates), list(bars), list(snapshots)
+            for txn_date, open_, high, low, close, volume in rows:
+                bar = (float(open_), float(high), float(low), float(close), int(volume or 0))
+                self._state.update(bar[1], bar[2], bar[3])
+                dates.append(txn_date)
+                bars.append(bar)
+                snapshots.append(self._state.snapshot(txn_date))
+            self._series = (dates, bars, snapshots)
+
+            logger.info(
+                f"Index context for {self.index_ticker}: applied {len(rows)} bars "
+                f"through {dates[-1]}"
+            )
+            return len(rows)
+
+
+_index_context_service: IndexContextService | None = None
+
+
+def get_index_context_service() -> IndexContextService:
+    """Get the process-wide IndexContextService singleton."""
+    global _index_context_service
+    if _index_context_service is None:
+        _index_context_service = IndexContextService()
+    return _index_context_service
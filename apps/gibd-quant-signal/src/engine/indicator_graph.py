@@ -0,0 +1,551 @@
+"""Indicator dependency graph with shared intermediates.
+
+Indicators are declared as nodes with named inputs and outputs. An
+IndicatorGraph resolves the nodes needed for a set of target values (in
+dependency order, cached per target set) and evaluates them with one value
+table per ticker, so an intermediate shared by several indicators (true
+range, EMA 12/26, the 20-bar SMA behind SMA 20 and the Bollinger middle
+band, gains/losses) is computed exactly once. Adding an indicator means
+adding a node (and, for IndicatorCalculator, an entry in TOOL_OUTPUTS).
+
+Two graphs are defined:
+- TALIB_GRAPH: TA-Lib conventions, used by IndicatorCalculator. Composite
+  values are split only where the parts reproduce TA-Lib exactly (Bollinger
+  Bands from SMA 20 and STDDEV 20, NATR from ATR); MACD keeps TA-Lib's own
+  EMAs, which are seeded at the slow EMA's start and differ from standalone
+  EMA 12/26 on early bars.
+- FALLBACK_GRAPH: the simple-smoothing kernels behind the
+  AdaptiveSignalEngine price fallbacks (latest values only).
+
+Example:
+    sources = ohlcv_sources(data)
+    values = TALIB_GRAPH.evaluate(sources, tool_targets(["macd", "bbands", "atr"]))
+    values["bb_upper"]  # np.ndarray
+"""
+
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import talib
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.engine import indicator_kernels as kernels
+
+logger = logging.getLogger(__name__)
+
+OHLCV_SOURCES = ("open", "high", "low", "close", "volume")
+
+
+@dataclass(slots=True)
+class IndicatorNode:
+    """One computation step of an indicator graph.
+
+    Attributes:
+        name: Node name
+        inputs: Names of the values passed to compute, in order
+        compute: Callable taking the input values; returns one value, or a
+            tuple with one value per output
+        outputs: Names of the values produced (default: (name,))
+        quiet: Log failures at DEBUG instead of WARNING (candlestick patterns)
+    """
+
+    name: str
+    inputs: tuple[str, ...]
+    compute: Callable[..., Any]
+    outputs: tuple[str, ...] = ()
+    quiet: bool = False
+
+    def __post_init__(self):
+        if not self.outputs:
+            self.outputs = (self.name,)
+
+
+class IndicatorGraph:
+    """Dependency graph of indicator nodes over named source arrays.
+
+    Attributes:
+        sources: Names of the values supplied by the caller
+    """
+
+    MAX_CACHED_PLANS = 256
+
+    def __init__(self, sources: Iterable[str], nodes: Iterable[IndicatorNode] = ()):
+        """Initialize graph.
+
+        Args:
+            sources: Names of the values supplied by the caller
+            nodes: Initial nodes (see add())
+        """
+        self.sources = tuple(sources)
+        self._nodes: dict[str, IndicatorNode] = {}
+        self._producers: dict[str, IndicatorNode] = {}
+        self._plans: dict[tuple[str, ...], tuple[IndicatorNode, ...]] = {}
+        self._plan_sources: dict[tuple[str, ...], tuple[str, ...]] = {}
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node: IndicatorNode) -> None:
+        """Register a node.
+
+        Inputs may refer to nodes added later; they are checked by resolve().
+
+        Raises:
+            ValueError: If the node name or one of its outputs is already defined
+        """
+        if node.name in self._nodes:
+            raise ValueError(f"Duplicate indicator node: {node.name}")
+        for output in node.outputs:
+            if output in self._producers or output in self.sources:
+                raise ValueError(f"Duplicate indicator value: {output}")
+
+        self._nodes[node.name] = node
+        for output in node.outputs:
+            self._producers[output] = node
+        self._plans.clear()
+        self._plan_sources.clear()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._producers or name in self.sources
+
+    def resolve(self, targets: Iterable[str]) -> tuple[IndicatorNode, ...]:
+        """Nodes needed for the target values, each once, dependencies first.
+
+        Args:
+            targets: Value names
+
+        Returns:
+            Nodes in evaluation order
+
+        Raises:
+            ValueError: If a name is unknown or the graph has a cycle
+        """
+        key = tuple(targets)
+        plan = self._plans.get(key)
+        if plan is not None:
+            return plan
+
+        order: list[IndicatorNode] = []
+        done: set[str] = set()
+        visiting: set[str] = set()
+
+        def visit(value: str, path: tuple[str, ...]) -> None:
+            if value in self.sources:
+                return
+            node = self._producers.get(value)
+            if node is None:
+                via = f" (needed by {path[-1]})" if path else ""
+                raise ValueError(f"Unknown indicator value: {value}{via}")
+            if node.name in done:
+                return
+            if node.name in visiting:
+                raise ValueError(f"Indicator graph cycle: {' -> '.join((*path, node.name))}")
+
+            visiting.add(node.name)
+            for name in node.inputs:
+                visit(name, (*path, node.name))
+            visiting.discard(node.name)
+            done.add(node.name)
+            order.append(node)
+
+        for value in key:
+            visit(value, ())
+
+        plan = tuple(order)
+        if len(self._plans) >= self.MAX_CACHED_PLANS:
+            self._plans.clear()
+            self._plan_sources.clear()
+        self._plans[key] = plan
+        return plan
+
+    def required_sources(self, targets: Iterable[str]) -> tuple[str, ...]:
+        """Source names read by the nodes needed for the targets (in source order)."""
+        key = tuple(targets)
+        needed = self._plan_sources.get(key)
+        if needed is None:
+            names = {name for node in self.resolve(key) for name in node.inputs}
+            names.update(key)
+            needed = tuple(source for source in self.sources if source in names)
+            self._plan_sources[key] = needed
+        return needed
+
+    def evaluate(
+        self, sources: dict[str, Any], targets: Iterable[str], ticker: str = ""
+    ) -> dict[str, Any]:
+        """Compute the target values, sharing intermediates.
+
+        A node that raises is logged and skipped together with everything
+        that depends on it; nodes whose inputs are missing from `sources`
+        are skipped silently.
+
+        Args:
+            sources: Source values by name (e.g. ohlcv_sources() output)
+            targets: Value names to compute
+            ticker: Stock ticker symbol for logging
+
+        Returns:
+            Dict mapping each computed target name to its value, in target order
+        """
+        targets = tuple(targets)
+        values = dict(sources)
+
+        for node in self.resolve(targets):
+            try:
+                args = [values[name] for name in node.inputs]
+            except KeyError:
+                continue
+            try:
+                result = node.compute(*args)
+            except Exception as e:
+                level = logging.DEBUG if node.quiet else logging.WARNING
+                logger.log(level, f"[{ticker}] {node.name} calculation failed: {e}")
+                continue
+
+            if len(node.outputs) == 1:
+                values[node.outputs[0]] = result
+            else:
+                values.update(zip(node.outputs, result, strict=True))
+
+        return {name: values[name] for name in targets if name in values}
+
+
+def ohlcv_sources(data: pd.DataFrame, columns: Iterable[str] = OHLCV_SOURCES) -> dict:
+    """Contiguous float64 source arrays from an OHLCV DataFrame (one cast per column).
+
+    Pass IndicatorGraph.required_sources() as `columns` to skip unused columns.
+    """
+    return {
+        column: np.ascontiguousarray(data[column].values, dtype=np.float64) for column in columns
+    }
+
+
+def latest(series) -> float | None:
+    """Latest valid value of a 1-D or single-row series (None if there is none)."""
+    value = kernels.last_valid(series)[0]
+    return None if np.isnan(value) else float(value)
+
+
+# ---------------------------------------------------------------------------
+# TA-Lib graph (IndicatorCalculator)
+# ---------------------------------------------------------------------------
+
+PATTERN_TOOLS = (
+    "cdl2crows",
+    "cdl3blackcrows",
+    "cdl3inside",
+    "cdl3linestrike",
+    "cdl3outside",
+    "cdl3starsinsouth",
+    "cdl3whitesoldiers",
+    "cdlabandonedbaby",
+    "cdladvanceblock",
+    "cdlbelthold",
+    "cdlclosingmarubozu",
+    "cdlconcealbabyswall",
+    "cdlcounterattack",
+    "cdldarkcloudcover",
+    "cdldoji",
+    "cdldojistar",
+    "cdldragonflydoji",
+    "cdlengulfing",
+    "cdleveningdojistar",
+    "cdleveningstar",
+    "cdlgapsidesidewhite",
+    "cdlhammer",
+    "cdlhangingman",
+    "cdlharami",
+    "cdlharamicross",
+    "cdlhighwave",
+    "cdlinvertedhammer",
+    "cdlkicking",
+    "cdlkickingbylength",
+    "cdlkickingbyvolume",
+    "cdlladderbottom",
+    "cdlmorningdojistar",
+    "cdlmorningstar",
+    "cdlonneck",
+    "cdlpiercing",
+    "cdlrickshaw",
+    "cdlrisefall3methods",
+    "cdlseparatinglines",
+    "cdlshootingstar",
+    "cdltakuri",
+    "cdltasukigap",
+    "cdlthrusting",
+    "cdlupsidegap2crows",
+)
+
+FIBONACCI_LEVELS = (
+    ("fib_236", 0.236),
+    ("fib_382", 0.382),
+    ("fib_500", 0.5),
+    ("fib_618", 0.618),
+    ("fib_786", 0.786),
+)
+
+# Values produced per IndicatorCalculator tool, in result order
+TOOL_OUTPUTS: dict[str, tuple[str, ...]] = {
+    "rsi": ("rsi",),
+    "macd": ("macd", "macd_signal", "macd_hist"),
+    "stoch": ("stoch_k", "stoch_d"),
+    "cci": ("cci",),
+    "mom": ("momentum",),
+    "sma_20": ("sma_20",),
+    "sma_50": ("sma_50",),
+    "sma_200": ("sma_200",),
+    "ema": ("ema_12", "ema_26"),
+    "bbands": ("bb_upper", "bb_middle", "bb_lower"),
+    "keltner_channels": ("keltner_upper", "keltner_middle", "keltner_lower"),
+    "obv": ("obv",),
+    "ad": ("ad",),
+    "adosc": ("adosc",),
+    "mfi": ("mfi",),
+    "atr": ("atr",),
+    "natr": ("natr",),
+    "trange": ("trange",),
+    "pivot_points": ("pivot", "r1", "s1"),
+    "fibonacci_retracement": (
+        "fib_0",
+        *(name for name, _ in FIBONACCI_LEVELS),
+        "fib_100",
+    ),
+    "adx": ("adx",),
+    "aroon": ("aroon_up", "aroon_down"),
+    "ppo": ("ppo",),
+    "ht_dcperiod": ("ht_dcperiod",),
+    "ht_trendmode": ("ht_trendmode",),
+    **{pattern: (pattern,) for pattern in PATTERN_TOOLS if hasattr(talib, pattern.upper())},
+}
+
+
+def tool_targets(tools: Iterable[str] | None = None) -> tuple[str, ...]:
+    """Value names for IndicatorCalculator tools, in result order.
+
+    Args:
+        tools: Tool names (None: all tools); unknown tools are ignored
+
+    Returns:
+        Tuple of value names
+    """
+    return _tool_targets(None if tools is None else frozenset(tools))
+
+
+@lru_cache(maxsize=256)
+def _tool_targets(tools: frozenset[str] | None) -> tuple[str, ...]:
+    return tuple(
+        output
+        for tool, outputs in TOOL_OUTPUTS.items()
+        if tools is None or tool in tools
+        for output in outputs
+    )
+
+
+def _rolling(values: np.ndarray, window: int, reduce: Callable) -> np.ndarray:
+    """Rolling reduction (NaN for the first window - 1 bars, like pandas rolling)."""
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        reduce(sliding_window_view(values, window), axis=-1, out=out[window - 1 :])
+    return out
+
+
+def _natr(atr: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """TA-Lib NATR from ATR: (atr / close) * 100, 0 where close is ~0."""
+    near_zero = np.abs(close) < 1e-8
+    if not near_zero.any():
+        return (atr / close) * 100.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        natr = (atr / close) * 100.0
+    return np.where(near_zero & ~np.isnan(atr), 0.0, natr)
+
+
+def _bands(middle: np.ndarray, width: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(upper, middle, lower) = middle +/- width."""
+    return middle + width, middle, middle - width
+
+
+def _pivots(typical: np.ndarray, high: np.ndarray, low: np.ndarray) -> tuple:
+    return typical, 2 * typical - low, 2 * typical - high
+
+
+def _fibonacci(period_high: np.ndarray, period_low: np.ndarray) -> tuple:
+    diff = period_high - period_low
+    levels = (period_low + diff * ratio for _, ratio in FIBONACCI_LEVELS)
+    return (period_low, *levels, period_high)
+
+
+def build_talib_graph() -> IndicatorGraph:
+    """Graph of the IndicatorCalculator tools."""
+    graph = IndicatorGraph(OHLCV_SOURCES)
+    hlc = ("high", "low", "close")
+    hlcv = ("high", "low", "close", "volume")
+    for node in (
+        # Momentum
+        IndicatorNode("rsi", ("close",), lambda c: talib.RSI(c, timeperiod=14)),
+        IndicatorNode(
+            "macd",
+            ("close",),
+            lambda c: talib.MACD(c, fastperiod=12, slowperiod=26, signalperiod=9),
+            outputs=("macd", "macd_signal", "macd_hist"),
+        ),
+        IndicatorNode(
+            "stoch",
+            hlc,
+            lambda h, l, c: talib.STOCH(h, l, c, fastk_period=5, slowk_period=3, slowd_period=3),
+            outputs=("stoch_k", "stoch_d"),
+        ),
+        IndicatorNode("cci", hlc, lambda h, l, c: talib.CCI(h, l, c, timeperiod=20)),
+        IndicatorNode("momentum", ("close",), lambda c: talib.MOM(c, timeperiod=10)),
+        # Overlap
+        IndicatorNode("sma_20", ("close",), lambda c: talib.SMA(c, timeperiod=20)),
+        IndicatorNode("sma_50", ("close",), lambda c: talib.SMA(c, timeperiod=50)),
+        IndicatorNode("sma_200", ("close",), lambda c: talib.SMA(c, timeperiod=200)),
+        IndicatorNode("ema_12", ("close",), lambda c: talib.EMA(c, timeperiod=12)),
+        IndicatorNode("ema_20", ("close",), lambda c: talib.EMA(c, timeperiod=20)),
+        IndicatorNode("ema_26", ("close",), lambda c: talib.EMA(c, timeperiod=26)),
+        IndicatorNode("stddev_20", ("close",), lambda c: talib.STDDEV(c, timeperiod=20)),
+        IndicatorNode(
+            "bbands",
+            ("sma_20", "stddev_20"),
+            lambda middle, std: _bands(middle, std * 2),
+            outputs=("bb_upper", "bb_middle", "bb_lower"),
+        ),
+        IndicatorNode("atr_10", hlc, lambda h, l, c: talib.ATR(h, l, c, timeperiod=10)),
+        IndicatorNode(
+            "keltner_channels",
+            ("ema_20", "atr_10"),
+            _bands,
+            outputs=("keltner_upper", "keltner_middle", "keltner_lower"),
+        ),
+        # Volume
+        IndicatorNode("obv", ("close", "volume"), talib.OBV),
+        IndicatorNode("ad", hlcv, talib.AD),
+        IndicatorNode(
+            "adosc",
+            hlcv,
+            lambda h, l, c, v: talib.ADOSC(h, l, c, v, fastperiod=3, slowperiod=10),
+        ),
+        IndicatorNode("mfi", hlcv, lambda h, l, c, v: talib.MFI(h, l, c, v, timeperiod=14)),
+        # Volatility
+        IndicatorNode("atr", hlc, lambda h, l, c: talib.ATR(h, l, c, timeperiod=14)),
+        IndicatorNode("natr", ("atr", "close"), _natr),
+        IndicatorNode("trange", hlc, talib.TRANGE),
+        # Support/resistance
+        IndicatorNode("typical_price", hlc, lambda h, l, c: (h + l + c) / 3),
+        IndicatorNode(
+            "pivot_points",
+            ("typical_price", "high", "low"),
+            _pivots,
+            outputs=("pivot", "r1", "s1"),
+        ),
+        IndicatorNode("high_20", ("high",), lambda h: _rolling(h, 20, np.max)),
+        IndicatorNode("low_20", ("low",), lambda l: _rolling(l, 20, np.min)),
+        IndicatorNode(
+            "fibonacci_retracement",
+            ("high_20", "low_20"),
+            _fibonacci,
+            outputs=TOOL_OUTPUTS["fibonacci_retracement"],
+        ),
+        # Trend
+        IndicatorNode("adx", hlc, lambda h, l, c: talib.ADX(h, l, c, timeperiod=14)),
+        IndicatorNode(
+            "aroon",
+            ("high", "low"),
+            lambda h, l: talib.AROON(h, l, timeperiod=25)[::-1],
+            outputs=("aroon_up", "aroon_down"),
+        ),
+        IndicatorNode(
+            "ppo", ("close",), lambda c: talib.PPO(c, fastperiod=12, slowperiod=26, matype=0)
+        ),
+        # Cycle
+        IndicatorNode("ht_dcperiod", ("close",), talib.HT_DCPERIOD),
+        IndicatorNode("ht_trendmode", ("close",), talib.HT_TRENDMODE),
+    ):
+        graph.add(node)
+
+    for pattern in PATTERN_TOOLS:
+        if hasattr(talib, pattern.upper()):
+            compute = getattr(talib, pattern.upper())
+            graph.add(IndicatorNode(pattern, ("open", "high", "low", "close"), compute, quiet=True))
+
+    return graph
+
+
+# ---------------------------------------------------------------------------
+# Fallback graph (AdaptiveSignalEngine price fallbacks)
+# ---------------------------------------------------------------------------
+
+FALLBACK_SOURCES = ("high", "low", "close")
+
+# Value -> minimum bars, as in the AdaptiveSignalEngine._calculate_*_from_prices checks
+FALLBACK_MIN_BARS = {
+    "rsi": 15,
+    "macd_histogram": 35,
+    "sma_20": 20,
+    "sma_50": 50,
+    "adx": 28,
+    "atr": 15,
+}
+
+
+def _fallback_rsi(gains: np.ndarray, losses: np.ndarray) -> float | None:
+    if gains.shape[-1] < FALLBACK_MIN_BARS["rsi"]:
+        return None
+    averages = (kernels.sma(values[:, -14:], 14) for values in (gains, losses))
+    return latest(kernels.rsi_from_averages(*averages))
+
+
+def _fallback_macd_histogram(ema_12: np.ndarray, ema_26: np.ndarray) -> float | None:
+    if ema_12.shape[-1] < FALLBACK_MIN_BARS["macd_histogram"]:
+        return None
+    return latest(kernels.macd_from_emas(ema_12, ema_26, 9)[2])
+
+
+def _fallback_sma(period: int) -> Callable[[np.ndarray], float | None]:
+    def compute(close: np.ndarray) -> float | None:
+        if len(close) < period:
+            return None
+        return latest(kernels.sma(close[-period:], period))
+
+    return compute
+
+
+def _fallback_atr(high, low, close, tr) -> float | None:
+    if len(close) < FALLBACK_MIN_BARS["atr"]:
+        return None
+    return latest(kernels.atr(high, low, close, 14, tr=tr))
+
+
+def _fallback_adx(high, low, close, tr) -> float | None:
+    if len(close) < FALLBACK_MIN_BARS["adx"]:
+        return None
+    return latest(kernels.adx(high, low, close, 14, tr=tr))
+
+
+def build_fallback_graph() -> IndicatorGraph:
+    """Graph of the latest-value price fallbacks (simple smoothing, as the engine helpers)."""
+    hlc = ("high", "low", "close")
+    return IndicatorGraph(
+        FALLBACK_SOURCES,
+        (
+            IndicatorNode("true_range", hlc, kernels.true_range),
+            IndicatorNode(
+                "price_changes", ("close",), kernels.gains_losses, outputs=("gains", "losses")
+            ),
+            IndicatorNode("ema_12", ("close",), lambda c: kernels.ema(c, 12)),
+            IndicatorNode("ema_26", ("close",), lambda c: kernels.ema(c, 26)),
+            IndicatorNode("rsi", ("gains", "losses"), _fallback_rsi),
+            IndicatorNode("macd_histogram", ("ema_12", "ema_26"), _fallback_macd_histogram),
+            IndicatorNode("sma_20", ("close",), _fallback_sma(20)),
+            IndicatorNode("sma_50", ("close",), _fallback_sma(50)),
+            IndicatorNode("atr", (*hlc, "true_range"), _fallback_atr),
+            IndicatorNode("adx", (*hlc, "true_range"), _fallback_adx),
+        ),
+    )
+
+
+TALIB_GRAPH = build_talib_graph()
+FALLBACK_GRAPH = build_fallback_graph()
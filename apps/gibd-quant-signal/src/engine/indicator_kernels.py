@@ -0,0 +1,327 @@
+"""Shared 2-D NumPy kernels for RSI, MACD, SMA, ATR and ADX.
+
+Every kernel takes (tickers x bars) float64 arrays (a 1-D array is treated
+as a single row) and returns full indicator series of the same shape, so one
+call covers a whole universe. Rows may be NaN-padded on the left for short
+histories, as in PricePanel; recursive kernels seed each row at its own first
+valid bar and leave padded bars NaN.
+
+Two smoothing conventions are supported:
+- "simple": rolling arithmetic means, as in the AdaptiveSignalEngine price
+  fallbacks and the bulk panel path
+- "wilder": Wilder's recursive smoothing seeded with the simple average of
+  the first `period` values, as in TA-Lib and IncrementalCalculator (ADX
+  uses TA-Lib's Wilder running sums for TR and directional movement)
+
+Example:
+    close = panel.close  # (n_tickers x n_bars)
+    rsi = kernels.rsi(close, 14)
+    latest_rsi = kernels.last_valid(rsi)  # One value per ticker
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+SMOOTHING_METHODS = ("simple", "wilder")
+
+# Seeding of recursive averages: first valid value (pandas ewm adjust=False)
+# or simple average of the first `period` values (TA-Lib)
+SEED_METHODS = ("first", "sma")
+
+
+def as_2d(values) -> np.ndarray:
+    """View input as a (rows x bars) float64 array (1-D input becomes one row)."""
+    array = np.asarray(values, dtype=np.float64)
+    return array.reshape(1, -1) if array.ndim == 1 else array
+
+
+def _check_smoothing(smoothing: str) -> None:
+    if smoothing not in SMOOTHING_METHODS:
+        raise ValueError(f"Invalid smoothing: {smoothing}. Must be one of {SMOOTHING_METHODS}")
+
+
+def shift(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    """Shift bars to the right along the time axis (NaN fill)."""
+    values = as_2d(values)
+    shifted = np.full(values.shape, np.nan)
+    if periods < values.shape[1]:
+        shifted[:, periods:] = values[:, : values.shape[1] - periods]
+    return shifted
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling mean along the time axis (NaN if any value in the window is NaN)."""
+    values = as_2d(values)
+    out = np.full(values.shape, np.nan)
+    if values.shape[1] >= window:
+        sliding_window_view(values, window, axis=1).mean(axis=-1, out=out[:, window - 1 :])
+    return out
+
+
+def last_valid(values: np.ndarray) -> np.ndarray:
+    """Latest non-NaN value per row (NaN if the row has none)."""
+    values = as_2d(values)
+    if values.shape[1] == 0:
+        return np.full(values.shape[0], np.nan)
+    mask = ~np.isnan(values)
+    last_idx = values.shape[1] - 1 - np.argmax(mask[:, ::-1], axis=1)
+    picked = values[np.arange(values.shape[0]), last_idx]
+    return np.where(mask.any(axis=1), picked, np.nan)
+
+
+def recursive_mean(values: np.ndarray, alpha: float, period: int, seed: str = "sma") -> np.ndarray:
+    """Exponentially weighted mean with per-row seeding, in one pass over bars.
+
+    Args:
+        values: (rows x bars) input
+        alpha: Weight of the newest value (2/(span+1) for EMA, 1/period for Wilder)
+        period: Number of values averaged for the "sma" seed
+        seed: "first" (start at each row's first valid value) or "sma"
+            (start at the mean of each row's first `period` valid values)
+
+    Returns:
+        (rows x bars) smoothed series (NaN before the seed bar)
+    """
+    if seed not in SEED_METHODS:
+        raise ValueError(f"Invalid seed: {seed}. Must be one of {SEED_METHODS}")
+
+    values = as_2d(values)
+    rows, bars = values.shape
+    out = np.full(values.shape, np.nan)
+    current = np.full(rows, np.nan)
+    seen = np.zeros(rows, dtype=np.int64)
+    total = np.zeros(rows)
+
+    for col in range(bars):
+        x = values[:, col]
+        valid = ~np.isnan(x)
+        started = ~np.isnan(current)
+
+        update = started & valid
+        current[update] += alpha * (x[update] - current[update])
+
+        pending = ~started & valid
+        if pending.any():
+            if seed == "first":
+                current[pending] = x[pending]
+            else:
+                seen[pending] += 1
+                total[pending] += x[pending]
+                ready = pending & (seen == period)
+                current[ready] = total[ready] / period
+
+        out[:, col] = current
+
+    return out
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average series."""
+    return rolling_mean(values, period)
+
+
+def ema(values: np.ndarray, span: int, seed: str = "first") -> np.ndarray:
+    """Exponential moving average series (alpha = 2 / (span + 1))."""
+    return recursive_mean(values, 2.0 / (span + 1), span, seed)
+
+
+def wilder(values: np.ndarray, period: int) -> np.ndarray:
+    """Wilder's smoothing series, seeded with the mean of the first `period` values."""
+    return recursive_mean(values, 1.0 / period, period, seed="sma")
+
+
+def _smooth(values: np.ndarray, period: int, smoothing: str) -> np.ndarray:
+    return rolling_mean(values, period) if smoothing == "simple" else wilder(values, period)
+
+
+def wilder_sum(values: np.ndarray, period: int) -> np.ndarray:
+    """Wilder's running sum as in TA-Lib's directional movement indicators.
+
+    Each row starts from the plain sum of its first (period - 1) valid values;
+    every later value updates S = S - S / period + value. The series is NaN
+    until the first update (the period-th valid value).
+    """
+    values = as_2d(values)
+    rows, bars = values.shape
+    out = np.full(values.shape, np.nan)
+    current = np.zeros(rows)
+    seen = np.zeros(rows, dtype=np.int64)
+
+    for col in range(bars):
+        x = values[:, col]
+        valid = ~np.isnan(x)
+        warming = valid & (seen < period - 1)
+        current[warming] += x[warming]
+        update = valid & ~warming
+        current[update] += x[update] - current[update] / period
+        seen[valid] += 1
+        out[update, col] = current[update]
+
+    return out
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """True range series.
+
+    The first bar of each row has no previous close and falls back to
+    high - low (like pandas max(axis=1) skipping NaN).
+    """
+    high, low, close = as_2d(high), as_2d(low), as_2d(close)
+    prev_close = shift(close)
+    return np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+
+
+def gains_losses(close: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Bar-to-bar gains and losses (both >= 0; NaN where there is no previous close)."""
+    close = as_2d(close)
+    delta = close - shift(close)
+    with np.errstate(invalid="ignore"):
+        gains = np.where(delta > 0, delta, np.where(np.isnan(delta), np.nan, 0.0))
+        losses = np.where(delta < 0, -delta, np.where(np.isnan(delta), np.nan, 0.0))
+    return gains, losses
+
+
+def rsi_averages(
+    close: np.ndarray, period: int = 14, smoothing: str = "simple"
+) -> tuple[np.ndarray, np.ndarray]:
+    """Average gain and average loss series behind RSI.
+
+    Args:
+        close: (rows x bars) close prices
+        period: RSI period
+        smoothing: "simple" or "wilder"
+
+    Returns:
+        Tuple of (avg_gain, avg_loss) series
+    """
+    _check_smoothing(smoothing)
+    gains, losses = gains_losses(close)
+    return _smooth(gains, period, smoothing), _smooth(losses, period, smoothing)
+
+
+def rsi_from_averages(avg_gain: np.ndarray, avg_loss: np.ndarray) -> np.ndarray:
+    """RSI from average gain/loss.
+
+    No losses reads 100 (or 50 when flat); no gains reads 0.
+    """
+    avg_gain = np.asarray(avg_gain, dtype=np.float64)
+    avg_loss = np.asarray(avg_loss, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = 100 - (100 / (1 + avg_gain / avg_loss))
+    result = np.where(avg_gain == 0, 0.0, result)
+    return np.where(avg_loss == 0, np.where(avg_gain > 0, 100.0, 50.0), result)
+
+
+def rsi(close: np.ndarray, period: int = 14, smoothing: str = "simple") -> np.ndarray:
+    """Relative Strength Index series (0-100)."""
+    return rsi_from_averages(*rsi_averages(close, period, smoothing))
+
+
+def macd(
+    close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9, seed: str = "first"
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line and histogram series.
+
+    Args:
+        close: (rows x bars) close prices
+        fast: Fast EMA period
+        slow: Slow EMA period
+        signal: Signal line EMA period
+        seed: EMA seeding ("first" as pandas ewm(adjust=False), or "sma")
+
+    Returns:
+        Tuple of (macd_line, signal_line, histogram) series
+    """
+    return macd_from_emas(ema(close, fast, seed), ema(close, slow, seed), signal, seed)
+
+
+def macd_from_emas(
+    fast_ema: np.ndarray, slow_ema: np.ndarray, signal: int = 9, seed: str = "first"
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line and histogram from precomputed fast/slow EMA series."""
+    macd_line = fast_ema - slow_ema
+    signal_line = ema(macd_line, signal, seed)
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def atr(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int = 14,
+    smoothing: str = "simple",
+    tr: np.ndarray | None = None,
+) -> np.ndarray:
+    """Average True Range series.
+
+    Wilder smoothing starts at each row's second bar, where the true range
+    has a previous close (as TA-Lib).
+
+    Args:
+        high: (rows x bars) high prices
+        low: (rows x bars) low prices
+        close: (rows x bars) close prices
+        period: Smoothing period
+        smoothing: "simple" or "wilder"
+        tr: Precomputed true_range() of the same bars (optional)
+    """
+    _check_smoothing(smoothing)
+    tr = true_range(high, low, close) if tr is None else as_2d(tr)
+    if smoothing == "wilder":
+        tr = np.where(np.isnan(shift(close)), np.nan, tr)
+    return _smooth(tr, period, smoothing)
+
+
+def adx(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int = 14,
+    smoothing: str = "simple",
+    tr: np.ndarray | None = None,
+) -> np.ndarray:
+    """Average Directional Index series (0-100).
+
+    Wilder smoothing matches TA-Lib ADX: TR, +DM and -DM are Wilder running
+    sums (wilder_sum) starting at each row's second bar, and ADX is seeded
+    with the mean of the first `period` DX values.
+
+    Args:
+        high: (rows x bars) high prices
+        low: (rows x bars) low prices
+        close: (rows x bars) close prices
+        period: Smoothing period for TR, +DM/-DM and DX
+        smoothing: "simple" or "wilder"
+        tr: Precomputed true_range() of the same bars (optional)
+
+    Returns:
+        ADX series
+    """
+    _check_smoothing(smoothing)
+    high, low, close = as_2d(high), as_2d(low), as_2d(close)
+    valid = ~np.isnan(close)
+    tr = true_range(high, low, close) if tr is None else as_2d(tr)
+
+    up_move = high - shift(high)
+    down_move = shift(low) - low
+    with np.errstate(invalid="ignore"):
+        plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+        minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+    plus_dm = np.where(valid, plus_dm, np.nan)
+    minus_dm = np.where(valid, minus_dm, np.nan)
+
+    if smoothing == "wilder":
+        has_prev = ~np.isnan(shift(close))
+        tr = np.where(has_prev, tr, np.nan)
+        plus_dm = np.where(has_prev, plus_dm, np.nan)
+        minus_dm = np.where(has_prev, minus_dm, np.nan)
+
+    smooth = rolling_mean if smoothing == "simple" else wilder_sum
+    with np.errstate(divide="ignore", invalid="ignore"):
+        smoothed_tr = smooth(tr, period)
+        plus_di = 100 * (smooth(plus_dm, period) / smoothed_tr)
+        minus_di = 100 * (smooth(minus_dm, period) / smoothed_tr)
+        di_sum = plus_di + minus_di
+        dx = 100 * (np.abs(plus_di - minus_di) / np.where(di_sum == 0, np.nan, di_sum))
+
+    return _smooth(dx, period, smoothing)
@@ -8,7 +8,11 @@ Phase 5 Enhancement: Integrated IncrementalCalculator for 10x faster updates
 when previous day's indicators are cached.
 """
 
+import copy
+import hashlib
 import logging
+import os
+from collections.abc import Mapping
 from datetime import date
 from typing import Any
 
@@ -16,7 +20,10 @@ import pandas as pd
 from sqlalchemy.orm import Session
 
 from src.database.connection import get_db_context
-from src.database.models import WsDseDailyPrice
+from src.database.market_data import load_ohlcv
+from src.engine.cache import TieredCache
+from src.engine.drift_auditor import DriftAuditor
+from src.engine.state_store import get_state_store
 from src.fast_track.analyzers.trend_detector import TrendDetector
 from src.fast_track.calculators import IndicatorCalculator, MultiTimeframeCalculator
 from src.fast_track.incremental_calculator import IncrementalCalculator
@@ -35,7 +42,8 @@ class IndicatorPipeline:
     - Individual indicator calculators (momentum, overlap, volume, volatility, pattern)
 
     The pipeline follows these steps:
-    1. Cache check (L1/L2 multi-layer cache)
+    1. Cache check (L1 in-process LRU with TTL, L2 Redis when
+       INDICATOR_CACHE_REDIS_URL is set)
     2. Data fetch (from API or database)
     3. Multi-timeframe calculation
     4. Trend detection
@@ -45,12 +53,28 @@ class IndicatorPipeline:
     8. Cache storage
     """
 
-    def __init__(self, cache_size: int = 1000, cache_ttl_seconds: int = 3600):
+    DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+    DEFAULT_RESULT_TAIL = 50
+
+    def __init__(
+        self,
+        cache_size: int = 1000,
+        cache_ttl_seconds: int = 3600,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        redis_url: str | None = None,
+        result_tail: int | None = DEFAULT_RESULT_TAIL,
+    ):
         """Initialize the indicator pipeline with all components.
 
         Args:
             cache_size: Maximum number of cached items (default: 1000)
             cache_ttl_seconds: Cache TTL in seconds (default: 3600 = 1 hour)
+            cache_max_bytes: Memory bound of the in-process cache, measured
+                as pickled result size (default: 256 MB)
+            redis_url: Redis URL for the shared cache tier (default:
+                INDICATOR_CACHE_REDIS_URL; in-process only if unset)
+            result_tail: Values kept per indicator series in results (default:
+                50; None keeps the full series)
         """
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.logger.debug("IndicatorPipeline initialized")
@@ -61,12 +85,30 @@ class IndicatorPipeline:
         self.tool_selector = ConditionalToolSelector()
         self.indicator_calculator = IndicatorCalculator()
 
-        # Phase 5: Incremental calculator for fast daily updates
-        self.incremental_calculator = IncrementalCalculator()
+        # Phase 5: Incremental calculator for fast daily updates (states are
+        # checkpointed when INCREMENTAL_STATE_PATH is set)
+        self.incremental_calculator = IncrementalCalculator(state_store=get_state_store())
+
+        # Sampled parity audit of incremental states against a full TA-Lib
+        # recalculation (audit_incremental_drift() or drift_auditor.start())
+        self.drift_auditor = DriftAuditor(self.incremental_calculator, self._fetch_data)
+
+        # Indicator series are kept as NumPy arrays cut to their last
+        # result_tail values, which keeps cached and pickled results small
+        self.result_tail = result_tail
 
         # Cache configuration
         self.cache_size = cache_size
         self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache_max_bytes = cache_max_bytes
+        self._indicator_cache = TieredCache(
+            namespace="indicators",
+            max_entries=cache_size,
+            redis_url=redis_url or os.getenv("INDICATOR_CACHE_REDIS_URL"),
+            redis_ttl_seconds=cache_ttl_seconds,
+            ttl_seconds=cache_ttl_seconds,
+            max_bytes=cache_max_bytes,
+        )
 
         # Track incremental vs full calculation stats
         self._incremental_hits = 0
@@ -81,7 +123,8 @@ class IndicatorPipeline:
 
         Orchestrates the complete indicator pipeline:
         1. Validates input data
-        2. Selects tools based on context
+        2. Selects tools based on context (and returns a cached result for the
+           same ticker, data and tool set if there is one)
         3. Calculates multi-timeframe indicators
         4. Detects trends and patterns
         5. Aggregates and formats results
@@ -100,7 +143,7 @@ class IndicatorPipeline:
                 'multi_timeframe': {...},  # From MultiTimeframeCalculator
                 'trends': {...},           # From TrendDetector
                 'selected_tools': [...],   # From ConditionalToolSelector
-                'indicators': {...},       # Individual calculator results
+                'indicators': {...},       # IndicatorResults (last result_tail values)
                 'error': str (if status == 'error')
             }
 
@@ -119,14 +162,7 @@ class IndicatorPipeline:
             if not ticker:
                 raise ValueError("Ticker cannot be empty")
 
-            # Step 1: Check cache (placeholder for now - would integrate with Redis/PostgreSQL)
-            self.logger.debug(f"[{ticker}] Checking cache...")
-            # cached_result = self._check_cache(ticker, date)
-            # if cached_result:
-            #     self.logger.info(f"[{ticker}] Cache hit - returning cached result")
-            #     return cached_result
-
-            # Step 2: Select tools based on context
+            # Step 1: Select tools based on context
             if context is None:
                 context = {}
 
@@ -135,12 +171,21 @@ class IndicatorPipeline:
             result["selected_tools"] = selected_tools
             self.logger.info(f"[{ticker}] Selected {len(selected_tools)} tools")
 
+            # Step 2: Check cache (keyed by ticker, last bar date, tool set, tail and data)
+            cache_key = self._cache_key(ticker, data, selected_tools, self.result_tail)
+            if cache_key is not None:
+                cached_result = self._indicator_cache.get(cache_key)
+                if cached_result is not None:
+                    self.logger.info(f"[{ticker}] Cache hit - returning cached result")
+                    # Deep copy so callers can never mutate the cached entry
+                    return {**copy.deepcopy(cached_result), "cached": True}
+
             # Step 3: Calculate individual indicators using selected tools
             if data is not None:
                 self.logger.debug(f"[{ticker}] Calculating individual indicators")
                 try:
                     indicators = self.indicator_calculator.calculate_all(
-                        data, ticker, selected_tools=selected_tools
+                        data, ticker, selected_tools=selected_tools, tail=self.result_tail
                     )
                     result["indicators"] = indicators
                     self.logger.info(
@@ -176,37 +221,13 @@ class IndicatorPipeline:
                         # Prepare indicators dict for trend detector
                         all_indicators = result.get("indicators", {})
                         indicators_for_trend = {
-                            "rsi": (
-                                all_indicators.get("rsi", [None])[-1]
-                                if all_indicators.get("rsi")
-                                else None
-                            ),
-                            "bb_upper": (
-                                all_indicators.get("bb_upper", [None])[-1]
-                                if all_indicators.get("bb_upper")
-                                else None
-                            ),
-                            "bb_lower": (
-                                all_indicators.get("bb_lower", [None])[-1]
-                                if all_indicators.get("bb_lower")
-                                else None
-                            ),
+                            "rsi": self._last_value(all_indicators, "rsi"),
+                            "bb_upper": self._last_value(all_indicators, "bb_upper"),
+                            "bb_lower": self._last_value(all_indicators, "bb_lower"),
                             "volume": data["volume"].iloc[-1] if data is not None else None,
-                            "macd": (
-                                all_indicators.get("macd", [None])[-1]
-                                if all_indicators.get("macd")
-                                else None
-                            ),
-                            "stoch_k": (
-                                all_indicators.get("stoch_k", [None])[-1]
-                                if all_indicators.get("stoch_k")
-                                else None
-                            ),
-                            "stoch_d": (
-                                all_indicators.get("stoch_d", [None])[-1]
-                                if all_indicators.get("stoch_d")
-                                else None
-                            ),
+                            "macd": self._last_value(all_indicators, "macd"),
+                            "stoch_k": self._last_value(all_indicators, "stoch_k"),
+                            "stoch_d": self._last_value(all_indicators, "stoch_d"),
                         }
 
                         price_data = {"close": data["close"].tolist() if data is not None else None}
@@ -221,6 +242,14 @@ class IndicatorPipeline:
             # Step 6: Store supported tools for reference
             result["supported_tools"] = self.tool_selector.get_supported_tools()
 
+            # Step 7: Cache complete results (a copy, so the caller owns `result`);
+            # results with a failed step are recomputed next time
+            if cache_key is not None and not any(
+                "error" in result.get(step, {})
+                for step in ("indicators", "multi_timeframe", "trends")
+            ):
+                self._indicator_cache.set(cache_key, copy.deepcopy(result))
+
             self.logger.info(f"[{ticker}] Comprehensive indicator calculation complete")
 
         except Exception as e:
@@ -230,6 +259,35 @@ class IndicatorPipeline:
 
         return result
 
+    @staticmethod
+    def _last_value(indicators: Mapping[str, Any], name: str) -> Any | None:
+        """Latest value of an indicator series (None if missing or empty).
+
+        Works for NumPy arrays as well as lists, whose truthiness differs.
+        """
+        values = indicators.get(name)
+        if values is None or len(values) == 0:
+            return None
+        return values[-1]
+
+    @staticmethod
+    def _cache_key(
+        ticker: str, data: pd.DataFrame | None, selected_tools: list[str], tail: int | None
+    ) -> tuple | None:
+        """Cache key for a calculate_all() result (None if it is not cacheable).
+
+        The key holds the ticker, last bar date, selected tool set and result
+        tail, plus a digest of the OHLCV values so restated bars never hit a
+        stale entry.
+        """
+        if data is None or len(data) == 0:
+            return None
+
+        columns = [c for c in ("open", "high", "low", "close", "volume") if c in data.columns]
+        digest = hashlib.sha1(data[columns].to_numpy(dtype="float64").tobytes()).hexdigest()
+        last_date = data["date"].iloc[-1] if "date" in data.columns else None
+        return (ticker, str(last_date), tuple(sorted(selected_tools)), tail, len(data), digest)
+
     def _check_cache(
         self, ticker: str, cache_date: date, session: Session | None = None
     ) -> dict[str, Any] | None:
@@ -354,33 +412,15 @@ class IndicatorPipeline:
             DataFrame with columns [date, open, high, low, close, volume] or None
         """
         try:
-            # Query most recent N days of stock data from GIBD table
-            stock_data = (
-                session.query(WsDseDailyPrice)
-                .filter(WsDseDailyPrice.txn_scrip == ticker)
-                .order_by(WsDseDailyPrice.txn_date.desc())
-                .limit(lookback)
-                .all()
-            )
+            # Most recent N days, oldest to newest, as float arrays (no ORM objects)
+            bars = load_ohlcv(session, ticker, limit=lookback)
 
-            if not stock_data:
+            if not len(bars):
                 self.logger.warning(f"[{ticker}] No stock data found in database")
                 return None
 
-            # Reverse to get chronological order (oldest to newest)
-            stock_data.reverse()
-
             # Convert to DataFrame with standard column names
-            data = pd.DataFrame(
-                {
-                    "date": [row.txn_date for row in stock_data],
-                    "open": [float(row.txn_open) for row in stock_data],
-                    "high": [float(row.txn_high) for row in stock_data],
-                    "low": [float(row.txn_low) for row in stock_data],
-                    "close": [float(row.txn_close) for row in stock_data],
-                    "volume": [int(row.txn_volume) for row in stock_data],
-                }
-            )
+            data = bars.to_frame()
 
             self.logger.info(f"[{ticker}] Successfully fetched {len(data)} days of data from GIBD")
             return data
@@ -492,29 +532,27 @@ class IndicatorPipeline:
         """
         self.logger.info(f"[{ticker}] Starting indicator calculation (incremental mode)")
 
-        # Check if we should use incremental calculation
-        cached_state = self.incremental_calculator.get_cached_state(ticker)
-
-        if cached_state is not None and not force_full:
-            # Use incremental calculation
-            self.logger.debug(f"[{ticker}] Using incremental calculation (cached state found)")
-            result = self.incremental_calculator.update_indicators(
-                ticker=ticker,
-                new_day_data=new_day_data,
-            )
-            self._incremental_hits += 1
-            return result
-
-        # Need to initialize or do full calculation
-        if historical_data is not None and len(historical_data) >= 220:
-            self.logger.debug(f"[{ticker}] Initializing incremental state from historical data")
-            result = self.incremental_calculator.update_indicators(
+        calculator = self.incremental_calculator
+        has_history = historical_data is not None and len(historical_data) >= 220
+
+        # Use incremental calculation with a cached state, a persisted snapshot
+        # or enough history to initialize one. historical_data is always passed
+        # so a snapshot that does not end on its last bar is discarded and
+        # the state reseeded instead of skipping the missing bars.
+        if not force_full and (
+            calculator.get_cached_state(ticker) is not None
+            or calculator.state_store is not None
+            or has_history
+        ):
+            self.logger.debug(f"[{ticker}] Using incremental calculation")
+            result = calculator.update_indicators(
                 ticker=ticker,
                 new_day_data=new_day_data,
                 historical_data=historical_data,
             )
-            self._incremental_hits += 1
-            return result
+            if result["method"] != "failed" or calculator.get_cached_state(ticker) is not None:
+                self._incremental_hits += 1
+                return result
 
         # Fall back to full calculation
         self.logger.debug(f"[{ticker}] Falling back to full calculation")
@@ -548,7 +586,9 @@ class IndicatorPipeline:
                 "incremental_hits": int,
                 "full_calculations": int,
                 "incremental_rate": float,
-                "cached_tickers": list[str]
+                "cached_tickers": list[str],
+                "drift_audit": {...},  # DriftAuditor.get_stats()
+                "indicator_cache": {...}  # calculate_all() cache hits, size, bytes
             }
         """
         total = self._incremental_hits + self._full_calculations
@@ -560,16 +600,33 @@ class IndicatorPipeline:
             "total_calculations": total,
             "incremental_rate": rate,
             "cached_tickers": self.incremental_calculator.get_state_info()["cached_tickers"],
+            "drift_audit": self.drift_auditor.get_stats(),
+            "indicator_cache": self._indicator_cache.get_stats(),
         }
 
-    def clear_incremental_cache(self, ticker: str | None = None):
+    def audit_incremental_drift(self, sample_size: int | None = None) -> list[dict[str, Any]]:
+        """Audit the next batch of incremental states against full recalculation.
+
+        Drifted states are reseeded from the database history.
+
+        Args:
+            sample_size: Tickers to audit (default: the auditor's sample size)
+
+        Returns:
+            List of per-ticker audit results (see DriftAuditor.audit_ticker)
+        """
+        return self.drift_auditor.audit_batch(sample_size)
+
+    def clear_incremental_cache(self, ticker: str | None = None, persisted: bool = False):
         """Clear incremental calculation cache.
 
         Args:
             ticker: Optional specific ticker to clear. If None, clears all.
+            persisted: Also delete persisted state snapshots (default: False)
         """
-        self.incremental_calculator.clear_state(ticker)
+        self.incremental_calculator.clear_state(ticker, persisted=persisted)
         if ticker is None:
+            self._indicator_cache.clear()
             self._incremental_hits = 0
             self._full_calculations = 0
             self.logger.info("Cleared all incremental cache and stats")
@@ -0,0 +1,190 @@
+"""Latest-indicator snapshots with JSONB key projection.
+
+The GIBD indicators table stores every computed indicator in one JSONB blob
+per (scrip, trading_date). The signal engine reads only a handful of those
+keys, so this module selects them server-side (``indicators -> 'RSI_14'``
+cast to double precision) instead of transferring and decoding the whole
+blob, and returns the latest CALCULATED row per ticker as column arrays keyed
+by signal engine name.
+
+Example:
+    snapshot = load_latest_indicators(session, ['GP', 'BATBC'], date(2024, 1, 15))
+    rsi = snapshot.column('rsi', ['GP', 'BATBC'])  # float64, NaN when missing
+    indicators = snapshot.record('GP')  # {'rsi': 61.2, 'atr': 4.1, ...}
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import date
+
+import numpy as np
+from sqlalchemy import Float, case, func
+from sqlalchemy.orm import Session
+
+from src.database.models import Indicator
+
+logger = logging.getLogger(__name__)
+
+# Numeric GIBD keys read by the signal engine, mapped to engine names
+NUMERIC_INDICATOR_KEYS = {
+    "RSI_14": "rsi",
+    "SMA_20": "sma_20",
+    "SMA_50": "sma_50",
+    "MACD_histogram_12_26_9": "macd_histogram",
+    "ATR_14": "atr",
+    "ADX_14": "adx",
+    "BB_upper_20_2": "bb_upper",
+    "BB_lower_20_2": "bb_lower",
+    "BB_middle_20_2": "bb_middle",
+    "rvol": "rvol",
+}
+
+# Text GIBD keys read by the signal engine, mapped to engine names
+LABEL_INDICATOR_KEYS = {
+    "weekly_trend": "weekly_trend",
+}
+
+
+def indicator_columns() -> list:
+    """Select expressions projecting the engine's indicator keys out of the JSONB blob.
+
+    Numeric keys are cast to double precision only when the JSON value is a
+    number, so a malformed value reads as NULL instead of failing the query.
+
+    Returns:
+        Labeled column expressions (labels are engine names)
+    """
+    columns = []
+    for gibd_key, engine_key in NUMERIC_INDICATOR_KEYS.items():
+        value = Indicator.indicators[gibd_key]
+        columns.append(
+            case(
+                (func.jsonb_typeof(value) == "number", value.astext.cast(Float)),
+                else_=None,
+            ).label(engine_key)
+        )
+    for gibd_key, engine_key in LABEL_INDICATOR_KEYS.items():
+        columns.append(Indicator.indicators[gibd_key].astext.label(engine_key))
+    return columns
+
+
+@dataclass
+class IndicatorSnapshot:
+    """Latest indicator values for many tickers as column arrays.
+
+    Attributes:
+        tickers: Ticker symbols, one per row
+        index: Mapping from ticker to row number
+        trading_dates: Trading date of each ticker's row
+        values: Engine key -> float64 array (NaN when the key is missing)
+        labels: Engine key -> object array of text values (None when missing)
+    """
+
+    tickers: list[str]
+    index: dict[str, int]
+    trading_dates: list[date]
+    values: dict[str, np.ndarray] = field(default_factory=dict)
+    labels: dict[str, np.ndarray] = field(default_factory=dict)
+
+    def column(self, key: str, tickers: list[str]) -> np.ndarray:
+        """Get one numeric indicator aligned to a list of tickers.
+
+        Args:
+            key: Engine indicator key (e.g. 'rsi')
+            tickers: Ticker symbols (tickers without a row read as NaN)
+
+        Returns:
+            float64 array, one value per ticker
+        """
+        source = self.values[key]
+        result = np.full(len(tickers), np.nan)
+        for i, ticker in enumerate(tickers):
+            row = self.index.get(ticker)
+            if row is not None:
+                result[i] = source[row]
+        return result
+
+    def record(self, ticker: str) -> dict:
+        """Get one ticker's indicators keyed by engine name (missing keys omitted)."""
+        row = self.index.get(ticker)
+        if row is None:
+            return {}
+
+        indicators = {}
+        for key, column in self.values.items():
+            value = column[row]
+            if not np.isnan(value):
+                indicators[key] = float(value)
+        for key, column in self.labels.items():
+            if column[row] is not None:
+                indicators[key] = column[row]
+        return indicators
+
+    def records(self) -> dict[str, dict]:
+        """Get indicators keyed by engine name for every ticker."""
+        return {ticker: self.record(ticker) for ticker in self.tickers}
+
+
+def load_latest_indicators(
+    session: Session, tickers: list[str], target_date: date
+) -> IndicatorSnapshot:
+    """Load the latest CALCULATED indicators on or before a date for many tickers.
+
+    One DISTINCT ON query returns a single row per ticker with only the
+    projected keys.
+
+    Args:
+        session: Database session
+        tickers: Ticker symbols
+        target_date: Latest trading date to consider
+
+    Returns:
+        IndicatorSnapshot (tickers without a calculated row are omitted)
+    """
+    if not tickers:
+        return IndicatorSnapshot(tickers=[], index={}, trading_dates=[])
+
+    rows = (
+        session.query(Indicator.scrip, Indicator.trading_date, *indicator_columns())
+        .filter(
+            Indicator.scrip.in_(tickers),
+            Indicator.trading_date <= target_date,
+            Indicator.status == "CALCULATED",
+        )
+        .distinct(Indicator.scrip)
+        .order_by(Indicator.scrip, Indicator.trading_date.desc())
+        .all()
+    )
+
+    return build_indicator_snapshot(rows)
+
+
+def build_indicator_snapshot(rows: list) -> IndicatorSnapshot:
+    """Build a snapshot from (scrip, trading_date, *projected values) rows.
+
+    Args:
+        rows: Rows selected with indicator_columns(), one per ticker
+
+    Returns:
+        IndicatorSnapshot
+    """
+    numeric_keys = list(NUMERIC_INDICATOR_KEYS.values())
+    label_keys = list(LABEL_INDICATOR_KEYS.values())
+
+    tickers = [row[0] for row in rows]
+    columns = list(zip(*[row[2:] for row in rows], strict=True)) if rows else []
+
+    values = {}
+    labels = {}
+    for position, key in enumerate(numeric_keys):
+        values[key] = np.array(columns[position] if rows else [], dtype=np.float64)
+    for position, key in enumerate(label_keys, start=len(numeric_keys)):
+        labels[key] = np.array(columns[position] if rows else [], dtype=object)
+
+    return IndicatorSnapshot(
+        tickers=tickers,
+        index={ticker: i for i, ticker in enumerate(tickers)},
+        trading_dates=[row[1] for row in rows],
+        values=values,
+        labels=labels,
+    )
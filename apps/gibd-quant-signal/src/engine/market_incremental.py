@@ -0,0 +1,359 @@
+"""Market-wide incremental indicator engine for end-of-day updates.
+
+MarketIncrementalEngine holds the incremental state of every ticker (RSI,
+EMA, MACD, Bollinger Bands, ATR and SMA windows) as aligned NumPy arrays and
+advances all tickers by one trading day in a single vectorized step, instead
+of one IncrementalCalculator.update_indicators() call per ticker. Tickers
+without a bar that day (NaN close) keep their state untouched.
+
+It uses the same update rules as IncrementalCalculator, and converts to and
+from IncrementalState so checkpoints (IncrementalStateStore) are shared
+between the two. State is carried at full precision; IncrementalCalculator
+rounds its EMA state to 4 decimals, so values agree to about 1e-4.
+
+Example:
+    with get_db_context() as session:
+        panel = load_price_panel(session, None, date(2024, 1, 1), date(2024, 12, 30))
+    engine = MarketIncrementalEngine.from_panel(panel)
+    # Bar arrays are aligned to engine.tickers
+    result = engine.update(date(2024, 12, 31), open_, high, low, close)
+    rsi = result["rsi"]  # NaN for tickers that were not updated
+"""
+
+import logging
+import time
+from datetime import date
+
+import numpy as np
+
+from src.engine import indicator_kernels as kernels
+from src.engine.incremental_calculator import IncrementalCalculator, IncrementalState
+from src.engine.ring_buffer import RingBuffer, RingBufferArray
+from src.engine.signal_panel import PricePanel
+from src.engine.state_store import as_date
+
+logger = logging.getLogger(__name__)
+
+NOT_A_DATE = np.datetime64("NaT", "D")
+
+
+class MarketIncrementalEngine:
+    """Struct-of-arrays incremental indicators for a whole ticker universe.
+
+    Attributes:
+        tickers: Ticker symbols, one per state row
+        index: Mapping from ticker to row number
+        ready: Rows with initialized state
+        last_dates: Date of the last bar applied per row (datetime64[D])
+    """
+
+    RSI_PERIOD = IncrementalCalculator.RSI_PERIOD
+    SMA_PERIODS = tuple(IncrementalCalculator.SMA_PERIODS)
+    EMA_FAST = IncrementalCalculator.EMA_FAST
+    EMA_SLOW = IncrementalCalculator.EMA_SLOW
+    MACD_SIGNAL_PERIOD = IncrementalCalculator.MACD_SIGNAL_PERIOD
+    BB_PERIOD = IncrementalCalculator.BB_PERIOD
+    BB_STD_DEV = IncrementalCalculator.BB_STD_DEV
+    ATR_PERIOD = IncrementalCalculator.ATR_PERIOD
+
+    # Same minimum history as IncrementalCalculator initialization
+    MIN_HISTORY = 220
+
+    INDICATORS = (
+        "rsi",
+        "sma_20",
+        "sma_50",
+        "sma_200",
+        "ema_12",
+        "ema_26",
+        "macd",
+        "macd_signal",
+        "macd_hist",
+        "bb_upper",
+        "bb_middle",
+        "bb_lower",
+        "atr",
+    )
+
+    def __init__(self, tickers: list[str]):
+        """Initialize an engine with empty (not ready) state for every ticker.
+
+        Args:
+            tickers: Ticker symbols
+        """
+        n = len(tickers)
+        self.tickers = list(tickers)
+        self.index = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self.ready = np.zeros(n, dtype=bool)
+        self.last_dates = np.full(n, NOT_A_DATE)
+
+        self.prev_close = np.full(n, np.nan)
+        self.avg_gain = np.full(n, np.nan)
+        self.avg_loss = np.full(n, np.nan)
+        self.ema_fast = np.full(n, np.nan)
+        self.ema_slow = np.full(n, np.nan)
+        self.macd_signal = np.full(n, np.nan)
+        self.atr = np.full(n, np.nan)
+        self.windows = {period: RingBufferArray(n, period) for period in self.SMA_PERIODS}
+
+    @classmethod
+    def from_panel(cls, panel: PricePanel) -> "MarketIncrementalEngine":
+        """Initialize every ticker with enough history from a price panel.
+
+        Initial values come from the shared indicator kernels over the whole
+        panel at once (Wilder RSI/ATR, SMA-seeded EMA/MACD).
+
+        Args:
+            panel: Right-aligned PricePanel ending on the last applied bar
+
+        Returns:
+            MarketIncrementalEngine (tickers with fewer than MIN_HISTORY bars
+            stay not ready)
+        """
+        start = time.perf_counter()
+        engine = cls(panel.tickers)
+        ready = panel.counts >= cls.MIN_HISTORY
+        rows = np.flatnonzero(ready)
+        if len(rows) == 0:
+            return engine
+
+        high, low, close = panel.high[rows], panel.low[rows], panel.close[rows]
+
+        avg_gain, avg_loss = kernels.rsi_averages(close, cls.RSI_PERIOD, smoothing="wilder")
+        _, macd_signal, _ = kernels.macd(
+            close, cls.EMA_FAST, cls.EMA_SLOW, cls.MACD_SIGNAL_PERIOD, seed="sma"
+        )
+        engine.avg_gain[rows] = avg_gain[:, -1]
+        engine.avg_loss[rows] = avg_loss[:, -1]
+        engine.ema_fast[rows] = kernels.ema(close, cls.EMA_FAST, seed="sma")[:, -1]
+        engine.ema_slow[rows] = kernels.ema(close, cls.EMA_SLOW, seed="sma")[:, -1]
+        engine.macd_signal[rows] = macd_signal[:, -1]
+        engine.atr[rows] = kernels.atr(high, low, close, cls.ATR_PERIOD, smoothing="wilder")[:, -1]
+        engine.prev_close[rows] = close[:, -1]
+
+        for period, window in engine.windows.items():
+            tail = close[:, -period:]
+            window.values[rows] = tail
+            window.count[rows] = period
+            window.mean[rows] = tail.mean(axis=1)
+            window.m2[rows] = ((tail - window.mean[rows][:, None]) ** 2).sum(axis=1)
+
+        engine.last_dates[rows] = np.array(
+            [panel.last_dates[i] for i in rows], dtype="datetime64[D]"
+        )
+        engine.ready = ready
+
+        logger.info(
+            f"Initialized market incremental state for {len(rows)}/{len(panel.tickers)} "
+            f"tickers in {(time.perf_counter() - start) * 1000:.1f}ms"
+        )
+        return engine
+
+    @classmethod
+    def from_states(cls, states: dict[str, IncrementalState]) -> "MarketIncrementalEngine":
+        """Build an engine from per-ticker IncrementalState objects.
+
+        Args:
+            states: Mapping ticker -> IncrementalState (e.g. restored from
+                IncrementalStateStore)
+
+        Returns:
+            MarketIncrementalEngine
+        """
+        engine = cls(list(states))
+        for i, state in enumerate(states.values()):
+            if state.prev_close is None or state.avg_gain is None or state.ema_12 is None:
+                continue
+            engine.prev_close[i] = state.prev_close
+            engine.avg_gain[i] = state.avg_gain
+            engine.avg_loss[i] = state.avg_loss
+            engine.ema_fast[i] = state.ema_12
+            engine.ema_slow[i] = state.ema_26
+            engine.macd_signal[i] = state.macd_signal
+            engine.atr[i] = state.prev_atr
+            engine.last_dates[i] = np.datetime64(as_date(state.last_date), "D")
+            engine.ready[i] = True
+
+        for period, attribute in zip(
+            engine.SMA_PERIODS, ("sma_20_window", "sma_50_window", "sma_200_window"), strict=True
+        ):
+            engine.windows[period] = RingBufferArray.from_rows(
+                [
+                    getattr(state, attribute).to_array()
+                    if getattr(state, attribute) is not None
+                    else []
+                    for state in states.values()
+                ],
+                period,
+            )
+        return engine
+
+    def to_states(self) -> dict[str, IncrementalState]:
+        """Export ready rows as IncrementalState objects (for checkpointing).
+
+        The engine carries no ADX/Stochastic/CCI/OBV/MFI state, so exported
+        states are marked needs_reseed: IncrementalCalculator rebuilds them
+        from history on their next update (or the drift auditor does).
+
+        Returns:
+            Mapping ticker -> IncrementalState
+        """
+        states = {}
+        for i in np.flatnonzero(self.ready):
+            ticker = self.tickers[i]
+            sma_20 = self.windows[20].row(i)
+            macd_line = self.ema_fast[i] - self.ema_slow[i]
+            states[ticker] = IncrementalState(
+                ticker=ticker,
+                last_date=self.last_dates[i].astype(date),
+                avg_gain=float(self.avg_gain[i]),
+                avg_loss=float(self.avg_loss[i]),
+                prev_close=float(self.prev_close[i]),
+                sma_20_window=RingBuffer.from_values(sma_20, 20),
+                sma_50_window=RingBuffer.from_values(self.windows[50].row(i), 50),
+                sma_200_window=RingBuffer.from_values(self.windows[200].row(i), 200),
+                ema_12=float(self.ema_fast[i]),
+                ema_26=float(self.ema_slow[i]),
+                macd_line=float(macd_line),
+                macd_signal=float(self.macd_signal[i]),
+                bb_middle=float(sma_20.mean()),
+                bb_window=RingBuffer.from_values(sma_20, self.BB_PERIOD),
+                prev_atr=float(self.atr[i]),
+                needs_reseed=True,
+            )
+        return states
+
+    def update(
+        self,
+        trading_date: date,
+        open_: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray | None = None,
+    ) -> dict[str, np.ndarray]:
+        """Advance every ticker with a bar on trading_date by one step.
+
+        Rows are masked out when their close is NaN (no bar), their state is
+        not ready, or trading_date is not after their last applied bar.
+
+        Args:
+            trading_date: Date of the bars
+            open_: Open per ticker (aligned to self.tickers)
+            high: High per ticker
+            low: Low per ticker
+            close: Close per ticker (NaN for tickers without a bar)
+            volume: Volume per ticker (unused by these indicators)
+
+        Returns:
+            Dict of float64 arrays aligned to self.tickers, one per name in
+            INDICATORS (NaN where not updated), plus "updated" (bool mask)
+        """
+        high = np.asarray(high, dtype=np.float64)
+        low = np.asarray(low, dtype=np.float64)
+        close = np.asarray(close, dtype=np.float64)
+        bar_date = np.datetime64(as_date(trading_date), "D")
+
+        with np.errstate(invalid="ignore"):
+            updated = self.ready & ~np.isnan(close) & ~(self.last_dates >= bar_date)
+        rows = np.flatnonzero(updated)
+        result = {name: np.full(len(self.tickers), np.nan) for name in self.INDICATORS}
+        result["updated"] = updated
+        if len(rows) == 0:
+            return result
+
+        c, h, lo = close[rows], high[rows], low[rows]
+        prev_close = self.prev_close[rows]
+
+        # RSI (Wilder)
+        change = c - prev_close
+        period = self.RSI_PERIOD
+        avg_gain = (self.avg_gain[rows] * (period - 1) + np.maximum(change, 0.0)) / period
+        avg_loss = (self.avg_loss[rows] * (period - 1) + np.maximum(-change, 0.0)) / period
+        self.avg_gain[rows] = avg_gain
+        self.avg_loss[rows] = avg_loss
+        result["rsi"][rows] = kernels.rsi_from_averages(avg_gain, avg_loss)
+
+        # SMA windows (the 20-bar window also feeds Bollinger Bands)
+        for sma_period, window in self.windows.items():
+            window.push(rows, c)
+            result[f"sma_{sma_period}"][rows] = window.mean[rows]
+
+        # EMA and MACD
+        ema_fast = self.ema_fast[rows] + (c - self.ema_fast[rows]) * (2 / (self.EMA_FAST + 1))
+        ema_slow = self.ema_slow[rows] + (c - self.ema_slow[rows]) * (2 / (self.EMA_SLOW + 1))
+        macd_line = ema_fast - ema_slow
+        macd_signal = self.macd_signal[rows] + (macd_line - self.macd_signal[rows]) * (
+            2 / (self.MACD_SIGNAL_PERIOD + 1)
+        )
+        self.ema_fast[rows] = ema_fast
+        self.ema_slow[rows] = ema_slow
+        self.macd_signal[rows] = macd_signal
+        result["ema_12"][rows] = ema_fast
+        result["ema_26"][rows] = ema_slow
+        result["macd"][rows] = macd_line
+        result["macd_signal"][rows] = macd_signal
+        result["macd_hist"][rows] = macd_line - macd_signal
+
+        # Bollinger Bands
+        bands = self.windows[self.BB_PERIOD]
+        middle = bands.mean[rows]
+        spread = self.BB_STD_DEV * np.sqrt(bands.m2[rows] / bands.count[rows])
+        result["bb_middle"][rows] = middle
+        result["bb_upper"][rows] = middle + spread
+        result["bb_lower"][rows] = middle - spread
+
+        # ATR (Wilder)
+        true_range = np.maximum(h - lo, np.maximum(np.abs(h - prev_close), np.abs(lo - prev_close)))
+        atr = (self.atr[rows] * (self.ATR_PERIOD - 1) + true_range) / self.ATR_PERIOD
+        self.atr[rows] = atr
+        result["atr"][rows] = atr
+
+        self.prev_close[rows] = c
+        self.last_dates[rows] = bar_date
+        return result
+
+    def update_bars(self, trading_date: date, bars: dict[str, dict]) -> dict[str, np.ndarray]:
+        """Advance tickers from per-ticker bar dicts (unknown tickers are ignored).
+
+        Args:
+            trading_date: Date of the bars
+            bars: Mapping ticker -> {"open", "high", "low", "close", "volume"}
+
+        Returns:
+            Same as update()
+        """
+        columns = {
+            name: np.full(len(self.tickers), np.nan) for name in ("open", "high", "low", "close")
+        }
+        for ticker, bar in bars.items():
+            i = self.index.get(ticker)
+            if i is not None:
+                for name, values in columns.items():
+                    values[i] = float(bar[name])
+        return self.update(
+            trading_date, columns["open"], columns["high"], columns["low"], columns["close"]
+        )
+
+    def get_stats(self) -> dict:
+        """Get ticker counts and state memory."""
+        arrays = (
+            self.prev_close,
+            self.avg_gain,
+            self.avg_loss,
+            self.ema_fast,
+            self.ema_slow,
+            self.macd_signal,
+            self.atr,
+            self.last_dates,
+            self.ready,
+        )
+        state_bytes = sum(array.nbytes for array in arrays) + sum(
+            window.nbytes for window in self.windows.values()
+        )
+        return {
+            "tickers": len(self.tickers),
+            "ready": int(self.ready.sum()),
+            "state_bytes": state_bytes,
+            "bytes_per_ticker": state_bytes / len(self.tickers) if self.tickers else 0,
+        }
@@ -0,0 +1,262 @@
+"""Single-pass multi-window statistics for MultiTimeframeCalculator.
+
+The timeframe windows (5, 20, 50 and 200 bars) report the RSI over the
+window, the mean close and the mean volume. All of them depend only on the
+last max(windows) bars, and each is a fixed linear combination of them:
+a window mean weights its last w values by 1/w, and a Wilder average over a
+window (TA-Lib's seed, the mean of the oldest `period` changes, folded with
+the newer changes) weights change j by a power of (1 - 1/period). So
+multi_window_stats() reads that tail once per series and computes every
+window with one matrix product against cached weight matrices:
+- closes @ mean weights -> every window's mean close
+- gains @ Wilder weights and losses @ Wilder weights (gains/losses
+  differenced once) -> every window's RSI, matching TA-Lib RSI computed on
+  the window slice alone
+- volumes @ (mean weights | regression weights) -> every window's mean
+  volume and the volume trend slope
+
+Inputs are one series or a (tickers x bars) panel, NaN-padded on the left
+as in PricePanel; a window reaching back past a row's newest NaN reads NaN.
+rolling_means() computes full SMA series for several periods from one
+prefix sum.
+
+Example:
+    stats = multi_window_stats(panel.close, panel.volume)
+    stats.rsi[20]  # 20-bar RSI per ticker
+    stats.row(panel.index["GP"])  # {"rsi_20d": ..., "sma_20d": ..., ...}
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
+
+from src.engine import indicator_kernels as kernels
+
+TIMEFRAME_WINDOWS = (5, 20, 50, 200)
+
+# RSI period per timeframe window (the 5-bar window is too short for 14)
+TIMEFRAME_RSI_PERIODS = {5: 2, 20: 14, 50: 14, 200: 14}
+
+# Bars in the volume trend regression
+VOLUME_TREND_WINDOW = 20
+
+
+@dataclass(slots=True)
+class MultiWindowStats:
+    """Latest per-window statistics, one value per row (ticker).
+
+    Attributes:
+        windows: Window lengths in bars
+        bars: Consecutive valid bars ending at the latest bar, counted up to
+            the widest window (a window is available if it fits)
+        rsi: Window -> RSI over the window's bars (NaN if unavailable)
+        sma: Window -> mean close over the window
+        avg_volume: Window -> mean volume over the window
+        current_volume: Latest volume
+        volume_slope: Least-squares slope of the last VOLUME_TREND_WINDOW volumes
+    """
+
+    windows: tuple[int, ...]
+    bars: np.ndarray
+    rsi: dict[int, np.ndarray] = field(default_factory=dict)
+    sma: dict[int, np.ndarray] = field(default_factory=dict)
+    avg_volume: dict[int, np.ndarray] = field(default_factory=dict)
+    current_volume: np.ndarray | None = None
+    volume_slope: np.ndarray | None = None
+
+    def available(self, window: int) -> np.ndarray:
+        """Whether each row has `window` valid bars ending at the latest bar."""
+        return self.bars >= window
+
+    def row(self, i: int = 0) -> dict[str, float]:
+        """Statistics of one row as floats (NaN when unavailable).
+
+        Keys are "rsi_{w}d", "sma_{w}d" and "avg_volume_{w}d" per window, plus
+        "current_volume" and "volume_slope" when volume was given.
+        """
+        values = {}
+        for prefix, by_window in (
+            ("rsi", self.rsi),
+            ("sma", self.sma),
+            ("avg_volume", self.avg_volume),
+        ):
+            for window, array in by_window.items():
+                values[f"{prefix}_{window}d"] = float(array[i])
+        if self.current_volume is not None:
+            values["current_volume"] = float(self.current_volume[i])
+            values["volume_slope"] = float(self.volume_slope[i])
+        return values
+
+
+def _recent(values: np.ndarray, width: int) -> tuple[np.ndarray, np.ndarray]:
+    """Last `width` bars of each row and the number of valid bars ending at the latest.
+
+    NaN bars (and left padding for rows shorter than width) are zeroed so
+    they drop out of the matrix products; windows reaching them are masked
+    by the caller using the returned counts.
+    """
+    values = kernels.as_2d(values)
+    rows, bars = values.shape
+    if bars >= width:
+        recent = values[:, bars - width :]
+    else:
+        recent = np.full((rows, width), np.nan)
+        recent[:, width - bars :] = values
+
+    missing = np.isnan(recent)
+    if not missing.any():
+        return recent, np.full(rows, width)
+    newest_gap = np.argmax(missing[:, ::-1], axis=1)  # Valid bars after the newest NaN
+    return np.where(missing, 0.0, recent), np.where(missing.any(axis=1), newest_gap, width)
+
+
+@lru_cache(maxsize=32)
+def _mean_weights(width: int, windows: tuple[int, ...]) -> np.ndarray:
+    """(width x windows) weights: column k averages the last windows[k] values."""
+    weights = np.zeros((width, len(windows)))
+    for k, window in enumerate(windows):
+        weights[width - window :, k] = 1.0 / window
+    return weights
+
+
+@lru_cache(maxsize=32)
+def _rsi_weights(width: int, windows: tuple[int, ...], periods: tuple[int, ...]) -> np.ndarray:
+    """((width - 1) x windows) weights of each change in a window's Wilder average.
+
+    A window of w bars has w - 1 changes: the oldest `period` seed the
+    average with weight 1/period, and each of the m newer changes decays it
+    by (1 - 1/period), so a seed change ends up weighted decay**m / period
+    and the i-th newest change decay**i / period.
+    """
+    changes = width - 1
+    weights = np.zeros((changes, len(windows)))
+    for k, (window, period) in enumerate(zip(windows, periods, strict=True)):
+        decay = 1.0 - 1.0 / period
+        newer = window - 1 - period
+        weights[changes - window + 1 : changes - newer, k] = decay**newer / period
+        weights[changes - newer :, k] = decay ** np.arange(newer - 1, -1, -1) / period
+    return weights
+
+
+@lru_cache(maxsize=32)
+def _volume_weights(width: int, windows: tuple[int, ...]) -> np.ndarray:
+    """Mean weights plus a last column giving the VOLUME_TREND_WINDOW regression slope."""
+    x = np.arange(VOLUME_TREND_WINDOW, dtype=np.float64)
+    x -= x.mean()
+    weights = np.zeros((width, len(windows) + 1))
+    weights[:, :-1] = _mean_weights(width, windows)
+    weights[width - VOLUME_TREND_WINDOW :, -1] = x / (x @ x)
+    return weights
+
+
+def _mask(values: np.ndarray, bars: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Set column k to NaN in rows with fewer than lengths[k] valid bars."""
+    values[bars[:, None] < lengths] = np.nan
+    return values
+
+
+def multi_window_stats(
+    close: np.ndarray | None = None,
+    volume: np.ndarray | None = None,
+    windows: tuple[int, ...] = TIMEFRAME_WINDOWS,
+    rsi_periods: dict[int, int] | None = None,
+) -> MultiWindowStats:
+    """Compute RSI, mean close and mean volume for every window in one pass.
+
+    Args:
+        close: Close prices, 1-D or (tickers x bars), oldest first (optional)
+        volume: Volumes with the same shape (optional)
+        windows: Window lengths in bars
+        rsi_periods: RSI period per window (default: TIMEFRAME_RSI_PERIODS)
+
+    Returns:
+        MultiWindowStats with one value per row
+
+    Raises:
+        ValueError: If neither series is given, a window is shorter than
+            its RSI period + 1, or a window has no RSI period
+    """
+    if close is None and volume is None:
+        raise ValueError("close or volume is required")
+    periods = TIMEFRAME_RSI_PERIODS if rsi_periods is None else rsi_periods
+    windows = tuple(windows)
+    if close is not None:
+        for window in windows:
+            if window not in periods:
+                raise ValueError(f"No RSI period for window {window}")
+            if window - 1 < periods[window]:
+                raise ValueError(f"Window {window} too short for RSI period {periods[window]}")
+
+    width = max(*windows, VOLUME_TREND_WINDOW) if volume is not None else max(windows)
+    lengths = np.asarray(windows)
+    stats = MultiWindowStats(windows=windows, bars=np.zeros(0, dtype=np.int64))
+
+    if close is not None:
+        recent, stats.bars = _recent(close, width)
+        means = _mask(recent @ _mean_weights(width, windows), stats.bars, lengths)
+
+        # Bar-to-bar changes split once into gains and losses for every window
+        gains = recent[:, 1:] - recent[:, :-1]
+        losses = np.negative(gains)
+        np.maximum(gains, 0.0, out=gains)
+        np.maximum(losses, 0.0, out=losses)
+        rsi_weights = _rsi_weights(width, windows, tuple(periods[w] for w in windows))
+        avg_gain = gains @ rsi_weights
+        total = avg_gain + losses @ rsi_weights
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = np.where(total != 0, 100.0 * avg_gain / total, 0.0)
+        _mask(rsi, stats.bars, lengths)
+
+        stats.sma = {window: means[:, k] for k, window in enumerate(windows)}
+        stats.rsi = {window: rsi[:, k] for k, window in enumerate(windows)}
+
+    if volume is not None:
+        recent, volume_bars = _recent(volume, width)
+        if close is None:
+            stats.bars = volume_bars
+        values = _mask(
+            recent @ _volume_weights(width, windows),
+            volume_bars,
+            np.append(lengths, VOLUME_TREND_WINDOW),
+        )
+        stats.avg_volume = {window: values[:, k] for k, window in enumerate(windows)}
+        stats.volume_slope = values[:, -1]
+        stats.current_volume = np.where(volume_bars > 0, recent[:, -1], np.nan)
+
+    return stats
+
+
+def rolling_means(values: np.ndarray, periods) -> dict[int, np.ndarray]:
+    """Simple moving average series for several periods from one prefix sum.
+
+    Args:
+        values: 1-D or (rows x bars) values; NaN bars make the windows
+            covering them NaN
+        periods: Window lengths
+
+    Returns:
+        Dict mapping period to a (rows x bars) series (NaN before the first
+        full window)
+    """
+    values = kernels.as_2d(values)
+    rows, bars = values.shape
+    missing = np.isnan(values)
+    sums = np.zeros((rows, bars + 1))
+    np.cumsum(np.where(missing, 0.0, values), axis=1, out=sums[:, 1:])
+    gaps = None
+    if missing.any():
+        gaps = np.zeros((rows, bars + 1), dtype=np.int64)
+        np.cumsum(missing, axis=1, out=gaps[:, 1:])
+
+    means = {}
+    for period in periods:
+        out = np.full((rows, bars), np.nan)
+        if bars >= period:
+            window = out[:, period - 1 :]
+            np.subtract(sums[:, period:], sums[:, :-period], out=window)
+            window /= period
+            if gaps is not None:
+                window[gaps[:, period:] - gaps[:, :-period] > 0] = np.nan
+        means[period] = out
+    return means
@@ -0,0 +1,218 @@
+"""Per-trading-date peer trend state used for peer confirmation.
+
+PeerStateTable computes a compact trend snapshot (close vs SMA 20/50 and
+5-day return) for every ticker from a single bulk price query per date and
+keeps it in memory, so each signal in a scan can read peer confirmation with
+a dictionary lookup. Tables are dropped when a new trading date lands in
+ws_dse_daily_prices.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from src.database.models import WsDseDailyPrice
+from src.engine.signal_panel import PricePanel, load_price_panel, panel_sma
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PeerState:
+    """Trend snapshot for one ticker on a trading date.
+
+    Attributes:
+        ticker: Stock ticker symbol
+        last_date: Date of the latest bar on or before the table date
+        close: Latest close price
+        sma_20: 20-bar simple moving average (None if insufficient data)
+        sma_50: 50-bar simple moving average (None if insufficient data)
+        return_5d: 5-bar close-to-close return (None if insufficient data)
+    """
+
+    ticker: str
+    last_date: date
+    close: float
+    sma_20: float | None
+    sma_50: float | None
+    return_5d: float | None
+
+    @property
+    def bullish(self) -> bool:
+        """Price above SMA 20 with a positive 5-day return."""
+        return (
+            self.sma_20 is not None
+            and self.return_5d is not None
+            and self.close > self.sma_20
+            and self.return_5d > 0
+        )
+
+    @property
+    def trend(self) -> str:
+        """Trend label from SMA alignment."""
+        if self.sma_20 is None or self.sma_50 is None:
+            return "unknown"
+        if self.close > self.sma_20 > self.sma_50:
+            return "uptrend"
+        if self.close < self.sma_20 < self.sma_50:
+            return "downtrend"
+        return "mixed"
+
+
+class PeerStateTable:
+    """In-memory peer state tables keyed by trading date.
+
+    Example:
+        table = PeerStateTable()
+        state = table.get_state('GP', date(2024, 1, 15), session)
+        if state and state.bullish:
+            ...
+    """
+
+    DEFAULT_LOOKBACK_DAYS = 120  # Calendar days, enough for SMA 50
+    DEFAULT_WATERMARK_CHECK_SECONDS = 60
+    DEFAULT_MAX_DATES = 8
+
+    def __init__(
+        self,
+        lookback_days: int = DEFAULT_LOOKBACK_DAYS,
+        watermark_check_seconds: float = DEFAULT_WATERMARK_CHECK_SECONDS,
+        max_dates: int = DEFAULT_MAX_DATES,
+    ):
+        """Initialize peer state table.
+
+        Args:
+            lookback_days: Calendar days of prices loaded per table
+            watermark_check_seconds: Minimum interval between checks for a new
+                trading date in ws_dse_daily_prices
+            max_dates: Maximum number of per-date tables kept in memory
+        """
+        self.lookback_days = lookback_days
+        self.watermark_check_seconds = watermark_check_seconds
+        self.max_dates = max_dates
+
+        self._tables: OrderedDict[date, dict[str, PeerState]] = OrderedDict()
+        self._watermark: date | None = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    def get_table(self, target_date: date, session: Session) -> dict[str, PeerState]:
+        """Get the peer state table for a trading date, building it if needed.
+
+        Args:
+            target_date: Trading date
+            session: Database session
+
+        Returns:
+            Dict mapping ticker to PeerState
+        """
+        with self._lock:
+            self._check_watermark(session)
+
+            table = self._tables.get(target_date)
+            if table is not None:
+                self._tables.move_to_end(target_date)
+                return table
+
+            table = self._build_table(target_date, session)
+            self._tables[target_date] = table
+            while len(self._tables) > self.max_dates:
+                self._tables.popitem(last=False)
+            return table
+
+    def get_state(self, ticker: str, target_date: date, session: Session) -> PeerState | None:
+        """Get peer state for one ticker (None if it has no recent prices)."""
+        return self.get_table(target_date, session).get(ticker)
+
+    def invalidate(self) -> None:
+        """Drop all cached tables."""
+        with self._lock:
+            self._tables.clear()
+
+    def _check_watermark(self, session: Session) -> None:
+        """Drop cached tables when a new trading date has been loaded."""
+        now = time.monotonic()
+        if self._tables and now - self._last_check < self.watermark_check_seconds:
+            return
+
+        self._last_check = now
+        watermark = session.query(func.max(WsDseDailyPrice.txn_date)).scalar()
+
+        if watermark != self._watermark:
+            if self._tables:
+                logger.info(
+                    f"New price date {watermark} (was {self._watermark}), "
+                    f"invalidating {len(self._tables)} peer state tables"
+                )
+            self._tables.clear()
+            self._watermark = watermark
+
+    def prime(self, target_date: date, table: dict[str, PeerState], session: Session) -> None:
+        """Install a precomputed table for a date (e.g. built from a replay panel)."""
+        with self._lock:
+            self._check_watermark(session)
+            self._tables[target_date] = table
+            self._tables.move_to_end(target_date)
+            while len(self._tables) > self.max_dates:
+                self._tables.popitem(last=False)
+
+    def _build_table(self, target_date: date, session: Session) -> dict[str, PeerState]:
+        """Compute peer state for every ticker from one bulk price query."""
+        start = time.time()
+        panel = load_price_panel(
+            session, None, target_date - timedelta(days=self.lookback_days), target_date
+        )
+        table = build_peer_table(panel)
+
+        elapsed_ms = (time.time() - start) * 1000
+        logger.info(
+            f"Built peer state table for {target_date}: {len(table)} tickers in {elapsed_ms:.0f}ms"
+        )
+        return table
+
+
+def build_peer_table(panel: PricePanel) -> dict[str, PeerState]:
+    """Compute peer state for every ticker in a price panel.
+
+    Args:
+        panel: Price panel whose latest column is the table date
+
+    Returns:
+        Dict mapping ticker to PeerState (tickers without bars are omitted)
+    """
+    if not panel.tickers or panel.width == 0:
+        return {}
+
+    close = panel.close
+    counts = panel.counts
+    sma_20 = panel_sma(close, counts, 20)
+    sma_50 = panel_sma(close, counts, 50)
+
+    return_5d = np.full(len(panel.tickers), np.nan)
+    if panel.width >= 6:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return_5d = (close[:, -1] - close[:, -6]) / close[:, -6]
+        return_5d = np.where((counts >= 6) & (close[:, -6] > 0), return_5d, np.nan)
+
+    def optional(value: float) -> float | None:
+        return None if np.isnan(value) else float(value)
+
+    return {
+        ticker: PeerState(
+            ticker=ticker,
+            last_date=panel.last_dates[i],
+            close=float(close[i, -1]),
+            sma_20=optional(sma_20[i]),
+            sma_50=optional(sma_50[i]),
+            return_5d=optional(return_5d[i]),
+        )
+        for i, ticker in enumerate(panel.tickers)
+        if counts[i] > 0
+    }
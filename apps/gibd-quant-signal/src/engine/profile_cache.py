@@ -0,0 +1,310 @@
+"""In-process cache of stock profiles for signal generation.
+
+ProfileCache bulk-loads every stock_profiles row once into immutable
+ProfileRecord objects and then polls for rows whose last_calibrated_at or
+updated_at moved past the last seen watermark, so a scan reads profiles from
+memory instead of querying the table per ticker. Tickers without a profile
+are queued for calibration on a background worker instead of being calibrated
+inline.
+
+Example:
+    cache = get_profile_cache()
+    profile = cache.get('GP', session)
+    print(cache.get_stats())  # {'hits': ..., 'misses': ..., ...}
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from src.database.models import StockProfile
+from src.profiling.calibrator import StockCalibrator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileRecord:
+    """Immutable snapshot of a stock_profiles row.
+
+    Exposes the attributes the signal engine reads from StockProfile, with
+    numeric columns converted to float and level lists to tuples.
+    """
+
+    ticker: str
+    rsi_overbought: float
+    rsi_oversold: float
+    volatility_category: str | None
+    avg_true_range: float | None
+    typical_volume: int | None
+    high_volume_threshold: float | None
+    support_levels: tuple[float, ...]
+    resistance_levels: tuple[float, ...]
+    last_calibrated_at: datetime | None
+    updated_at: datetime | None
+    next_earnings_date: date | None = None
+
+    @classmethod
+    def from_model(cls, profile: StockProfile) -> "ProfileRecord":
+        """Build a record from a StockProfile row."""
+        return cls(
+            ticker=profile.ticker,
+            rsi_overbought=float(profile.rsi_overbought),
+            rsi_oversold=float(profile.rsi_oversold),
+            volatility_category=profile.volatility_category,
+            avg_true_range=(
+                float(profile.avg_true_range) if profile.avg_true_range is not None else None
+            ),
+            typical_volume=profile.typical_volume,
+            high_volume_threshold=(
+                float(profile.high_volume_threshold)
+                if profile.high_volume_threshold is not None
+                else None
+            ),
+            support_levels=tuple(float(level) for level in profile.support_levels or []),
+            resistance_levels=tuple(float(level) for level in profile.resistance_levels or []),
+            last_calibrated_at=profile.last_calibrated_at,
+            updated_at=profile.updated_at,
+            next_earnings_date=getattr(profile, "next_earnings_date", None),
+        )
+
+
+class ProfileCache:
+    """Watermark-invalidated stock profile cache with background calibration.
+
+    Attributes:
+        poll_seconds: Minimum interval between watermark polls
+        background_calibration: Whether missing profiles are queued for
+            calibration on a worker thread
+    """
+
+    DEFAULT_POLL_SECONDS = 60
+    CALIBRATION_RETRY_SECONDS = 3600
+
+    def __init__(
+        self,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+        background_calibration: bool = True,
+        calibrate: Callable[[str], object] | None = None,
+    ):
+        """Initialize profile cache.
+
+        Args:
+            poll_seconds: Minimum interval between watermark polls
+            background_calibration: Queue missing profiles for calibration
+            calibrate: Optional calibration callable taking a ticker
+                (default: StockCalibrator().calibrate_stock with its own session)
+        """
+        self.poll_seconds = poll_seconds
+        self.background_calibration = background_calibration
+        self._calibrate = calibrate
+
+        self._records: dict[str, ProfileRecord] = {}
+        self._loaded = False
+        self._watermark: datetime | None = None
+        self._last_poll = 0.0
+        self._lock = threading.Lock()
+
+        self._queue: queue.Queue[str] = queue.Queue()
+        self._queued: set[str] = set()
+        self._failed_at: dict[str, float] = {}
+        self._worker: threading.Thread | None = None
+
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "bulk_loads": 0,
+            "polls": 0,
+            "refreshed": 0,
+            "calibrations_queued": 0,
+            "calibrations_completed": 0,
+            "calibrations_failed": 0,
+        }
+
+    def get(self, ticker: str, session: Session) -> ProfileRecord | None:
+        """Get the profile for a ticker.
+
+        Args:
+            ticker: Stock ticker symbol
+            session: Database session (used for the initial load and polls)
+
+        Returns:
+            ProfileRecord, or None if the ticker has no profile yet (it is then
+            queued for background calibration)
+        """
+        return self.get_many([ticker], session).get(ticker)
+
+    def get_many(self, tickers: list[str], session: Session) -> dict[str, ProfileRecord]:
+        """Get profiles for many tickers.
+
+        Args:
+            tickers: Stock ticker symbols
+            session: Database session
+
+        Returns:
+            Dict mapping ticker to ProfileRecord for tickers that have one
+        """
+        self._sync(session)
+
+        found = {}
+        missing = []
+        with self._lock:
+            for ticker in tickers:
+                record = self._records.get(ticker)
+                if record is None:
+                    missing.append(ticker)
+                else:
+                    found[ticker] = record
+            self._stats["hits"] += len(found)
+            self._stats["misses"] += len(missing)
+
+        for ticker in missing:
+            self.request_calibration(ticker)
+
+        return found
+
+    def request_calibration(self, ticker: str) -> bool:
+        """Queue a ticker for background calibration.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            True if newly queued, False if already queued, recently failed or
+            disabled
+        """
+        if not self.background_calibration:
+            return False
+
+        with self._lock:
+            if ticker in self._queued:
+                return False
+            failed_at = self._failed_at.get(ticker)
+            if failed_at is not None:
+                if time.monotonic() - failed_at < self.CALIBRATION_RETRY_SECONDS:
+                    return False
+                del self._failed_at[ticker]
+            self._queued.add(ticker)
+            self._stats["calibrations_queued"] += 1
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._calibration_worker, name="profile-calibration", daemon=True
+                )
+                self._worker.start()
+
+        logger.info(f"No profile for {ticker}, queued for background calibration")
+        self._queue.put(ticker)
+        return True
+
+    def invalidate(self) -> None:
+        """Drop all cached profiles; the next lookup reloads the table."""
+        with self._lock:
+            self._records.clear()
+            self._loaded = False
+            self._watermark = None
+            self._last_poll = 0.0
+
+    def get_stats(self) -> dict:
+        """Get cache statistics.
+
+        Returns:
+            Dict with hit/miss counters, load/poll counts, calibration queue
+            counters, cache size and hit rate
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._records)
+            stats["pending_calibrations"] = len(self._queued)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def _sync(self, session: Session) -> None:
+        """Bulk-load on first use, then poll the watermark at most every poll_seconds."""
+        now = time.monotonic()
+        if self._loaded and now - self._last_poll < self.poll_seconds:
+            return
+
+        with self._lock:
+            if self._loaded and now - self._last_poll < self.poll_seconds:
+                return
+            self._last_poll = now
+
+            query = session.query(StockProfile)
+            if self._loaded and self._watermark is not None:
+                query = query.filter(
+                    or_(
+                        StockProfile.updated_at > self._watermark,
+                        StockProfile.last_calibrated_at > self._watermark,
+                    )
+                )
+                self._stats["polls"] += 1
+            else:
+                self._stats["bulk_loads"] += 1
+
+            rows = query.all()
+            for row in rows:
+                record = ProfileRecord.from_model(row)
+                self._records[record.ticker] = record
+                for stamp in (record.updated_at, record.last_calibrated_at):
+                    if stamp is not None and (self._watermark is None or stamp > self._watermark):
+                        self._watermark = stamp
+
+            if self._loaded:
+                self._stats["refreshed"] += len(rows)
+                if rows:
+                    logger.info(f"Refreshed {len(rows)} stock profiles")
+            else:
+                self._loaded = True
+                logger.info(f"Loaded {len(rows)} stock profiles into cache")
+
+    def _calibration_worker(self) -> None:
+        """Calibrate queued tickers one at a time."""
+        calibrate = self._calibrate
+        if calibrate is None:
+            calibrate = StockCalibrator().calibrate_stock
+
+        while True:
+            try:
+                ticker = self._queue.get(timeout=30)
+            except queue.Empty:
+                with self._lock:
+                    if not self._queued:
+                        self._worker = None
+                        return
+                continue
+
+            try:
+                profile = calibrate(ticker)
+                key = "calibrations_completed" if profile else "calibrations_failed"
+                if not profile:
+                    logger.warning(f"Calibration failed for {ticker}")
+            except Exception as e:
+                logger.error(f"Background calibration failed for {ticker}: {e}")
+                key = "calibrations_failed"
+
+            with self._lock:
+                self._queued.discard(ticker)
+                self._stats[key] += 1
+                if key == "calibrations_failed":
+                    self._failed_at[ticker] = time.monotonic()
+                # Pick up the new row on the next lookup
+                self._last_poll = 0.0
+
+
+_profile_cache: ProfileCache | None = None
+
+
+def get_profile_cache() -> ProfileCache:
+    """Get the process-wide ProfileCache singleton."""
+    global _profile_cache
+    if _profile_cache is None:
+        _profile_cache = ProfileCache()
+    return _profile_cache
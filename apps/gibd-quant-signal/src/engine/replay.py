@@ -0,0 +1,384 @@
+"""Historical signal replay over a preloaded price panel.
+
+SignalReplayer regenerates AdaptiveSignalEngine signals for a date range
+across a universe of tickers. Price and indicator history are loaded once
+per run; the 90-day scoring window is then slid forward in memory and each
+date is scored with the engine's vectorized bulk path, so a replay costs a
+handful of queries instead of one generate_signal() call per (ticker, date).
+
+Example:
+    replayer = SignalReplayer(execution_mode="process", max_workers=4)
+    results = replayer.replay(tickers, date(2022, 1, 1), date(2024, 12, 31))
+    for signal_date, signals in results.items():
+        ...
+"""
+
+import bisect
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from src.database.connection import get_db_context
+from src.database.models import Indicator
+from src.engine.indicator_snapshot import indicator_columns
+from src.engine.peer_state import build_peer_table
+from src.engine.signal_engine import AdaptiveSignalEngine, Signal
+from src.engine.signal_panel import load_price_panel, panel_dates64, slice_panel
+from src.engine.weight_optimizer import save_component_scores
+
+logger = logging.getLogger(__name__)
+
+
+class IndicatorHistory:
+    """Per-ticker, date-ordered history of indicator snapshots (engine keys).
+
+    With keys set, each snapshot is compacted to those keys so multi-year
+    histories stay small; with keys=None every projected key is kept (needed
+    when replayed signals are tracked with their indicators_snapshot).
+    """
+
+    def __init__(self, keys: tuple[str, ...] | None = None):
+        """Initialize an empty history.
+
+        Args:
+            keys: Signal engine indicator keys to keep (None keeps all)
+        """
+        self.keys = keys
+        self._dates: dict[str, list[date]] = {}
+        self._records: dict[str, list[dict]] = {}
+
+    @classmethod
+    def load(
+        cls,
+        session: Session,
+        tickers: list[str],
+        start_date: date,
+        end_date: date,
+        keys: tuple[str, ...] | None = None,
+    ) -> "IndicatorHistory":
+        """Load calculated indicators for many tickers in one streamed query.
+
+        Only the JSONB keys the engine reads are projected (see
+        indicator_snapshot.indicator_columns).
+
+        Args:
+            session: Database session
+            tickers: Ticker symbols
+            start_date: First trading date to load (inclusive)
+            end_date: Last trading date to load (inclusive)
+            keys: Signal engine indicator keys to keep (None keeps all)
+
+        Returns:
+            IndicatorHistory
+        """
+        history = cls(keys)
+        if not tickers:
+            return history
+
+        columns = indicator_columns()
+        names = [column.name for column in columns]
+        rows = (
+            session.query(Indicator.scrip, Indicator.trading_date, *columns)
+            .filter(
+                Indicator.scrip.in_(tickers),
+                Indicator.trading_date >= start_date,
+                Indicator.trading_date <= end_date,
+                Indicator.status == "CALCULATED",
+            )
+            .order_by(Indicator.scrip, Indicator.trading_date)
+            .yield_per(5000)
+        )
+
+        count = 0
+        for scrip, trading_date, *values in rows:
+            indicators = {
+                name: value for name, value in zip(names, values, strict=True) if value is not None
+            }
+            history.append(scrip, trading_date, indicators)
+            count += 1
+
+        logger.info(f"Loaded {count} indicator rows for {len(tickers)} tickers")
+        return history
+
+    def append(self, ticker: str, trading_date: date, indicators: dict) -> None:
+        """Append one snapshot; snapshots must arrive in date order per ticker."""
+        if self.keys is not None:
+            indicators = {key: indicators[key] for key in self.keys if key in indicators}
+        self._dates.setdefault(ticker, []).append(trading_date)
+        self._records.setdefault(ticker, []).append(indicators)
+
+    def as_of(self, ticker: str, target_date: date) -> dict:
+        """Latest snapshot on or before target_date (empty dict if none)."""
+        dates = self._dates.get(ticker)
+        if not dates:
+            return {}
+        position = bisect.bisect_right(dates, target_date) - 1
+        if position < 0:
+            return {}
+        return self._records[ticker][position]
+
+
+class SignalReplayer:
+    """Replay the signal engine over a date range from preloaded history.
+
+    Supports the same execution modes as BatchCalculator:
+    - sequential: one pass over all tickers
+    - thread / process: tickers are split into chunks replayed in parallel,
+      each worker with its own engine, database session and preloaded panel
+
+    Attributes:
+        execution_mode: 'sequential', 'thread', or 'process'
+        max_workers: Maximum number of parallel workers
+    """
+
+    EXECUTION_MODES = ["sequential", "thread", "process"]
+    DEFAULT_MAX_WORKERS = 4
+    WINDOW_DAYS = 90  # Same calendar window as generate_signal()
+
+    def __init__(
+        self,
+        execution_mode: str = "sequential",
+        max_workers: int | None = None,
+        engine_kwargs: dict[str, Any] | None = None,
+    ):
+        """Initialize signal replayer.
+
+        Args:
+            execution_mode: How to run the replay ('sequential', 'thread', 'process')
+            max_workers: Maximum number of parallel workers (default: 4)
+            engine_kwargs: Keyword arguments for AdaptiveSignalEngine (weights,
+                buy_threshold, sell_threshold)
+
+        Raises:
+            ValueError: If execution_mode is not valid
+        """
+        if execution_mode not in self.EXECUTION_MODES:
+            raise ValueError(
+                f"Invalid execution_mode: {execution_mode}. Must be one of {self.EXECUTION_MODES}"
+            )
+
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.execution_mode = execution_mode
+        self.max_workers = max_workers or self.DEFAULT_MAX_WORKERS
+        self.engine_kwargs = engine_kwargs or {}
+
+    def replay(
+        self,
+        tickers: list[str],
+        start_date: date,
+        end_date: date,
+        track: bool = False,
+        progress_callback: Callable[[int, int], None] | None = None,
+        detail: str = AdaptiveSignalEngine.DETAIL_SCORES,
+        persist_scores: bool = False,
+    ) -> dict[date, dict[str, Signal]]:
+        """Generate signals for every trading date in a range.
+
+        Args:
+            tickers: Stock ticker symbols
+            start_date: First date to generate signals for
+            end_date: Last date to generate signals for
+            track: Record replayed signals in signal_history (default: False)
+            progress_callback: Optional callback(completed_chunks, total_chunks)
+            detail: Signal detail level (default: 'scores'; decision trees can
+                be rebuilt with AdaptiveSignalEngine.explain_signal)
+            persist_scores: Store component scores in signal_component_scores
+                for weight optimization (requires 'scores' or 'full' detail)
+
+        Returns:
+            Dict mapping trading date to {ticker: Signal}
+
+        Raises:
+            ValueError: If detail is invalid, or 'minimal' with persist_scores
+        """
+        AdaptiveSignalEngine._check_detail(detail)
+        if persist_scores and detail == AdaptiveSignalEngine.DETAIL_MINIMAL:
+            raise ValueError("persist_scores requires component scores (detail 'scores' or 'full')")
+        tickers = list(dict.fromkeys(tickers))
+        start = time.time()
+        self.logger.info(
+            f"Replaying {len(tickers)} tickers from {start_date} to {end_date} "
+            f"(mode={self.execution_mode})"
+        )
+
+        if self.execution_mode == "sequential" or len(tickers) <= 1:
+            results = replay_chunk(
+                tickers,
+                start_date,
+                end_date,
+                track,
+                self.engine_kwargs,
+                detail,
+                persist_scores,
+            )
+            if progress_callback:
+                progress_callback(1, 1)
+        else:
+            results = self._replay_parallel(
+                tickers, start_date, end_date, track, progress_callback, detail, persist_scores
+            )
+
+        total = sum(len(signals) for signals in results.values())
+        self.logger.info(
+            f"Replay complete: {total} signals over {len(results)} dates "
+            f"in {time.time() - start:.1f}s"
+        )
+        return dict(sorted(results.items()))
+
+    def _replay_parallel(
+        self,
+        tickers: list[str],
+        start_date: date,
+        end_date: date,
+        track: bool,
+        progress_callback: Callable[[int, int], None] | None,
+        detail: str,
+        persist_scores: bool,
+    ) -> dict[date, dict[str, Signal]]:
+        """Replay ticker chunks on a thread or process pool and merge the results."""
+        chunk_count = min(self.max_workers, len(tickers))
+        chunks = [tickers[i::chunk_count] for i in range(chunk_count)]
+
+        executor_class = (
+            ProcessPoolExecutor if self.execution_mode == "process" else ThreadPoolExecutor
+        )
+
+        results: dict[date, dict[str, Signal]] = {}
+        completed = 0
+
+        with executor_class(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(
+                    replay_chunk,
+                    chunk,
+                    start_date,
+                    end_date,
+                    track,
+                    self.engine_kwargs,
+                    detail,
+                    persist_scores,
+                )
+                for chunk in chunks
+            ]
+
+            for future in as_completed(futures):
+                try:
+                    for signal_date, signals in future.result().items():
+                        results.setdefault(signal_date, {}).update(signals)
+                except Exception as e:
+                    self.logger.error(f"Replay chunk failed: {e}")
+
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, len(chunks))
+
+        return results
+
+
+def replay_chunk(
+    tickers: list[str],
+    start_date: date,
+    end_date: date,
+    track: bool = False,
+    engine_kwargs: dict[str, Any] | None = None,
+    detail: str = AdaptiveSignalEngine.DETAIL_SCORES,
+    persist_scores: bool = False,
+) -> dict[date, dict[str, Signal]]:
+    """Replay one set of tickers with its own engine and session.
+
+    Module-level so it can run in a ProcessPoolExecutor worker.
+
+    Args:
+        tickers: Stock ticker symbols
+        start_date: First date to generate signals for
+        end_date: Last date to generate signals for
+        track: Record replayed signals in signal_history
+        engine_kwargs: Keyword arguments for AdaptiveSignalEngine
+        detail: Signal detail level
+        persist_scores: Store component scores in signal_component_scores
+
+    Returns:
+        Dict mapping trading date to {ticker: Signal}
+    """
+    with get_db_context() as session:
+        engine = AdaptiveSignalEngine(session=session, **(engine_kwargs or {}))
+        return _replay_with_session(
+            engine, tickers, start_date, end_date, track, session, detail, persist_scores
+        )
+
+
+def _replay_with_session(
+    engine: AdaptiveSignalEngine,
+    tickers: list[str],
+    start_date: date,
+    end_date: date,
+    track: bool,
+    session: Session,
+    detail: str = AdaptiveSignalEngine.DETAIL_SCORES,
+    persist_scores: bool = False,
+) -> dict[date, dict[str, Signal]]:
+    """Load history once, then slide the scoring window across the date range.
+
+    Indicator snapshots are looked up no further back than the 90-day window
+    before start_date; older snapshots are not used as a fallback.
+    """
+    window = timedelta(days=SignalReplayer.WINDOW_DAYS)
+    peer_window = timedelta(days=engine.peer_states.lookback_days)
+
+    profiles = engine.profile_cache.get_many(tickers, session)
+    sectors, universe = engine._sector_universe(tickers)
+
+    panel = load_price_panel(session, universe, start_date - max(window, peer_window), end_date)
+    history = IndicatorHistory.load(
+        session,
+        list(profiles),
+        start_date - window,
+        end_date,
+        keys=(
+            None
+            if track and detail == engine.DETAIL_FULL
+            else engine.SCORING_INDICATOR_KEYS
+        ),
+    )
+    dates64 = panel_dates64(panel)
+
+    trading_dates = sorted(
+        {
+            bar_date
+            for ticker in tickers
+            if ticker in panel.index
+            for bar_date in panel.dates[panel.index[ticker]]
+            if start_date <= bar_date <= end_date
+        }
+    )
+
+    results: dict[date, dict[str, Signal]] = {}
+    for target_date in trading_dates:
+        peer_panel = slice_panel(panel, target_date - peer_window, target_date, dates64)
+        engine.peer_states.prime(target_date, build_peer_table(peer_panel), session)
+
+        window_panel = slice_panel(panel, target_date - window, target_date, dates64)
+        raw_indicators = {ticker: history.as_of(ticker, target_date) for ticker in profiles}
+
+        signals = engine._signals_from_panel(
+            tickers,
+            target_date,
+            session,
+            window_panel,
+            profiles,
+            sectors,
+            raw_indicators,
+            track=track,
+            detail=detail,
+        )
+        if signals:
+            results[target_date] = signals
+            if persist_scores:
+                save_component_scores(session, signals.values())
+
+    return results
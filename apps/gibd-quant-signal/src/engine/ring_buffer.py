@@ -0,0 +1,232 @@
+"""Fixed-size float ring buffer with O(1) rolling mean and standard deviation.
+
+RingBuffer backs the rolling windows of IncrementalState (SMA 20/50/200,
+Bollinger Bands, MACD signal, Stochastic, CCI, MFI). Values live in one
+preallocated float64 array; the mean and sum of squared deviations are
+maintained with Welford's update (extended to sliding windows), so pushing a
+value costs O(1) regardless of window size and stays numerically stable for
+price-sized values.
+RingBufferArray applies the same updates to one buffer per ticker at once
+for the market-wide incremental engine.
+
+Example:
+    window = RingBuffer.from_values(closes[-20:], capacity=20)
+    window.push(new_close)
+    middle, std = window.mean(), window.std()
+"""
+
+import numpy as np
+
+
+class RingBuffer:
+    """Rolling window of the last `capacity` floats.
+
+    Attributes:
+        capacity: Maximum number of values kept
+    """
+
+    __slots__ = ("capacity", "_values", "_head", "_count", "_mean", "_m2")
+
+    def __init__(self, capacity: int):
+        """Initialize an empty buffer.
+
+        Args:
+            capacity: Maximum number of values kept
+        """
+        self.capacity = capacity
+        self._values = np.zeros(capacity, dtype=np.float64)
+        self._head = 0  # Slot of the oldest value once full
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0  # Sum of squared deviations from the mean
+
+    @classmethod
+    def from_values(cls, values, capacity: int) -> "RingBuffer":
+        """Build a buffer holding the last `capacity` of the given values (oldest first)."""
+        buffer = cls(capacity)
+        tail = np.asarray(values, dtype=np.float64)[-capacity:]
+        count = len(tail)
+        if count:
+            buffer._values[:count] = tail
+            buffer._count = count
+            buffer._mean = float(tail.mean())
+            buffer._m2 = float(((tail - buffer._mean) ** 2).sum())
+        return buffer
+
+    def copy(self) -> "RingBuffer":
+        """Independent copy of the buffer."""
+        buffer = RingBuffer.__new__(RingBuffer)
+        buffer.capacity = self.capacity
+        buffer._values = self._values.copy()
+        buffer._head = self._head
+        buffer._count = self._count
+        buffer._mean = self._mean
+        buffer._m2 = self._m2
+        return buffer
+
+    def push(self, value: float) -> None:
+        """Append a value, evicting the oldest one when full."""
+        value = float(value)  # Keep running stats as Python floats (fast scalar math)
+        if self._count < self.capacity:
+            self._values[(self._head + self._count) % self.capacity] = value
+            self._count += 1
+            delta = value - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (value - self._mean)
+            return
+
+        oldest = float(self._values[self._head])
+        self._values[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+
+        old_mean = self._mean
+        self._mean += (value - oldest) / self.capacity
+        self._m2 += (value - oldest) * (value - self._mean + oldest - old_mean)
+        if self._m2 < 0.0:  # Rounding on a constant window
+            self._m2 = 0.0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def full(self) -> bool:
+        """Whether the buffer holds `capacity` values."""
+        return self._count == self.capacity
+
+    def mean(self) -> float:
+        """Mean of the held values (NaN when empty)."""
+        return self._mean if self._count else float("nan")
+
+    def std(self) -> float:
+        """Population standard deviation of the held values (as np.std)."""
+        return (self._m2 / self._count) ** 0.5 if self._count else float("nan")
+
+    def sum(self) -> float:
+        """Sum of the held values (0.0 when empty)."""
+        return self._mean * self._count
+
+    def max(self) -> float:
+        """Largest held value (NaN when empty)."""
+        return float(self._values[: self._count].max()) if self._count else float("nan")
+
+    def min(self) -> float:
+        """Smallest held value (NaN when empty)."""
+        return float(self._values[: self._count].min()) if self._count else float("nan")
+
+    def mean_abs_deviation(self) -> float:
+        """Mean absolute deviation from the mean (O(capacity); NaN when empty)."""
+        if not self._count:
+            return float("nan")
+        return float(np.abs(self._values[: self._count] - self._mean).mean())
+
+    def ago(self, offset: int) -> float:
+        """Value pushed `offset` pushes before the newest (0 is the newest; NaN if not held)."""
+        if not 0 <= offset < self._count:
+            return float("nan")
+        return float(self._values[(self._head + self._count - 1 - offset) % self.capacity])
+
+    def to_array(self) -> np.ndarray:
+        """Held values, oldest first."""
+        order = (self._head + np.arange(self._count)) % self.capacity
+        return self._values[order]
+
+    def tolist(self) -> list[float]:
+        """Held values, oldest first."""
+        return self.to_array().tolist()
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory footprint in bytes (object plus value array)."""
+        return object.__sizeof__(self) + self._values.__sizeof__()
+
+    def __repr__(self) -> str:
+        return f"RingBuffer(capacity={self.capacity}, count={self._count}, mean={self.mean():.4f})"
+
+
+class RingBufferArray:
+    """One RingBuffer per row, stored as aligned arrays for vectorized updates.
+
+    Rows advance independently (each has its own head and count), so a push
+    can update any subset of rows in one call.
+
+    Attributes:
+        capacity: Maximum number of values kept per row
+    """
+
+    __slots__ = ("capacity", "values", "head", "count", "mean", "m2")
+
+    def __init__(self, rows: int, capacity: int):
+        """Initialize empty buffers.
+
+        Args:
+            rows: Number of rows (tickers)
+            capacity: Maximum number of values kept per row
+        """
+        self.capacity = capacity
+        self.values = np.zeros((rows, capacity), dtype=np.float64)
+        self.head = np.zeros(rows, dtype=np.int64)
+        self.count = np.zeros(rows, dtype=np.int64)
+        self.mean = np.zeros(rows, dtype=np.float64)
+        self.m2 = np.zeros(rows, dtype=np.float64)
+
+    @classmethod
+    def from_rows(cls, windows: list, capacity: int) -> "RingBufferArray":
+        """Build from per-row value sequences (oldest first; the last `capacity` are kept)."""
+        buffers = cls(len(windows), capacity)
+        for i, window in enumerate(windows):
+            tail = np.asarray(window, dtype=np.float64)[-capacity:]
+            count = len(tail)
+            if count:
+                buffers.values[i, :count] = tail
+                buffers.count[i] = count
+                buffers.mean[i] = tail.mean()
+                buffers.m2[i] = ((tail - buffers.mean[i]) ** 2).sum()
+        return buffers
+
+    def push(self, rows: np.ndarray, values: np.ndarray) -> None:
+        """Append one value to each selected row, evicting the oldest when full.
+
+        Args:
+            rows: Row indices to update (unique)
+            values: One value per row in `rows`
+        """
+        full = self.count[rows] == self.capacity
+
+        grow, x = rows[~full], values[~full]
+        if len(grow):
+            self.values[grow, (self.head[grow] + self.count[grow]) % self.capacity] = x
+            self.count[grow] += 1
+            delta = x - self.mean[grow]
+            self.mean[grow] += delta / self.count[grow]
+            self.m2[grow] += delta * (x - self.mean[grow])
+
+        slide, x = rows[full], values[full]
+        if len(slide):
+            head = self.head[slide]
+            oldest = self.values[slide, head]
+            self.values[slide, head] = x
+            self.head[slide] = (head + 1) % self.capacity
+
+            old_mean = self.mean[slide]
+            new_mean = old_mean + (x - oldest) / self.capacity
+            self.mean[slide] = new_mean
+            self.m2[slide] = np.maximum(
+                self.m2[slide] + (x - oldest) * (x - new_mean + oldest - old_mean), 0.0
+            )
+
+    def std(self) -> np.ndarray:
+        """Population standard deviation per row (NaN for empty rows)."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.sqrt(self.m2 / np.where(self.count > 0, self.count, np.nan))
+
+    def row(self, i: int) -> np.ndarray:
+        """Held values of one row, oldest first."""
+        order = (self.head[i] + np.arange(self.count[i])) % self.capacity
+        return self.values[i, order]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the arrays in bytes."""
+        return sum(
+            array.nbytes for array in (self.values, self.head, self.count, self.mean, self.m2)
+        )
@@ -0,0 +1,163 @@
+"""Data-versioned cache of generated signals.
+
+A signal only changes when its inputs change: the engine parameters (weights,
+thresholds, detail level) or the GIBD data it reads. SignalCache keys signals
+by ticker, target date, a hash of the engine parameters and a data version
+made of the latest ws_dse_daily_prices.last_updated_at,
+indicators.updated_at, stock_profiles.updated_at and
+stock_profiles.last_calibrated_at (calibration does not touch updated_at).
+The version is re-read at most every version_check_seconds; when it moves,
+the in-process tier is cleared and entries under the old version are never
+read again.
+
+Example:
+    cache = get_signal_cache()
+    key = cache.key(engine, 'GP', date(2024, 1, 15), 'full', cache.data_version())
+    signal = cache.get(key)
+"""
+
+import copy
+import logging
+import os
+import threading
+import time
+from datetime import date
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.database.connection import get_db_context
+from src.database.models import Indicator, StockProfile, WsDseDailyPrice
+from src.engine.cache import TieredCache, stable_hash
+
+logger = logging.getLogger(__name__)
+
+
+class SignalCache:
+    """Signal cache keyed by inputs and data version.
+
+    Attributes:
+        version_check_seconds: Minimum interval between data version queries
+    """
+
+    DEFAULT_VERSION_CHECK_SECONDS = 30
+
+    def __init__(
+        self,
+        cache: TieredCache | None = None,
+        version_check_seconds: float = DEFAULT_VERSION_CHECK_SECONDS,
+    ):
+        """Initialize signal cache.
+
+        Args:
+            cache: Backing cache (default: in-process TieredCache)
+            version_check_seconds: Minimum interval between data version queries
+        """
+        self.version_check_seconds = version_check_seconds
+        self._cache = cache or TieredCache(namespace="signal")
+
+        self._version: tuple[str | None, ...] | None = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    def data_version(self, session: Session | None = None) -> tuple[str | None, ...]:
+        """Get the current data version, re-reading it when the check interval passed.
+
+        Args:
+            session: Optional database session (a short-lived one is opened
+                if needed and none is given)
+
+        Returns:
+            Tuple of ISO timestamps (prices, indicators, profile updates,
+            profile calibrations)
+        """
+        now = time.monotonic()
+        if self._version is not None and now - self._last_check < self.version_check_seconds:
+            return self._version
+
+        with self._lock:
+            if self._version is not None and now - self._last_check < self.version_check_seconds:
+                return self._version
+
+            if session is None:
+                with get_db_context() as own_session:
+                    version = self._query_version(own_session)
+            else:
+                version = self._query_version(session)
+            self._last_check = now
+
+            if version != self._version:
+                if self._version is not None:
+                    logger.info(f"Signal data version moved to {version}, clearing signal cache")
+                    self._cache.clear()
+                self._version = version
+            return version
+
+    @staticmethod
+    def key(engine, ticker: str, target_date: date, detail: str, version: tuple) -> tuple:
+        """Build the cache key for one signal.
+
+        Args:
+            engine: AdaptiveSignalEngine generating the signal
+            ticker: Stock ticker symbol
+            target_date: Signal date
+            detail: Signal detail level
+            version: Data version from data_version()
+
+        Returns:
+            Hashable key
+        """
+        return (
+            ticker,
+            target_date.isoformat(),
+            stable_hash(sorted(engine.weights.items())),
+            float(engine.buy_threshold),
+            float(engine.sell_threshold),
+            detail,
+            version,
+        )
+
+    def get(self, key: tuple):
+        """Get a deep copy of a cached signal (None on a miss)."""
+        signal = self._cache.get(key)
+        return copy.deepcopy(signal) if signal is not None else None
+
+    def set(self, key: tuple, signal) -> None:
+        """Cache a deep copy of a signal (None is not cached)."""
+        if signal is not None:
+            self._cache.set(key, copy.deepcopy(signal))
+
+    def get_stats(self) -> dict:
+        """Get backing cache statistics plus the current data version."""
+        stats = self._cache.get_stats()
+        stats["data_version"] = self._version
+        return stats
+
+    @staticmethod
+    def _query_version(session: Session) -> tuple[str | None, ...]:
+        """Read the latest update timestamps of every input table in one round trip."""
+        row = session.execute(
+            select(
+                select(func.max(WsDseDailyPrice.last_updated_at)).scalar_subquery(),
+                select(func.max(Indicator.updated_at)).scalar_subquery(),
+                select(func.max(StockProfile.updated_at)).scalar_subquery(),
+                select(func.max(StockProfile.last_calibrated_at)).scalar_subquery(),
+            )
+        ).one()
+        return tuple(value.isoformat() if value is not None else None for value in row)
+
+
+_signal_cache: SignalCache | None = None
+
+
+def get_signal_cache() -> SignalCache:
+    """Get the process-wide SignalCache singleton.
+
+    The Redis tier is enabled when SIGNAL_CACHE_REDIS_URL is set.
+    """
+    global _signal_cache
+    if _signal_cache is None:
+        _signal_cache = SignalCache(
+            TieredCache(namespace="signal", redis_url=os.getenv("SIGNAL_CACHE_REDIS_URL"))
+        )
+    return _signal_cache
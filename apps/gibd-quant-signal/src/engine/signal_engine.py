@@ -8,6 +8,11 @@ This module implements the core signal generation logic using:
 - Chandelier trailing stops
 - Explainable decision trees
 
+Detail Levels (generate_signal / generate_signals_bulk):
+- full: Scores, decision tree, warnings and tracked indicator snapshot
+- scores: Component scores and warnings; decision tree built on demand by explain_signal()
+- minimal: Type, total score, confidence, prices and stops only
+
 Signal Types:
 - BUY: Score >= 0.4
 - SELL: Score <= -0.4
@@ -15,6 +20,7 @@ Signal Types:
 """
 
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from uuid import uuid4
@@ -23,10 +29,30 @@ import numpy as np
 import pandas as pd
 from sqlalchemy.orm import Session
 
-from src.backtesting.outcome_tracker import SignalOutcomeTracker
 from src.database.connection import get_db_context
-from src.database.models import Indicator, StockProfile, WsDseDailyPrice
-from src.profiling.calibrator import StockCalibrator
+from src.database.market_data import load_ohlcv
+from src.engine import indicator_kernels as kernels
+from src.engine.index_context import get_index_context_service
+from src.engine.indicator_graph import (
+    FALLBACK_GRAPH,
+    FALLBACK_MIN_BARS,
+    FALLBACK_SOURCES,
+    ohlcv_sources,
+)
+from src.engine.indicator_snapshot import load_latest_indicators
+from src.engine.peer_state import PeerStateTable
+from src.engine.profile_cache import ProfileRecord, get_profile_cache
+from src.engine.signal_cache import get_signal_cache
+from src.engine.signal_sink import get_signal_sink
+from src.engine.signal_panel import (
+    PricePanel,
+    load_price_panel,
+    panel_adx,
+    panel_atr,
+    panel_macd_histogram,
+    panel_rsi,
+    panel_sma,
+)
 from src.sectors.manager import SectorManager
 
 logger = logging.getLogger(__name__)
@@ -61,6 +87,8 @@ class Signal:
 
         # Warnings
         warnings: List of warning messages (e.g., earnings overlap)
+
+        detail: Detail level the signal was generated with (minimal, scores, full)
     """
 
     signal_id: str = field(default_factory=lambda: str(uuid4()))
@@ -89,12 +117,14 @@ class Signal:
     # Warnings
     warnings: list[str] = field(default_factory=list)
 
+    detail: str = "full"
+
 
 class AdaptiveSignalEngine:
     """Signal generation engine with adaptive thresholds.
 
     Integrates:
-    - StockCalibrator for stock-specific thresholds
+    - StockCalibrator profiles (via ProfileCache) for stock-specific thresholds
     - SectorManager for sector-relative analysis
     - Multi-factor scoring framework
     - Swing trading enhancements
@@ -112,12 +142,19 @@ class AdaptiveSignalEngine:
     DEFAULT_BUY_THRESHOLD = 0.4
     DEFAULT_SELL_THRESHOLD = -0.4
 
+    # Signal detail levels
+    DETAIL_MINIMAL = "minimal"
+    DETAIL_SCORES = "scores"
+    DETAIL_FULL = "full"
+    DETAIL_LEVELS = (DETAIL_MINIMAL, DETAIL_SCORES, DETAIL_FULL)
+
     def __init__(
         self,
         weights: dict[str, float] | None = None,
         session: Session | None = None,
         buy_threshold: float | None = None,
         sell_threshold: float | None = None,
+        sector_manager: SectorManager | None = None,
     ):
         """Initialize adaptive signal engine.
 
@@ -126,6 +163,8 @@ class AdaptiveSignalEngine:
             session: Optional database session
             buy_threshold: Score threshold for BUY signals (default: 0.4)
             sell_threshold: Score threshold for SELL signals (default: -0.4)
+            sector_manager: Optional shared SectorManager (default: a new one,
+                which loads the company table on first use)
         """
         # Default weights (must sum to 1.0)
         self.weights = weights or {
@@ -146,9 +185,12 @@ class AdaptiveSignalEngine:
             sell_threshold if sell_threshold is not None else self.DEFAULT_SELL_THRESHOLD
         )
 
-        self.calibrator = StockCalibrator()
-        self.sector_manager = SectorManager()
-        self.outcome_tracker = SignalOutcomeTracker(session=session)
+        self.sector_manager = sector_manager or SectorManager()
+        self.signal_sink = get_signal_sink()
+        self.profile_cache = get_profile_cache()
+        self.peer_states = PeerStateTable()
+        self.index_context = get_index_context_service()
+        self.signal_cache = get_signal_cache()
         self._session = session
 
         threshold_info = f"thresholds: BUY>={self.buy_threshold}, SELL<={self.sell_threshold}"
@@ -160,11 +202,28 @@ class AdaptiveSignalEngine:
         value = indicators.get(key, default)
         return float(value) if value is not None else default
 
+    @classmethod
+    def _check_detail(cls, detail: str) -> None:
+        """Raise ValueError for an unknown detail level."""
+        if detail not in cls.DETAIL_LEVELS:
+            raise ValueError(f"Invalid detail: {detail}. Must be one of {cls.DETAIL_LEVELS}")
+
+    @staticmethod
+    def _is_missing(value) -> bool:
+        """Check whether an indicator value is absent (None or float NaN)."""
+        return value is None or (isinstance(value, float) and np.isnan(value))
+
+    @staticmethod
+    def _latest(series: np.ndarray) -> float | None:
+        """Latest valid value of a single-row kernel result (None if there is none)."""
+        value = kernels.last_valid(series)[0]
+        return None if np.isnan(value) else float(value)
+
     def _calculate_rsi_from_prices(self, prices: pd.Series, period: int = 14) -> float | None:
-        """Calculate RSI from price series using pure pandas.
+        """Calculate RSI from price series with the shared indicator kernels.
 
-        Uses the same algorithm as StockCalibrator._calculate_rsi().
         RSI = 100 - (100 / (1 + RS)) where RS = Average Gain / Average Loss
+        (simple rolling averages).
 
         Args:
             prices: Close price series
@@ -176,35 +235,14 @@ class AdaptiveSignalEngine:
         if len(prices) < period + 1:
             return None
 
-        delta = prices.diff()
-        gain = delta.where(delta > 0, 0).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-        # Get the last values
-        last_gain = gain.iloc[-1]
-        last_loss = abs(loss.iloc[-1])  # Ensure positive
-
-        # Handle edge cases
-        if pd.isna(last_gain) or pd.isna(last_loss):
-            return None
-
-        if last_loss == 0:
-            # All gains, no losses = RSI of 100 (extremely overbought)
-            return 100.0 if last_gain > 0 else 50.0
-
-        if last_gain == 0:
-            # All losses, no gains = RSI of 0 (extremely oversold)
-            return 0.0
-
-        rs = last_gain / last_loss
-        rsi = 100 - (100 / (1 + rs))
-
-        return float(rsi)
+        return self._latest(
+            kernels.rsi(prices.to_numpy(dtype=np.float64)[-(period + 1) :], period)
+        )
 
     def _calculate_macd_histogram_from_prices(
         self, prices: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9
     ) -> float | None:
-        """Calculate MACD histogram from price series using pure pandas.
+        """Calculate MACD histogram from price series with the shared indicator kernels.
 
         MACD = EMA(fast) - EMA(slow)
         Signal = EMA(MACD, signal)
@@ -219,25 +257,11 @@ class AdaptiveSignalEngine:
         Returns:
             Latest MACD histogram value or None if insufficient data
         """
-        min_required = slow + signal
-        if len(prices) < min_required:
+        if len(prices) < slow + signal:
             return None
 
-        # Calculate EMAs
-        ema_fast = prices.ewm(span=fast, adjust=False).mean()
-        ema_slow = prices.ewm(span=slow, adjust=False).mean()
-
-        # MACD line
-        macd_line = ema_fast - ema_slow
-
-        # Signal line
-        signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-
-        # Histogram
-        histogram = macd_line - signal_line
-
-        valid_histogram = histogram.dropna()
-        return float(valid_histogram.iloc[-1]) if len(valid_histogram) > 0 else None
+        _, _, histogram = kernels.macd(prices.to_numpy(dtype=np.float64), fast, slow, signal)
+        return self._latest(histogram)
 
     def _calculate_sma_from_prices(self, prices: pd.Series, period: int) -> float | None:
         """Calculate Simple Moving Average from price series.
@@ -252,9 +276,7 @@ class AdaptiveSignalEngine:
         if len(prices) < period:
             return None
 
-        sma = prices.rolling(window=period).mean()
-        valid_sma = sma.dropna()
-        return float(valid_sma.iloc[-1]) if len(valid_sma) > 0 else None
+        return self._latest(kernels.sma(prices.to_numpy(dtype=np.float64)[-period:], period))
 
     def _calculate_adx_from_prices(self, df: pd.DataFrame, period: int = 14) -> float | None:
         """Calculate ADX (Average Directional Index) from OHLC data.
@@ -271,35 +293,14 @@ class AdaptiveSignalEngine:
         if len(df) < period * 2:
             return None
 
-        high = df["high"]
-        low = df["low"]
-        close = df["close"]
-
-        # Calculate True Range
-        tr1 = high - low
-        tr2 = (high - close.shift(1)).abs()
-        tr3 = (low - close.shift(1)).abs()
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-        # Calculate +DM and -DM
-        up_move = high - high.shift(1)
-        down_move = low.shift(1) - low
-
-        plus_dm = up_move.where((up_move > down_move) & (up_move > 0), 0)
-        minus_dm = down_move.where((down_move > up_move) & (down_move > 0), 0)
-
-        # Smoothed values using Wilder's smoothing (rolling mean)
-        atr = tr.rolling(window=period).mean()
-        plus_di = 100 * (plus_dm.rolling(window=period).mean() / atr)
-        minus_di = 100 * (minus_dm.rolling(window=period).mean() / atr)
-
-        # DX and ADX
-        di_sum = plus_di + minus_di
-        dx = 100 * ((plus_di - minus_di).abs() / di_sum.replace(0, np.nan))
-        adx = dx.rolling(window=period).mean()
-
-        valid_adx = adx.dropna()
-        return float(valid_adx.iloc[-1]) if len(valid_adx) > 0 else None
+        return self._latest(
+            kernels.adx(
+                df["high"].to_numpy(dtype=np.float64),
+                df["low"].to_numpy(dtype=np.float64),
+                df["close"].to_numpy(dtype=np.float64),
+                period,
+            )
+        )
 
     def _calculate_atr_from_prices(self, df: pd.DataFrame, period: int = 14) -> float | None:
         """Calculate ATR (Average True Range) from OHLC data.
@@ -314,19 +315,14 @@ class AdaptiveSignalEngine:
         if len(df) < period + 1:
             return None
 
-        high = df["high"]
-        low = df["low"]
-        close = df["close"]
-
-        tr1 = high - low
-        tr2 = (high - close.shift(1)).abs()
-        tr3 = (low - close.shift(1)).abs()
-
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(window=period).mean()
-
-        valid_atr = atr.dropna()
-        return float(valid_atr.iloc[-1]) if len(valid_atr) > 0 else None
+        return self._latest(
+            kernels.atr(
+                df["high"].to_numpy(dtype=np.float64),
+                df["low"].to_numpy(dtype=np.float64),
+                df["close"].to_numpy(dtype=np.float64),
+                period,
+            )
+        )
 
     def _enrich_indicators(self, indicators: dict, df: pd.DataFrame) -> dict:
         """Enrich indicators dict with calculated values if missing.
@@ -343,64 +339,27 @@ class AdaptiveSignalEngine:
         """
         enriched = dict(indicators)  # Copy to avoid mutating original
 
-        # RSI
-        if enriched.get("rsi") is None or (
-            isinstance(enriched.get("rsi"), float) and np.isnan(enriched["rsi"])
-        ):
-            rsi = self._calculate_rsi_from_prices(df["close"])
-            if rsi is not None:
-                enriched["rsi"] = rsi
-                logger.debug(f"Enriched RSI from prices: {rsi:.2f}")
-
-        # MACD histogram
-        if enriched.get("macd_histogram") is None or (
-            isinstance(enriched.get("macd_histogram"), float)
-            and np.isnan(enriched["macd_histogram"])
-        ):
-            macd_hist = self._calculate_macd_histogram_from_prices(df["close"])
-            if macd_hist is not None:
-                enriched["macd_histogram"] = macd_hist
-                logger.debug(f"Enriched MACD histogram from prices: {macd_hist:.4f}")
+        # Missing values come from one fallback-graph evaluation, so shared
+        # intermediates (true range for ADX/ATR, EMA 12/26) are computed once
+        missing = [name for name in FALLBACK_MIN_BARS if self._is_missing(enriched.get(name))]
+        if not missing:
+            return enriched
 
-        # SMA 20
-        if enriched.get("sma_20") is None or (
-            isinstance(enriched.get("sma_20"), float) and np.isnan(enriched["sma_20"])
-        ):
-            sma_20 = self._calculate_sma_from_prices(df["close"], 20)
-            if sma_20 is not None:
-                enriched["sma_20"] = sma_20
-                logger.debug(f"Enriched SMA 20 from prices: {sma_20:.2f}")
-
-        # SMA 50
-        if enriched.get("sma_50") is None or (
-            isinstance(enriched.get("sma_50"), float) and np.isnan(enriched["sma_50"])
-        ):
-            sma_50 = self._calculate_sma_from_prices(df["close"], 50)
-            if sma_50 is not None:
-                enriched["sma_50"] = sma_50
-                logger.debug(f"Enriched SMA 50 from prices: {sma_50:.2f}")
-
-        # ADX
-        if enriched.get("adx") is None or (
-            isinstance(enriched.get("adx"), float) and np.isnan(enriched["adx"])
-        ):
-            adx = self._calculate_adx_from_prices(df)
-            if adx is not None:
-                enriched["adx"] = adx
-                logger.debug(f"Enriched ADX from prices: {adx:.2f}")
-
-        # ATR
-        if enriched.get("atr") is None or (
-            isinstance(enriched.get("atr"), float) and np.isnan(enriched["atr"])
-        ):
-            atr = self._calculate_atr_from_prices(df)
-            if atr is not None:
-                enriched["atr"] = atr
-                logger.debug(f"Enriched ATR from prices: {atr:.2f}")
+        calculated = FALLBACK_GRAPH.evaluate(ohlcv_sources(df, FALLBACK_SOURCES), missing)
+        for name, value in calculated.items():
+            if value is not None:
+                enriched[name] = value
+                logger.debug(f"Enriched {name} from prices: {value:.4f}")
 
         return enriched
 
-    def generate_signal(self, ticker: str, target_date: date | None = None) -> Signal | None:
+    def generate_signal(
+        self,
+        ticker: str,
+        target_date: date | None = None,
+        detail: str = DETAIL_FULL,
+        use_cache: bool = True,
+    ) -> Signal | None:
         """Generate trading signal for a stock.
 
         Complete workflow:
@@ -414,27 +373,47 @@ class AdaptiveSignalEngine:
         8. Signal classification
         9. Calculate targets and stops
         10. Apply swing trading enhancements (hold period, earnings, peers, index)
-        11. Build decision tree for explainability
+        11. Build decision tree for explainability (full detail only)
         12. Return Signal object
 
         Args:
             ticker: Stock ticker symbol
             target_date: Date to generate signal for (today if None)
+            detail: 'full', 'scores' or 'minimal' (see module docstring)
+            use_cache: Serve and store the signal through the data-versioned
+                signal cache (a cache hit is not tracked again)
 
         Returns:
             Signal object or None if insufficient data
+
+        Raises:
+            ValueError: If detail is not a valid detail level
         """
+        self._check_detail(detail)
         if target_date is None:
             target_date = date.today()
 
         own_session = self._session is None
 
         try:
+            cache_key = None
+            if use_cache:
+                version = self.signal_cache.data_version(self._session)
+                cache_key = self.signal_cache.key(self, ticker, target_date, detail, version)
+                cached = self.signal_cache.get(cache_key)
+                if cached is not None:
+                    logger.debug(f"Signal cache hit for {ticker} on {target_date}")
+                    return cached
+
             if own_session:
                 with get_db_context() as session:
-                    return self._generate_with_session(ticker, target_date, session)
+                    signal = self._generate_with_session(ticker, target_date, session, detail)
             else:
-                return self._generate_with_session(ticker, target_date, self._session)
+                signal = self._generate_with_session(ticker, target_date, self._session, detail)
+
+            if cache_key is not None:
+                self.signal_cache.set(cache_key, signal)
+            return signal
 
         except Exception as e:
             import traceback
@@ -444,7 +423,7 @@ class AdaptiveSignalEngine:
             return None
 
     def _generate_with_session(
-        self, ticker: str, target_date: date, session: Session
+        self, ticker: str, target_date: date, session: Session, detail: str = DETAIL_FULL
     ) -> Signal | None:
         """Internal signal generation implementation.
 
@@ -452,42 +431,29 @@ class AdaptiveSignalEngine:
             ticker: Stock ticker
             target_date: Target date
             session: Database session
+            detail: Signal detail level
 
         Returns:
             Signal object or None
         """
         logger.info(f"Generating signal for {ticker} on {target_date}")
 
-        # 1. Load stock profile
-        profile = session.query(StockProfile).filter_by(ticker=ticker).first()
-
-        # Calibrate if missing
+        # 1. Load stock profile (missing profiles are calibrated in the background)
+        profile = self.profile_cache.get(ticker, session)
         if not profile:
-            logger.info(f"No profile for {ticker}, calibrating...")
-            profile = self.calibrator.calibrate_stock(ticker, session)
-            if not profile:
-                logger.warning(f"Calibration failed for {ticker}")
-                return None
+            logger.warning(f"No profile for {ticker} yet, skipping signal")
+            return None
 
         # 2. Fetch recent data from GIBD (90 days for analysis)
         start_date = target_date - timedelta(days=90)
-        stock_data = (
-            session.query(WsDseDailyPrice)
-            .filter(
-                WsDseDailyPrice.txn_scrip == ticker,
-                WsDseDailyPrice.txn_date >= start_date,
-                WsDseDailyPrice.txn_date <= target_date,
-            )
-            .order_by(WsDseDailyPrice.txn_date)
-            .all()
-        )
+        bars = load_ohlcv(session, ticker, start_date, target_date)
 
-        if len(stock_data) < 30:
-            logger.warning(f"Insufficient data for {ticker}: {len(stock_data)} days")
+        if len(bars) < 30:
+            logger.warning(f"Insufficient data for {ticker}: {len(bars)} days")
             return None
 
         # Convert to DataFrame
-        df = self._stock_data_to_df(stock_data)
+        df = bars.to_frame()
 
         # Fetch indicators for target date from GIBD
         indicators = self._fetch_indicators(ticker, target_date, session)
@@ -509,8 +475,77 @@ class AdaptiveSignalEngine:
         sector_adj = self._get_sector_adjustment(ticker, sector, target_date, session)
         scores["sector"] = sector_adj
 
-        # 5. Support/resistance proximity
         current_price = float(df.iloc[-1]["close"])
+
+        # ATR with fallback calculation
+        atr = indicators.get("atr")
+        if self._is_missing(atr):
+            atr = self._calculate_atr_from_prices(df)
+            if atr is not None:
+                logger.debug(f"ATR calculated from prices: {atr:.2f}")
+
+        # ADX with fallback calculation
+        adx = indicators.get("adx")
+        if self._is_missing(adx):
+            adx = self._calculate_adx_from_prices(df)
+            if adx is not None:
+                logger.debug(f"ADX calculated from prices for hold period: {adx:.2f}")
+
+        return self._finalize_signal(
+            ticker=ticker,
+            target_date=target_date,
+            session=session,
+            profile=profile,
+            indicators=indicators,
+            scores=scores,
+            sector=sector,
+            current_price=current_price,
+            atr=atr,
+            adx=adx,
+            detail=detail,
+        )
+
+    def _finalize_signal(
+        self,
+        ticker: str,
+        target_date: date,
+        session: Session,
+        profile: ProfileRecord,
+        indicators: dict,
+        scores: dict[str, float],
+        sector: str | None,
+        current_price: float,
+        atr: float | None,
+        adx: float | None,
+        track: bool = True,
+        detail: str = DETAIL_FULL,
+    ) -> Signal:
+        """Complete a signal from its price-derived scores.
+
+        Shared by the per-ticker and bulk paths: applies support/resistance and
+        timeframe scoring, classification, targets, swing trading enhancements,
+        the decision tree and outcome tracking. Below full detail the decision
+        tree and indicator snapshot are not built; tracked rows then carry only
+        the component scores, from which explain_signal() rebuilds the tree.
+
+        Args:
+            ticker: Stock ticker
+            target_date: Target date
+            session: Database session
+            profile: Stock profile with adaptive thresholds
+            indicators: Enriched indicator snapshot
+            scores: Momentum, trend, volume, volatility and sector scores
+            sector: Sector name (None if unknown)
+            current_price: Latest close price
+            atr: Resolved ATR (None if unavailable)
+            adx: Resolved ADX (None if unavailable)
+            track: Whether to record the signal through the signal sink
+            detail: Signal detail level
+
+        Returns:
+            Signal object
+        """
+        # 5. Support/resistance proximity
         sr_adj = self._check_support_resistance(
             current_price, profile.support_levels or [], profile.resistance_levels or []
         )
@@ -526,27 +561,17 @@ class AdaptiveSignalEngine:
         # 8. Signal classification
         signal_type, confidence = self._classify_signal(total_score)
 
-        # 9. Calculate targets - ATR with fallback calculation
-        atr = indicators.get("atr")
-        if atr is None or (isinstance(atr, float) and np.isnan(atr)):
-            atr = self._calculate_atr_from_prices(df)
-            if atr is not None:
-                logger.debug(f"ATR calculated from prices: {atr:.2f}")
+        # 9. Calculate targets
         if atr is None:
             # Fallback: estimate ATR as 2% of current price
-            atr = float(df.iloc[-1]["close"]) * 0.02
+            atr = current_price * 0.02
             logger.warning("Using estimated ATR (2% of price)")
         else:
             atr = float(atr)
 
         targets = self._calculate_targets(current_price, signal_type, atr, profile)
 
-        # 10. Swing trading enhancements - ADX with fallback calculation
-        adx = indicators.get("adx")
-        if adx is None or (isinstance(adx, float) and np.isnan(adx)):
-            adx = self._calculate_adx_from_prices(df)
-            if adx is not None:
-                logger.debug(f"ADX calculated from prices for hold period: {adx:.2f}")
+        # 10. Swing trading enhancements
         adx = 25.0 if adx is None else float(adx)
 
         hold_period = self._calculate_hold_period(profile.volatility_category, adx, atr)
@@ -557,12 +582,14 @@ class AdaptiveSignalEngine:
         )
 
         # Peer correlation
-        peer_info = self._check_peer_correlation(ticker, signal_type, sector, session)
+        peer_info = self._check_peer_correlation(
+            ticker, signal_type, sector, target_date, session
+        )
         if peer_info["adjustment"] != 0:
             confidence = min(1.0, max(0.0, confidence + peer_info["adjustment"]))
 
         # Index filter
-        index_info = self._check_index_trend(target_date, session)
+        index_info = self._check_index_trend(target_date, session, signal_type)
         if index_info["confidence_adjustment"] != 0:
             confidence = min(1.0, max(0.0, confidence + index_info["confidence_adjustment"]))
 
@@ -573,13 +600,17 @@ class AdaptiveSignalEngine:
             profile.next_earnings_date if hasattr(profile, "next_earnings_date") else None,
         )
         if earnings_overlap:
-            warnings.append("Signal hold period overlaps with earnings date")
+            if detail != self.DETAIL_MINIMAL:
+                warnings.append("Signal hold period overlaps with earnings date")
             confidence *= 0.5  # Reduce confidence by 50%
 
         # 11. Build decision tree
-        decision_tree = self._build_decision_tree(
-            ticker, scores, self.weights, indicators, profile, peer_info, index_info
-        )
+        if detail == self.DETAIL_FULL:
+            decision_tree = self._build_decision_tree(
+                ticker, scores, self.weights, indicators, profile, peer_info, index_info
+            )
+        else:
+            decision_tree = {}
 
         # 12. Create Signal object
         signal = Signal(
@@ -604,10 +635,11 @@ class AdaptiveSignalEngine:
                 "flat_price_exit",
             ],
             decision_tree=decision_tree,
-            scores=scores,
-            weights=self.weights,
+            scores=scores if detail != self.DETAIL_MINIMAL else {},
+            weights=self.weights if detail != self.DETAIL_MINIMAL else {},
             total_score=total_score,
             warnings=warnings,
+            detail=detail,
         )
 
         logger.info(
@@ -615,9 +647,12 @@ class AdaptiveSignalEngine:
             f"(confidence={confidence:.2f}, score={total_score:.2f})"
         )
 
-        # Track signal for outcome validation
+        if not track:
+            return signal
+
+        # Track signal for outcome validation (buffered, written in the background)
         try:
-            self.outcome_tracker.track_signal(
+            self.signal_sink.track_signal(
                 ticker=ticker,
                 signal_date=target_date,
                 signal_type=signal_type,
@@ -625,107 +660,427 @@ class AdaptiveSignalEngine:
                 entry_price=current_price,
                 target_price=targets["target"],
                 stop_loss=targets["stop_loss"],
-                decision_tree=decision_tree,
-                indicators_snapshot=indicators,
-                market_regime=None,
+                decision_tree=decision_tree or self._score_summary(scores),
+                indicators_snapshot=indicators if detail == self.DETAIL_FULL else None,
+                market_regime=index_info.get("index_regime"),
             )
-            logger.info(f"Signal tracked for outcome validation: {ticker}")
+            logger.debug(f"Signal queued for outcome validation: {ticker}")
         except Exception as e:
             logger.error(f"Error tracking signal for {ticker}: {str(e)}")
             # Don't fail signal generation if tracking fails
 
         return signal
 
-    def _stock_data_to_df(self, stock_data: list[WsDseDailyPrice]) -> pd.DataFrame:
-        """Convert WsDseDailyPrice list to DataFrame."""
-        return pd.DataFrame(
-            [
-                {
-                    "date": row.txn_date,
-                    "open": float(row.txn_open),
-                    "high": float(row.txn_high),
-                    "low": float(row.txn_low),
-                    "close": float(row.txn_close),
-                    "volume": int(row.txn_volume),
-                }
-                for row in stock_data
-            ]
-        )
+    def generate_signals_bulk(
+        self,
+        tickers: list[str],
+        target_date: date | None = None,
+        detail: str = DETAIL_FULL,
+        use_cache: bool = True,
+        panel: PricePanel | None = None,
+    ) -> dict[str, Signal]:
+        """Generate signals for many stocks from one set-based data load.
+
+        Produces the same Signal objects as generate_signal(), but loads
+        profiles, the 90-day price window and the indicator snapshot for the
+        whole universe in a few queries and runs the indicator fallbacks and
+        momentum/trend/volume/volatility/sector scoring as array operations
+        over a (ticker x day) panel.
 
-    # Mapping from GIBD indicator names to signal engine names
-    INDICATOR_KEY_MAP = {
-        "RSI_14": "rsi",
-        "SMA_20": "sma_20",
-        "SMA_50": "sma_50",
-        "MACD_histogram_12_26_9": "macd_histogram",
-        "MACD_line_12_26_9": "macd_line",
-        "MACD_signal_12_26_9": "macd_signal",
-        "ATR_14": "atr",
-        "ADX_14": "adx",
-        "BB_upper_20_2": "bb_upper",
-        "BB_lower_20_2": "bb_lower",
-        "BB_middle_20_2": "bb_middle",
-    }
+        Args:
+            tickers: Stock ticker symbols
+            target_date: Date to generate signals for (today if None)
+            detail: 'full', 'scores' or 'minimal' (see module docstring)
+            use_cache: Serve cached signals and generate only the misses
+            panel: Preloaded 90-day price panel for target_date covering the
+                tickers and their sector constituents (loaded if None)
 
-    def _fetch_indicators(
-        self, ticker: str, target_date: date, session: Session
-    ) -> dict[str, float]:
-        """Fetch indicator values from GIBD indicators table.
+        Returns:
+            Dict mapping ticker to Signal (tickers with insufficient data or
+            failed calibration are omitted)
 
-        First tries to fetch for target_date. If not found, fetches the most
-        recent available indicators for the ticker.
+        Raises:
+            ValueError: If detail is not a valid detail level
+        """
+        self._check_detail(detail)
+        if target_date is None:
+            target_date = date.today()
+
+        own_session = self._session is None
+
+        try:
+            cached = {}
+            cache_keys = {}
+            if use_cache:
+                version = self.signal_cache.data_version(self._session)
+                for ticker in tickers:
+                    cache_keys[ticker] = self.signal_cache.key(
+                        self, ticker, target_date, detail, version
+                    )
+                    signal = self.signal_cache.get(cache_keys[ticker])
+                    if signal is not None:
+                        cached[ticker] = signal
+                tickers = [ticker for ticker in tickers if ticker not in cached]
+                if not tickers:
+                    return cached
 
-        Maps GIBD indicator keys (e.g., 'RSI_14') to signal engine keys (e.g., 'rsi').
+            if own_session:
+                with get_db_context() as session:
+                    signals = self._generate_bulk_with_session(
+                        tickers, target_date, session, detail, panel
+                    )
+            else:
+                signals = self._generate_bulk_with_session(
+                    tickers, target_date, self._session, detail, panel
+                )
+
+            for ticker, signal in signals.items():
+                if ticker in cache_keys:
+                    self.signal_cache.set(cache_keys[ticker], signal)
+            return {**cached, **signals}
+
+        except Exception as e:
+            import traceback
+
+            logger.error(f"Bulk signal generation failed for {len(tickers)} tickers: {e}")
+            logger.error(traceback.format_exc())
+            return {}
+
+    def iter_signals_bulk(
+        self,
+        tickers: list[str],
+        target_date: date | None = None,
+        detail: str = DETAIL_FULL,
+        chunk_size: int = 100,
+    ) -> Iterator[dict[str, Signal]]:
+        """Generate bulk signals chunk by chunk, yielding each chunk's signals.
+
+        Lets callers act on early results (e.g. stream scan hits) while the
+        rest of the universe is still being scored. The price panel for all
+        tickers and their sector constituents is loaded once and shared by the
+        chunks, so sector relative strength is unaffected by chunking.
+
+        Args:
+            tickers: Stock ticker symbols
+            target_date: Date to generate signals for (today if None)
+            detail: 'full', 'scores' or 'minimal' (see module docstring)
+            chunk_size: Tickers per generate_signals_bulk() call
+
+        Yields:
+            Dict mapping ticker to Signal for each chunk
         """
-        indicators = {}
-
-        # First try exact date
-        indicator_record = (
-            session.query(Indicator)
-            .filter(
-                Indicator.scrip == ticker,
-                Indicator.trading_date == target_date,
-                Indicator.status == "CALCULATED",
+        self._check_detail(detail)
+        if target_date is None:
+            target_date = date.today()
+
+        tickers = list(dict.fromkeys(tickers))
+        panel = None
+        if len(tickers) > chunk_size:
+            _, universe = self._sector_universe(tickers)
+            if self._session is None:
+                with get_db_context() as session:
+                    panel = self._load_bulk_panel(session, universe, target_date)
+            else:
+                panel = self._load_bulk_panel(self._session, universe, target_date)
+
+        for start in range(0, len(tickers), chunk_size):
+            yield self.generate_signals_bulk(
+                tickers[start : start + chunk_size], target_date, detail, panel=panel
             )
-            .first()
+
+    @staticmethod
+    def _load_bulk_panel(session: Session, universe: list[str], target_date: date) -> PricePanel:
+        """Load the 90-day price panel the bulk path scores from."""
+        return load_price_panel(session, universe, target_date - timedelta(days=90), target_date)
+
+    def _generate_bulk_with_session(
+        self,
+        tickers: list[str],
+        target_date: date,
+        session: Session,
+        detail: str = DETAIL_FULL,
+        panel: PricePanel | None = None,
+    ) -> dict[str, Signal]:
+        """Internal bulk signal generation implementation.
+
+        Args:
+            tickers: Stock tickers
+            target_date: Target date
+            session: Database session
+            detail: Signal detail level
+            panel: Preloaded price panel (loaded for the tickers if None)
+
+        Returns:
+            Dict mapping ticker to Signal
+        """
+        tickers = list(dict.fromkeys(tickers))
+        logger.info(f"Generating bulk signals for {len(tickers)} tickers on {target_date}")
+
+        # 1. Load stock profiles (missing profiles are calibrated in the background)
+        profiles = self.profile_cache.get_many(tickers, session)
+
+        # 2. Load the price panel for the tickers and their sector constituents
+        sectors, universe = self._sector_universe(tickers)
+        if panel is None:
+            panel = self._load_bulk_panel(session, universe, target_date)
+        raw_indicators = self._fetch_indicators_bulk(list(profiles), target_date, session)
+
+        return self._signals_from_panel(
+            tickers, target_date, session, panel, profiles, sectors, raw_indicators, detail=detail
         )
 
-        # If not found, get most recent indicators
-        if not indicator_record:
-            indicator_record = (
-                session.query(Indicator)
-                .filter(
-                    Indicator.scrip == ticker,
-                    Indicator.trading_date <= target_date,
-                    Indicator.status == "CALCULATED",
+    def _sector_universe(self, tickers: list[str]) -> tuple[dict[str, str | None], list[str]]:
+        """Get each ticker's sector and the tickers plus all their sector constituents."""
+        sectors = {ticker: self.sector_manager.get_sector(ticker) for ticker in tickers}
+        universe = list(tickers)
+        for sector in {s for s in sectors.values() if s}:
+            universe.extend(self.sector_manager.get_sector_tickers(sector))
+        return sectors, list(dict.fromkeys(universe))
+
+    def _signals_from_panel(
+        self,
+        tickers: list[str],
+        target_date: date,
+        session: Session,
+        panel: PricePanel,
+        profiles: dict[str, ProfileRecord],
+        sectors: dict[str, str | None],
+        raw_indicators: dict[str, dict],
+        track: bool = True,
+        detail: str = DETAIL_FULL,
+    ) -> dict[str, Signal]:
+        """Score and finalize signals for every eligible ticker in a price panel.
+
+        Args:
+            tickers: Stock tickers to generate signals for
+            target_date: Target date (the panel's latest column)
+            session: Database session
+            panel: Price panel covering the tickers and their sector constituents
+            profiles: Profiles by ticker
+            sectors: Sector by ticker
+            raw_indicators: Mapped indicator snapshot by ticker
+            track: Whether to record signals through the signal sink
+            detail: Signal detail level
+
+        Returns:
+            Dict mapping ticker to Signal
+        """
+        eligible = []
+        for ticker in tickers:
+            count = int(panel.counts[panel.index[ticker]])
+            if ticker not in profiles:
+                continue
+            if count < 30:
+                logger.warning(f"Insufficient data for {ticker}: {count} days")
+                continue
+            eligible.append(ticker)
+
+        if not eligible:
+            return {}
+
+        rows = np.array([panel.index[ticker] for ticker in eligible])
+        high = panel.high[rows]
+        low = panel.low[rows]
+        close = panel.close[rows]
+        counts = panel.counts[rows]
+
+        # Indicator snapshot, enriched from vectorized price fallbacks
+        fallbacks = {
+            "rsi": panel_rsi(close, counts),
+            "macd_histogram": panel_macd_histogram(close, counts),
+            "sma_20": panel_sma(close, counts, 20),
+            "sma_50": panel_sma(close, counts, 50),
+            "adx": panel_adx(high, low, close, counts),
+            "atr": panel_atr(high, low, close, counts),
+        }
+
+        indicators_list = []
+        for i, ticker in enumerate(eligible):
+            enriched = dict(raw_indicators.get(ticker, {}))
+            for key, values in fallbacks.items():
+                if self._is_missing(enriched.get(key)) and not np.isnan(values[i]):
+                    enriched[key] = float(values[i])
+            indicators_list.append(enriched)
+
+        def resolved(key: str) -> np.ndarray:
+            return np.array(
+                [
+                    np.nan if self._is_missing(ind.get(key)) else float(ind[key])
+                    for ind in indicators_list
+                ]
+            )
+
+        price = close[:, -1]
+        ticker_profiles = [profiles[ticker] for ticker in eligible]
+
+        # 3. Calculate scores as array operations
+        momentum = self._score_momentum_bulk(
+            resolved("rsi"),
+            resolved("macd_histogram"),
+            np.array([float(p.rsi_overbought) for p in ticker_profiles]),
+            np.array([float(p.rsi_oversold) for p in ticker_profiles]),
+        )
+        trend = self._score_trend_bulk(
+            price, resolved("sma_20"), resolved("sma_50"), resolved("adx")
+        )
+        volume = self._score_volume_bulk(
+            np.array([self._get_indicator_float(ind, "rvol", 1.0) for ind in indicators_list]),
+            np.array(
+                [
+                    float(p.high_volume_threshold) if p.high_volume_threshold else 2.0
+                    for p in ticker_profiles
+                ]
+            ),
+        )
+        volatility = self._score_volatility_bulk([p.volatility_category for p in ticker_profiles])
+
+        # 4. Sector adjustment from panel returns
+        daily_returns = {}
+        for ticker in panel.tickers:
+            i = panel.index[ticker]
+            if panel.counts[i] < 2 or panel.last_dates[i] != target_date:
+                continue
+            close_prev = panel.close[i, -2]
+            if close_prev > 0:
+                daily_returns[ticker] = float((panel.close[i, -1] - close_prev) / close_prev)
+        strengths = self.sector_manager.calculate_relative_strengths(eligible, daily_returns)
+
+        signals = {}
+        for i, ticker in enumerate(eligible):
+            sector = sectors[ticker]
+            scores = {
+                "momentum": float(momentum[i]),
+                "trend": float(trend[i]),
+                "volume": float(volume[i]),
+                "volatility": float(volatility[i]),
+                "sector": self._sector_adjustment_from_rs(strengths[ticker]) if sector else 0.0,
+            }
+            indicators = indicators_list[i]
+
+            try:
+                signals[ticker] = self._finalize_signal(
+                    ticker=ticker,
+                    target_date=target_date,
+                    session=session,
+                    profile=ticker_profiles[i],
+                    indicators=indicators,
+                    scores=scores,
+                    sector=sector,
+                    current_price=float(price[i]),
+                    atr=None if self._is_missing(indicators.get("atr")) else indicators["atr"],
+                    adx=None if self._is_missing(indicators.get("adx")) else indicators["adx"],
+                    track=track,
+                    detail=detail,
                 )
-                .order_by(Indicator.trading_date.desc())
-                .first()
+            except Exception as e:
+                logger.error(f"Signal generation failed for {ticker}: {e}")
+
+        logger.info(f"Generated {len(signals)}/{len(tickers)} bulk signals for {target_date}")
+        return signals
+
+    def _fetch_indicators_bulk(
+        self, tickers: list[str], target_date: date, session: Session
+    ) -> dict[str, dict]:
+        """Fetch the latest indicator snapshot on or before target_date per ticker.
+
+        Single DISTINCT ON query projecting only the JSONB keys the engine
+        reads; equivalent to _fetch_indicators() for every ticker.
+        """
+        return load_latest_indicators(session, tickers, target_date).records()
+
+    @staticmethod
+    def _score_momentum_bulk(
+        rsi: np.ndarray, macd_hist: np.ndarray, overbought: np.ndarray, oversold: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized _score_momentum() over resolved RSI/MACD arrays."""
+        rsi = np.where(np.isnan(rsi), 50.0, rsi)
+        macd_hist = np.where(np.isnan(macd_hist), 0.0, macd_hist)
+        mid = (overbought + oversold) / 2
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            score = np.select(
+                [rsi >= overbought, rsi <= oversold, rsi > mid],
+                [
+                    -((rsi - overbought) / (100 - overbought)),
+                    (oversold - rsi) / oversold,
+                    -0.6 * ((rsi - mid) / (overbought - mid)),
+                ],
+                default=0.6 * ((mid - rsi) / (mid - oversold)),
             )
 
-        if indicator_record:
-            raw_indicators = indicator_record.indicators or {}
+        score = score + np.select([macd_hist > 0, macd_hist < 0], [0.2, -0.2], default=0.0)
+        return np.clip(score, -1.0, 1.0)
 
-            # Map GIBD keys to signal engine keys
-            for gibd_key, engine_key in self.INDICATOR_KEY_MAP.items():
-                if gibd_key in raw_indicators:
-                    indicators[engine_key] = raw_indicators[gibd_key]
+    @staticmethod
+    def _score_trend_bulk(
+        price: np.ndarray, sma_20: np.ndarray, sma_50: np.ndarray, adx: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized _score_trend() over resolved SMA/ADX arrays."""
+        sma_20 = np.where(np.isnan(sma_20), price, sma_20)
+        sma_50 = np.where(np.isnan(sma_50), price, sma_50)
+        adx = np.where(np.isnan(adx), 25.0, adx)
+
+        score = np.select(
+            [
+                (price > sma_20) & (sma_20 > sma_50),
+                (price < sma_20) & (sma_20 < sma_50),
+                price > sma_20,
+                price < sma_20,
+            ],
+            [0.5, -0.5, 0.2, -0.2],
+            default=0.0,
+        )
+        score = score * np.select([adx > 30, adx < 20], [1.5, 0.5], default=1.0)
+        return np.clip(score, -1.0, 1.0)
 
-            # Also copy any keys that match directly (lowercase)
-            for key, value in raw_indicators.items():
-                lower_key = key.lower()
-                if lower_key not in indicators:
-                    indicators[lower_key] = value
+    @staticmethod
+    def _score_volume_bulk(rvol: np.ndarray, volume_threshold: np.ndarray) -> np.ndarray:
+        """Vectorized _score_volume()."""
+        return np.select(
+            [rvol > volume_threshold, rvol > 1.5, rvol < 0.5], [0.6, 0.3, -0.3], default=0.0
+        )
+
+    @staticmethod
+    def _score_volatility_bulk(categories: list[str | None]) -> np.ndarray:
+        """Vectorized _score_volatility()."""
+        categories = np.array(categories, dtype=object)
+        return np.select([categories == "high", categories == "low"], [-0.3, 0.2], default=0.0)
+
+    # Engine indicator keys read by scoring and the decision tree
+    SCORING_INDICATOR_KEYS = (
+        "rsi",
+        "macd_histogram",
+        "sma_20",
+        "sma_50",
+        "adx",
+        "atr",
+        "rvol",
+        "weekly_trend",
+    )
 
+    def _fetch_indicators(
+        self, ticker: str, target_date: date, session: Session
+    ) -> dict[str, float]:
+        """Fetch indicator values from GIBD indicators table.
+
+        Reads the latest CALCULATED row on or before target_date (the
+        exact-date row when present) in one query, projecting only the JSONB
+        keys the engine uses, mapped to signal engine keys (e.g. 'RSI_14' to
+        'rsi').
+        """
+        snapshot = load_latest_indicators(session, [ticker], target_date)
+        indicators = snapshot.record(ticker)
+
+        if indicators:
             logger.debug(
                 f"Fetched {len(indicators)} indicators for {ticker} "
-                f"from {indicator_record.trading_date}"
+                f"from {snapshot.trading_dates[snapshot.index[ticker]]}"
             )
 
         return indicators
 
     def _score_momentum(
-        self, indicators: dict[str, float], profile: StockProfile, df: pd.DataFrame
+        self, indicators: dict[str, float], profile: ProfileRecord, df: pd.DataFrame
     ) -> float:
         """Score momentum using adaptive RSI thresholds.
 
@@ -792,7 +1147,7 @@ class AdaptiveSignalEngine:
         return max(-1.0, min(1.0, score))
 
     def _score_trend(
-        self, indicators: dict[str, float], profile: StockProfile, df: pd.DataFrame
+        self, indicators: dict[str, float], profile: ProfileRecord, df: pd.DataFrame
     ) -> float:
         """Score trend strength and quality.
 
@@ -873,7 +1228,7 @@ class AdaptiveSignalEngine:
 
         return max(-1.0, min(1.0, score))
 
-    def _score_volume(self, indicators: dict[str, float], profile: StockProfile) -> float:
+    def _score_volume(self, indicators: dict[str, float], profile: ProfileRecord) -> float:
         """Score volume trends."""
         rvol = self._get_indicator_float(indicators, "rvol", 1.0)  # Relative volume
 
@@ -891,7 +1246,7 @@ class AdaptiveSignalEngine:
         else:
             return 0.0  # Normal
 
-    def _score_volatility(self, indicators: dict[str, float], profile: StockProfile) -> float:
+    def _score_volatility(self, indicators: dict[str, float], profile: ProfileRecord) -> float:
         """Score volatility."""
         # High volatility stocks get negative score (more risky)
         if profile.volatility_category == "high":
@@ -909,7 +1264,11 @@ class AdaptiveSignalEngine:
             return 0.0
 
         rs = self.sector_manager.get_relative_strength(ticker, sector, target_date, session)
+        return self._sector_adjustment_from_rs(rs)
 
+    @staticmethod
+    def _sector_adjustment_from_rs(rs: float) -> float:
+        """Convert sector relative strength to a score adjustment."""
         # Relative strength adjustment
         if rs > 1.5:
             return 0.5  # Strongly outperforming
@@ -993,7 +1352,7 @@ class AdaptiveSignalEngine:
         return signal_type, confidence
 
     def _calculate_targets(
-        self, current_price: float, signal_type: str, atr: float, profile: StockProfile
+        self, current_price: float, signal_type: str, atr: float, profile: ProfileRecord
     ) -> dict[str, float]:
         """Calculate price targets and stops."""
         if signal_type == "BUY":
@@ -1078,9 +1437,18 @@ class AdaptiveSignalEngine:
         return expected_exit >= next_earnings_date
 
     def _check_peer_correlation(
-        self, ticker: str, signal_type: str, sector: str | None, session: Session
+        self,
+        ticker: str,
+        signal_type: str,
+        sector: str | None,
+        target_date: date,
+        session: Session,
     ) -> dict:
-        """Check if peer stocks confirm signal direction."""
+        """Check if peer stocks confirm signal direction.
+
+        Peers are read from the per-date peer state table; a peer counts as
+        bullish when its close is above SMA 20 with a positive 5-day return.
+        """
         if not sector:
             return {"peer_count": 0, "bullish_peers": 0, "adjustment": 0.0}
 
@@ -1088,20 +1456,17 @@ class AdaptiveSignalEngine:
         if not peers:
             return {"peer_count": 0, "bullish_peers": 0, "adjustment": 0.0}
 
+        peer_table = self.peer_states.get_table(target_date, session)
+
         bullish_count = 0
+        peer_trends = {}
         for peer_ticker in peers:
-            # Simplified peer analysis
-            # In production, would generate full signal for each peer
-            # Check if peer exists in GIBD database
-            peer_data = (
-                session.query(WsDseDailyPrice)
-                .filter(WsDseDailyPrice.txn_scrip == peer_ticker)
-                .limit(1)
-                .first()
-            )
-            if peer_data:
-                # Assume bullish if price above SMA (simplified)
-                bullish_count += 1 if np.random.random() > 0.5 else 0
+            state = peer_table.get(peer_ticker)
+            if state is None:
+                continue
+            peer_trends[peer_ticker] = state.trend
+            if state.bullish:
+                bullish_count += 1
 
         total_peers = len(peers) + 1  # Include original stock
         bullish_ratio = (bullish_count + (1 if signal_type == "BUY" else 0)) / total_peers
@@ -1114,15 +1479,91 @@ class AdaptiveSignalEngine:
         else:
             adjustment = 0.0  # Mixed signals
 
-        return {"peer_count": len(peers), "bullish_peers": bullish_count, "adjustment": adjustment}
+        return {
+            "peer_count": len(peers),
+            "bullish_peers": bullish_count,
+            "peer_trends": peer_trends,
+            "adjustment": adjustment,
+        }
 
-    def _check_index_trend(self, target_date: date, session: Session) -> dict:
-        """Check DSEX index trend."""
-        # Simplified index check
-        # In production, would fetch actual DSEX data and calculate SMA 50
+    def _check_index_trend(self, target_date: date, session: Session, signal_type: str) -> dict:
+        """Check DSEX index trend from the shared index context."""
+        snapshot = self.index_context.get_snapshot(target_date, session)
+        if snapshot is None:
+            return {"index_trend": "neutral", "confidence_adjustment": 0.0}
 
-        # For now, assume neutral
-        return {"index_trend": "neutral", "confidence_adjustment": 0.0}
+        return {
+            "index_trend": snapshot.trend,
+            "index_regime": snapshot.regime,
+            "index_breakdown": snapshot.breakdown,
+            "index_date": snapshot.index_date.isoformat(),
+            "confidence_adjustment": snapshot.confidence_adjustment(signal_type),
+        }
+
+    def explain_signal(self, signal: Signal) -> dict:
+        """Get a signal's decision tree, rebuilding it if it was not generated.
+
+        Signals generated below full detail carry only their component scores;
+        the tree is rebuilt from those scores plus the profile, indicator
+        snapshot, peer state and index context for the signal date, and cached
+        on the signal.
+
+        Args:
+            signal: Signal generated with 'scores' or 'full' detail
+
+        Returns:
+            Decision tree dict (same structure as full-detail signals)
+
+        Raises:
+            ValueError: If the signal carries no component scores (minimal detail)
+        """
+        if signal.decision_tree:
+            return signal.decision_tree
+        if not signal.scores:
+            raise ValueError(
+                f"Signal for {signal.ticker} has no component scores; "
+                f"regenerate it with detail='{self.DETAIL_SCORES}' to explain it"
+            )
+
+        own_session = self._session is None
+        if own_session:
+            with get_db_context() as session:
+                signal.decision_tree = self._rebuild_decision_tree(signal, session)
+        else:
+            signal.decision_tree = self._rebuild_decision_tree(signal, self._session)
+        return signal.decision_tree
+
+    def _rebuild_decision_tree(self, signal: Signal, session: Session) -> dict:
+        """Rebuild the decision tree for a signal from its stored component scores."""
+        ticker = signal.ticker
+        target_date = signal.signal_date
+
+        profile = self.profile_cache.get(ticker, session)
+        if not profile:
+            raise ValueError(f"No profile for {ticker}, cannot explain signal")
+
+        bars = load_ohlcv(session, ticker, target_date - timedelta(days=90), target_date)
+        indicators = self._fetch_indicators(ticker, target_date, session)
+        if len(bars):
+            indicators = self._enrich_indicators(indicators, bars.to_frame())
+
+        sector = self.sector_manager.get_sector(ticker)
+        peer_info = self._check_peer_correlation(
+            ticker, signal.signal_type, sector, target_date, session
+        )
+        index_info = self._check_index_trend(target_date, session, signal.signal_type)
+
+        return self._build_decision_tree(
+            ticker, signal.scores, signal.weights, indicators, profile, peer_info, index_info
+        )
+
+    def _score_summary(self, scores: dict[str, float]) -> dict:
+        """Score-only decision tree stored for signals tracked below full detail."""
+        return {
+            "scores": dict(scores),
+            "weights": self.weights,
+            "total_score": sum(scores[k] * self.weights[k] for k in scores),
+        }
 
     def _build_decision_tree(
         self,
@@ -1130,7 +1571,7 @@ class AdaptiveSignalEngine:
         scores: dict[str, float],
         weights: dict[str, float],
         indicators: dict[str, float],
-        profile: StockProfile,
+        profile: ProfileRecord,
         peer_info: dict,
         index_info: dict,
     ) -> dict:
@@ -1166,3 +1607,4 @@ class AdaptiveSignalEngine:
                 },
             },
         }
+
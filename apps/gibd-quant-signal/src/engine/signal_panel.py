@@ -0,0 +1,285 @@
+"""Universe-wide price panel for bulk signal generation.
+
+This module loads the OHLCV window for many tickers with a single set-based
+query and lays it out as a (ticker x bar) NumPy panel. Each row is
+right-aligned so that column -1 holds the ticker's latest bar on or before the
+target date; shorter histories are NaN-padded on the left.
+
+The panel_* helpers apply the shared indicator kernels (RSI, MACD histogram,
+SMA, ADX, ATR) to every row of the panel at once and return the latest value
+per ticker (NaN when the ticker does not have enough history).
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from src.database.models import WsDseDailyPrice
+from src.engine import indicator_kernels as kernels
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PricePanel:
+    """OHLCV history for many tickers as right-aligned 2-D arrays.
+
+    Attributes:
+        tickers: Ticker symbols, one per panel row
+        index: Mapping from ticker to row number
+        dates: Per-row arrays of bar dates (oldest to newest, no padding)
+        open, high, low, close, volume: (n_tickers x width) float64 arrays
+        counts: Number of real (non-padded) bars per row
+    """
+
+    tickers: list[str]
+    index: dict[str, int]
+    dates: list[np.ndarray]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    counts: np.ndarray
+    last_dates: list[date | None] = field(default_factory=list)
+
+    @property
+    def width(self) -> int:
+        """Number of bar columns in the panel."""
+        return self.close.shape[1]
+
+    def row(self, ticker: str) -> int | None:
+        """Get the panel row for a ticker (None if not loaded)."""
+        return self.index.get(ticker)
+
+    def to_frame(self, ticker: str) -> pd.DataFrame:
+        """Rebuild the per-ticker DataFrame used by the scalar engine path."""
+        i = self.index[ticker]
+        n = int(self.counts[i])
+        cols = slice(self.width - n, self.width)
+        return pd.DataFrame(
+            {
+                "date": self.dates[i],
+                "open": self.open[i, cols],
+                "high": self.high[i, cols],
+                "low": self.low[i, cols],
+                "close": self.close[i, cols],
+                "volume": self.volume[i, cols].astype(np.int64),
+            }
+        )
+
+
+def load_price_panel(
+    session: Session, tickers: list[str] | None, start_date: date, end_date: date
+) -> PricePanel:
+    """Load OHLCV bars for many tickers in one query.
+
+    Args:
+        session: Database session
+        tickers: Ticker symbols to load (None for every ticker with data)
+        start_date: First calendar date of the window (inclusive)
+        end_date: Last calendar date of the window (inclusive)
+
+    Returns:
+        PricePanel with one row per requested ticker (rows without data have
+        counts == 0 and are fully NaN)
+    """
+    query = session.query(
+        WsDseDailyPrice.txn_scrip,
+        WsDseDailyPrice.txn_date,
+        WsDseDailyPrice.txn_open,
+        WsDseDailyPrice.txn_high,
+        WsDseDailyPrice.txn_low,
+        WsDseDailyPrice.txn_close,
+        WsDseDailyPrice.txn_volume,
+    ).filter(
+        WsDseDailyPrice.txn_date >= start_date,
+        WsDseDailyPrice.txn_date <= end_date,
+    )
+    if tickers is not None:
+        query = query.filter(WsDseDailyPrice.txn_scrip.in_(tickers))
+
+    rows = query.order_by(WsDseDailyPrice.txn_scrip, WsDseDailyPrice.txn_date).all()
+
+    grouped: dict[str, list] = {ticker: [] for ticker in tickers or []}
+    for row in rows:
+        bucket = grouped.get(row[0])
+        if bucket is None:
+            if tickers is not None:
+                continue
+            bucket = grouped[row[0]] = []
+        bucket.append(row)
+
+    panel = build_price_panel(grouped)
+    logger.info(
+        f"Loaded price panel: {len(rows)} bars for {len(grouped)} tickers "
+        f"({start_date} to {end_date})"
+    )
+    return panel
+
+
+def build_price_panel(grouped: dict[str, list]) -> PricePanel:
+    """Build a right-aligned panel from per-ticker row lists.
+
+    Args:
+        grouped: Mapping ticker -> chronologically ordered rows of
+            (scrip, date, open, high, low, close, volume)
+
+    Returns:
+        PricePanel
+    """
+    tickers = list(grouped.keys())
+    n = len(tickers)
+    width = max((len(bars) for bars in grouped.values()), default=0)
+
+    arrays = {name: np.full((n, width), np.nan) for name in ("open", "high", "low", "close")}
+    volume = np.full((n, width), np.nan)
+    counts = np.zeros(n, dtype=np.int64)
+    dates: list[np.ndarray] = []
+    last_dates: list[date | None] = []
+
+    for i, ticker in enumerate(tickers):
+        bars = grouped[ticker]
+        count = len(bars)
+        counts[i] = count
+        dates.append(np.array([bar[1] for bar in bars], dtype=object))
+        last_dates.append(bars[-1][1] if bars else None)
+        if count == 0:
+            continue
+
+        values = np.array([bar[2:7] for bar in bars], dtype=np.float64)
+        start = width - count
+        arrays["open"][i, start:] = values[:, 0]
+        arrays["high"][i, start:] = values[:, 1]
+        arrays["low"][i, start:] = values[:, 2]
+        arrays["close"][i, start:] = values[:, 3]
+        volume[i, start:] = values[:, 4]
+
+    return PricePanel(
+        tickers=tickers,
+        index={ticker: i for i, ticker in enumerate(tickers)},
+        dates=dates,
+        open=arrays["open"],
+        high=arrays["high"],
+        low=arrays["low"],
+        close=arrays["close"],
+        volume=volume,
+        counts=counts,
+        last_dates=last_dates,
+    )
+
+
+def slice_panel(
+    panel: PricePanel,
+    start_date: date,
+    end_date: date,
+    dates64: list[np.ndarray] | None = None,
+) -> PricePanel:
+    """Cut a date window out of a panel without touching the database.
+
+    Args:
+        panel: Source panel (e.g. a multi-year history)
+        start_date: First calendar date of the window (inclusive)
+        end_date: Last calendar date of the window (inclusive)
+        dates64: Optional per-row dates as datetime64[D] arrays (precompute
+            with panel_dates64() when slicing the same panel repeatedly)
+
+    Returns:
+        Right-aligned PricePanel holding each row's bars inside the window
+    """
+    if dates64 is None:
+        dates64 = panel_dates64(panel)
+
+    start = np.datetime64(start_date, "D")
+    end = np.datetime64(end_date, "D")
+    bounds = []
+    for i in range(len(panel.tickers)):
+        offset = panel.width - int(panel.counts[i])
+        lo = int(np.searchsorted(dates64[i], start, side="left"))
+        hi = int(np.searchsorted(dates64[i], end, side="right"))
+        bounds.append((offset, lo, hi))
+
+    n = len(panel.tickers)
+    width = max((hi - lo for _, lo, hi in bounds), default=0)
+    arrays = {
+        name: np.full((n, width), np.nan) for name in ("open", "high", "low", "close", "volume")
+    }
+    counts = np.zeros(n, dtype=np.int64)
+    dates = []
+    last_dates = []
+
+    for i, (offset, lo, hi) in enumerate(bounds):
+        count = hi - lo
+        counts[i] = count
+        dates.append(panel.dates[i][lo:hi])
+        last_dates.append(panel.dates[i][hi - 1] if count else None)
+        if count == 0:
+            continue
+        for name, target in arrays.items():
+            target[i, width - count :] = getattr(panel, name)[i, offset + lo : offset + hi]
+
+    return PricePanel(
+        tickers=list(panel.tickers),
+        index=dict(panel.index),
+        dates=dates,
+        open=arrays["open"],
+        high=arrays["high"],
+        low=arrays["low"],
+        close=arrays["close"],
+        volume=arrays["volume"],
+        counts=counts,
+        last_dates=last_dates,
+    )
+
+
+def panel_dates64(panel: PricePanel) -> list[np.ndarray]:
+    """Per-row bar dates as datetime64[D] arrays (for fast window searches)."""
+    return [np.array(list(row_dates), dtype="datetime64[D]") for row_dates in panel.dates]
+
+
+def panel_rsi(close: np.ndarray, counts: np.ndarray, period: int = 14) -> np.ndarray:
+    """Latest simple-average RSI per row.
+
+    Mirrors AdaptiveSignalEngine._calculate_rsi_from_prices including its
+    edge cases (no losses -> 100, or 50 when flat; no gains -> 0).
+    """
+    if close.shape[1] < period + 1:
+        return np.full(close.shape[0], np.nan)
+    rsi = kernels.rsi(close[:, -(period + 1) :], period)[:, -1]
+    return np.where(counts >= period + 1, rsi, np.nan)
+
+
+def panel_macd_histogram(
+    close: np.ndarray, counts: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9
+) -> np.ndarray:
+    """Latest MACD histogram per row (EMA with adjust=False, seeded at first bar)."""
+    _, _, histogram = kernels.macd(close, fast, slow, signal)
+    return np.where(counts >= slow + signal, kernels.last_valid(histogram), np.nan)
+
+
+def panel_sma(close: np.ndarray, counts: np.ndarray, period: int) -> np.ndarray:
+    """Latest simple moving average per row."""
+    if close.shape[1] < period:
+        return np.full(close.shape[0], np.nan)
+    sma = close[:, -period:].mean(axis=1)
+    return np.where(counts >= period, sma, np.nan)
+
+
+def panel_atr(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, counts: np.ndarray, period: int = 14
+) -> np.ndarray:
+    """Latest ATR (simple rolling mean of true range) per row."""
+    atr = kernels.last_valid(kernels.atr(high, low, close, period))
+    return np.where(counts >= period + 1, atr, np.nan)
+
+
+def panel_adx(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, counts: np.ndarray, period: int = 14
+) -> np.ndarray:
+    """Latest ADX per row using the engine's rolling-mean smoothing."""
+    adx = kernels.last_valid(kernels.adx(high, low, close, period))
+    return np.where(counts >= period * 2, adx, np.nan)
@@ -0,0 +1,345 @@
+"""Write-behind sink for signal_history rows.
+
+SignalSink takes tracked signals off the signal generation path: rows are
+buffered in memory and written by a background flusher as multi-row
+PostgreSQL upserts on uq_signal_history_ticker_date. A flush is triggered
+when the buffer reaches batch_size or when flush_interval_seconds have passed
+since the oldest buffered row, and the buffer is flushed on interpreter exit.
+A failed batch is split in halves until the failing rows are isolated; those
+are re-buffered and dropped with an error log after max_attempts failures.
+
+Example:
+    sink = get_signal_sink()
+    sink.track_signal(ticker='GP', signal_date=date.today(), ...)
+    sink.flush()  # Optional: force a synchronous write
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections.abc import Callable
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+
+from src.database.connection import get_db_context
+from src.database.models import SignalHistory
+
+logger = logging.getLogger(__name__)
+
+UPSERT_CONSTRAINT = "uq_signal_history_ticker_date"
+
+
+def _json_safe(value: Any) -> Any:
+    """Convert numpy/Decimal/date values into JSON-native types."""
+    if isinstance(value, dict):
+        return {str(k): _json_safe(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, date | datetime):
+        return value.isoformat()
+    return value
+
+
+class SignalSink:
+    """Buffered, batched writer for signal_history.
+
+    Rows are keyed by (ticker, signal_date); a newer row for the same key
+    replaces the buffered one, matching the upsert semantics.
+
+    Attributes:
+        batch_size: Buffered row count that triggers a flush
+        flush_interval_seconds: Maximum age of a buffered row before a flush
+        max_attempts: Failed writes after which a row is dropped
+    """
+
+    DEFAULT_BATCH_SIZE = 200
+    DEFAULT_FLUSH_INTERVAL_SECONDS = 5.0
+    DEFAULT_MAX_ATTEMPTS = 3
+
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        session_context: Callable = get_db_context,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        """Initialize signal sink.
+
+        Args:
+            batch_size: Buffered row count that triggers a flush
+            flush_interval_seconds: Maximum age of a buffered row before a flush
+            session_context: Context manager factory yielding a session that
+                commits on exit (default: get_db_context)
+            max_attempts: Failed writes after which a row is dropped (default: 3)
+        """
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_attempts = max_attempts
+        self._session_context = session_context
+
+        self._buffer: dict[tuple[str, date], dict[str, Any]] = {}
+        self._attempts: dict[tuple[str, date], int] = {}  # Failed writes of buffered rows
+        self._oldest: float | None = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+
+        self._stats = {
+            "submitted": 0,
+            "written": 0,
+            "flushes": 0,
+            "failed_flushes": 0,
+            "dropped": 0,
+        }
+
+        self._flusher = threading.Thread(
+            target=self._run_flusher, name="signal-sink-flusher", daemon=True
+        )
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def track_signal(
+        self,
+        ticker: str,
+        signal_date: date,
+        signal_type: str,
+        confidence: float,
+        entry_price: float,
+        target_price: float | None = None,
+        stop_loss: float | None = None,
+        decision_tree: dict | None = None,
+        indicators_snapshot: dict | None = None,
+        market_regime: str | None = None,
+    ) -> None:
+        """Buffer a signal for writing (same arguments as SignalOutcomeTracker.track_signal).
+
+        A decision_tree or indicators_snapshot of None leaves the stored value
+        of an existing row untouched.
+
+        Args:
+            ticker: Stock ticker symbol
+            signal_date: Date of the signal
+            signal_type: BUY, SELL, or HOLD
+            confidence: Confidence score (0.0-1.0)
+            entry_price: Entry price
+            target_price: Profit target
+            stop_loss: Stop loss
+            decision_tree: Reasoning chain (JSON)
+            indicators_snapshot: Indicator values at signal time (JSON)
+            market_regime: Market regime label
+        """
+        row = {
+            "ticker": ticker,
+            "signal_date": signal_date,
+            "signal_type": signal_type,
+            "confidence": float(confidence),
+            "entry_price": float(entry_price),
+            "target_price": float(target_price) if target_price is not None else None,
+            "stop_loss": float(stop_loss) if stop_loss is not None else None,
+            "market_regime": market_regime,
+        }
+        if decision_tree:
+            row["decision_tree"] = _json_safe(decision_tree)
+        if indicators_snapshot:
+            row["indicators_snapshot"] = _json_safe(indicators_snapshot)
+        self.submit(row)
+
+    def submit(self, row: dict[str, Any]) -> None:
+        """Buffer a signal_history row (must include ticker and signal_date).
+
+        Args:
+            row: Column values keyed by SignalHistory column name
+        """
+        if self._closed:
+            logger.warning(f"Signal sink closed, writing {row['ticker']} synchronously")
+            self._write([row])
+            return
+
+        with self._lock:
+            key = (row["ticker"], row["signal_date"])
+            self._buffer[key] = row
+            self._attempts.pop(key, None)  # A new row gets its own attempts
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            self._stats["submitted"] += 1
+            full = len(self._buffer) >= self.batch_size
+
+        if full:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """Write all buffered rows now.
+
+        Rows that fail are re-buffered for the next flush, or dropped once they
+        have failed max_attempts times.
+
+        Returns:
+            Number of rows written
+        """
+        with self._flush_lock:
+            with self._lock:
+                rows = list(self._buffer.values())
+                self._buffer.clear()
+                self._oldest = None
+
+            if not rows:
+                return 0
+
+            written, failed = self._write_isolating(rows)
+
+            with self._lock:
+                self._stats["written"] += written
+                if written:
+                    self._stats["flushes"] += 1
+                failed_keys = {(row["ticker"], row["signal_date"]) for row, _ in failed}
+                for row in rows:
+                    key = (row["ticker"], row["signal_date"])
+                    if key not in failed_keys:
+                        self._attempts.pop(key, None)
+                if failed:
+                    self._stats["failed_flushes"] += 1
+                    retried = self._rebuffer(failed)
+                    logger.error(
+                        f"Signal sink failed to write {len(failed)}/{len(rows)} rows "
+                        f"({retried} re-buffered): {failed[0][1]}"
+                    )
+
+            logger.debug(f"Signal sink flushed {written} rows")
+            return written
+
+    def _write_isolating(
+        self, rows: list[dict[str, Any]]
+    ) -> tuple[int, list[tuple[dict[str, Any], Exception]]]:
+        """Write rows, splitting a failed batch in halves down to the failing rows.
+
+        Returns:
+            Number of rows written and the (row, error) pairs that failed alone
+        """
+        try:
+            self._write(rows)
+            return len(rows), []
+        except Exception as e:
+            if len(rows) == 1:
+                return 0, [(rows[0], e)]
+
+        middle = len(rows) // 2
+        written, failed = self._write_isolating(rows[:middle])
+        more_written, more_failed = self._write_isolating(rows[middle:])
+        return written + more_written, failed + more_failed
+
+    def _rebuffer(self, failed: list[tuple[dict[str, Any], Exception]]) -> int:
+        """Re-buffer failed rows, dropping those out of attempts (caller holds _lock).
+
+        Returns:
+            Number of rows re-buffered
+        """
+        retried = 0
+        for row, error in failed:
+            key = (row["ticker"], row["signal_date"])
+            if key in self._buffer:
+                continue  # Superseded by a row submitted during the flush
+            attempts = self._attempts.get(key, 0) + 1
+            if attempts >= self.max_attempts:
+                self._attempts.pop(key, None)
+                self._stats["dropped"] += 1
+                logger.error(
+                    f"Dropping signal_history row for {row['ticker']} on "
+                    f"{row['signal_date']} after {attempts} failed writes: {error}"
+                )
+                continue
+            self._attempts[key] = attempts
+            self._buffer[key] = row
+            retried += 1
+        if retried and self._oldest is None:
+            self._oldest = time.monotonic()
+        return retried
+
+    def close(self) -> None:
+        """Stop the background flusher and write any remaining rows."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self._flusher.join(timeout=self.flush_interval_seconds + 5)
+        written = self.flush()
+        if written:
+            logger.info(f"Signal sink flushed {written} rows on shutdown")
+
+    def get_stats(self) -> dict[str, int]:
+        """Get sink counters and the current buffer size."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["buffered"] = len(self._buffer)
+        return stats
+
+    def _write(self, rows: list[dict[str, Any]]) -> None:
+        """Upsert rows with one multi-row INSERT ... ON CONFLICT per column set.
+
+        Rows are grouped by the columns they carry so a row without a column
+        never overwrites that column of an existing row.
+        """
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+
+        with self._session_context() as session:
+            for columns, group in groups.items():
+                stmt = insert(SignalHistory).values(group)
+                update_columns = {
+                    column: stmt.excluded[column]
+                    for column in columns
+                    if column not in ("ticker", "signal_date")
+                }
+                update_columns["updated_at"] = func.now()
+                stmt = stmt.on_conflict_do_update(
+                    constraint=UPSERT_CONSTRAINT, set_=update_columns
+                )
+                session.execute(stmt)
+
+    def _run_flusher(self) -> None:
+        """Flush on batch size or when the oldest buffered row is too old."""
+        while not self._closed:
+            with self._lock:
+                oldest = self._oldest
+                size = len(self._buffer)
+
+            if oldest is None:
+                timeout = self.flush_interval_seconds
+            else:
+                timeout = max(0.0, oldest + self.flush_interval_seconds - time.monotonic())
+
+            if size < self.batch_size and timeout > 0:
+                self._wakeup.wait(timeout)
+                self._wakeup.clear()
+                if self._closed:
+                    return
+
+            with self._lock:
+                due = self._oldest is not None and (
+                    len(self._buffer) >= self.batch_size
+                    or time.monotonic() - self._oldest >= self.flush_interval_seconds
+                )
+            if due:
+                self.flush()
+
+
+_signal_sink: SignalSink | None = None
+
+
+def get_signal_sink() -> SignalSink:
+    """Get the process-wide SignalSink singleton."""
+    global _signal_sink
+    if _signal_sink is None:
+        _signal_sink = SignalSink()
+    return _signal_sink
@@ -0,0 +1,271 @@
+"""Persistent IncrementalState snapshots for warm restarts.
+
+IncrementalCalculator keeps one IncrementalState per ticker in memory; losing
+it (deploy, worker restart, Celery prefork recycle) forces every ticker to
+reload 220+ days of history. IncrementalStateStore checkpoints states to a
+local SQLite file after each daily update, one compact binary row per ticker,
+so a cold process restores them without touching the database.
+
+The file is shared safely between worker processes (WAL journal, one
+connection per process).
+
+Example:
+    store = IncrementalStateStore("/var/lib/quant-signal/incremental_state.sqlite")
+    calculator = IncrementalCalculator(state_store=store)
+    calculator.restore_states()  # Eager; states are otherwise restored on first use
+"""
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import fields
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from src.engine.ring_buffer import RingBuffer
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the IncrementalState layout changes; older rows are ignored
+STATE_FORMAT_VERSION = 4
+
+
+def as_date(value) -> date:
+    """Normalize a bar date (date, datetime, Timestamp or ISO string) to a date."""
+    if isinstance(value, date) and not hasattr(value, "hour"):
+        return value
+    return pd.Timestamp(value).date()
+
+
+def encode_state(state) -> bytes:
+    """Serialize an IncrementalState to a compact binary payload.
+
+    Ring buffer windows are stored as (capacity, raw float64 bytes, oldest first).
+    """
+    values = []
+    for state_field in fields(state):
+        value = getattr(state, state_field.name)
+        if state_field.name == "last_date":
+            value = as_date(value).toordinal()
+        elif isinstance(value, RingBuffer):
+            value = (value.capacity, value.to_array().tobytes())
+        elif isinstance(value, np.floating):
+            value = float(value)
+        values.append(value)
+    return pickle.dumps((STATE_FORMAT_VERSION, tuple(values)), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def decode_state(payload: bytes, state_class):
+    """Rebuild an IncrementalState from encode_state() output.
+
+    Args:
+        payload: Binary payload
+        state_class: IncrementalState class
+
+    Returns:
+        IncrementalState, or None if the payload uses another format version
+    """
+    version, values = pickle.loads(payload)
+    state_fields = fields(state_class)
+    if version != STATE_FORMAT_VERSION or len(values) != len(state_fields):
+        return None
+
+    kwargs = {}
+    for state_field, value in zip(state_fields, values, strict=True):
+        if state_field.name == "last_date":
+            value = date.fromordinal(value)
+        elif isinstance(value, tuple):
+            capacity, window = value
+            value = RingBuffer.from_values(np.frombuffer(window, dtype=np.float64), capacity)
+        kwargs[state_field.name] = value
+    return state_class(**kwargs)
+
+
+class IncrementalStateStore:
+    """SQLite-backed checkpoint store for IncrementalState objects.
+
+    Attributes:
+        path: SQLite file path
+    """
+
+    def __init__(self, path: str):
+        """Initialize state store, creating the file and table if needed.
+
+        Args:
+            path: SQLite file path (parent directories are created)
+        """
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+        with self._lock:
+            self._connect().execute(
+                "CREATE TABLE IF NOT EXISTS incremental_state ("
+                "ticker TEXT PRIMARY KEY, last_date TEXT NOT NULL, "
+                "payload BLOB NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def save(self, state) -> None:
+        """Checkpoint one state (replaces the ticker's previous snapshot)."""
+        self.save_many([state])
+
+    def save_many(self, states: Iterable) -> int:
+        """Checkpoint many states in one transaction.
+
+        Args:
+            states: IncrementalState objects
+
+        Returns:
+            Number of states written
+        """
+        now = time.time()
+        rows = [
+            (state.ticker, as_date(state.last_date).isoformat(), encode_state(state), now)
+            for state in states
+        ]
+        if not rows:
+            return 0
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT INTO incremental_state (ticker, last_date, payload, updated_at) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT(ticker) DO UPDATE SET "
+                    "last_date = excluded.last_date, payload = excluded.payload, "
+                    "updated_at = excluded.updated_at",
+                    rows,
+                )
+        return len(rows)
+
+    def load(self, ticker: str, state_class):
+        """Load one ticker's state.
+
+        Args:
+            ticker: Stock ticker symbol
+            state_class: IncrementalState class
+
+        Returns:
+            IncrementalState, or None if missing or in an old format
+        """
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT payload FROM incremental_state WHERE ticker = ?", (ticker,))
+                .fetchone()
+            )
+        return self._decode(ticker, row[0], state_class) if row else None
+
+    def load_many(self, state_class, tickers: list[str] | None = None) -> dict:
+        """Load many states in one query.
+
+        Args:
+            state_class: IncrementalState class
+            tickers: Tickers to load (None loads all)
+
+        Returns:
+            Dict mapping ticker to IncrementalState (old formats omitted)
+        """
+        with self._lock:
+            connection = self._connect()
+            if tickers is None:
+                rows = connection.execute("SELECT ticker, payload FROM incremental_state")
+            else:
+                placeholders = ", ".join("?" * len(tickers))
+                rows = connection.execute(
+                    "SELECT ticker, payload FROM incremental_state "
+                    f"WHERE ticker IN ({placeholders})",
+                    list(tickers),
+                )
+            rows = rows.fetchall()
+
+        states = {}
+        for ticker, payload in rows:
+            state = self._decode(ticker, payload, state_class)
+            if state is not None:
+                states[ticker] = state
+        return states
+
+    def delete(self, ticker: str | None = None) -> None:
+        """Delete one ticker's snapshot, or all snapshots if ticker is None."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                if ticker is None:
+                    connection.execute("DELETE FROM incremental_state")
+                else:
+                    connection.execute("DELETE FROM incremental_state WHERE ticker = ?", (ticker,))
+
+    def get_stats(self) -> dict:
+        """Get snapshot count, date range and file size."""
+        with self._lock:
+            count, oldest, newest = (
+                self._connect()
+                .execute("SELECT COUNT(*), MIN(last_date), MAX(last_date) FROM incremental_state")
+                .fetchone()
+            )
+        return {
+            "path": self.path,
+            "states": count,
+            "oldest_last_date": oldest,
+            "newest_last_date": newest,
+            "file_bytes": os.path.getsize(self.path) if os.path.exists(self.path) else 0,
+        }
+
+    def close(self) -> None:
+        """Close this process's connection."""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this process's connection (caller holds the lock).
+
+        A connection inherited through fork is never reused.
+        """
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._pid = os.getpid()
+        return self._connection
+
+    @staticmethod
+    def _decode(ticker: str, payload: bytes, state_class):
+        try:
+            state = decode_state(payload, state_class)
+        except Exception as e:
+            logger.warning(f"[{ticker}] Discarding unreadable incremental state snapshot: {e}")
+            return None
+        if state is None:
+            logger.info(f"[{ticker}] Ignoring incremental state snapshot in an old format")
+        return state
+
+
+_state_store: IncrementalStateStore | None = None
+
+
+def get_state_store() -> IncrementalStateStore | None:
+    """Get the process-wide IncrementalStateStore.
+
+    Persistence is enabled by setting INCREMENTAL_STATE_PATH; returns None
+    when it is unset.
+    """
+    global _state_store
+    path = os.getenv("INCREMENTAL_STATE_PATH")
+    if not path:
+        return None
+    if _state_store is None or _state_store.path != path:
+        _state_store = IncrementalStateStore(path)
+    return _state_store
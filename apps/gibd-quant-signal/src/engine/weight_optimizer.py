@@ -0,0 +1,526 @@
+"""Vectorized weight re-scoring and walk-forward weight optimization.
+
+Component scores (momentum, trend, volume, volatility, sector,
+support_resistance, timeframe_alignment) do not depend on the engine weights:
+total_score is their dot product with the weight vector. Persisting them per
+ticker and date (signal_component_scores, filled by SignalReplayer with
+persist_scores=True) lets candidate weight and threshold vectors be evaluated
+against realized forward returns as matrix products, without regenerating
+signals or touching the database.
+
+Example:
+    with get_db_context() as session:
+        matrix = load_score_matrix(session, date(2022, 1, 1), date(2024, 12, 31), horizon=10)
+    weights, buy, sell = random_candidates(5000, seed=7)
+    optimizer = WalkForwardOptimizer(train_days=250, test_days=60)
+    result = optimizer.optimize(matrix, weights, buy, sell)
+    print(result["best"])  # Weights and thresholds selected on the latest fold
+"""
+
+import logging
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.database.models import SignalComponentScore
+from src.engine.signal_panel import load_price_panel
+
+logger = logging.getLogger(__name__)
+
+# Column order of score matrices and weight vectors
+SCORE_COMPONENTS = (
+    "momentum",
+    "trend",
+    "volume",
+    "volatility",
+    "sector",
+    "support_resistance",
+    "timeframe_alignment",
+)
+
+UPSERT_CONSTRAINT = "uq_component_scores_ticker_date"
+
+# Candidate (n_obs x n_candidates) blocks are kept around this many elements
+RESCORE_BLOCK_ELEMENTS = 8_000_000
+
+
+def save_component_scores(session: Session, signals: Iterable) -> int:
+    """Upsert the component scores of generated signals.
+
+    Signals generated at minimal detail carry no component scores and are
+    skipped.
+
+    Args:
+        session: Database session
+        signals: Signal objects (scores or full detail)
+
+    Returns:
+        Number of rows written
+    """
+    rows = [
+        {
+            "ticker": signal.ticker,
+            "signal_date": signal.signal_date,
+            **{component: float(signal.scores[component]) for component in SCORE_COMPONENTS},
+            "entry_price": float(signal.entry_price),
+        }
+        for signal in signals
+        if all(component in signal.scores for component in SCORE_COMPONENTS)
+    ]
+    if not rows:
+        return 0
+
+    stmt = insert(SignalComponentScore).values(rows)
+    update_columns = {
+        column: stmt.excluded[column] for column in (*SCORE_COMPONENTS, "entry_price")
+    }
+    update_columns["updated_at"] = func.now()
+    session.execute(
+        stmt.on_conflict_do_update(constraint=UPSERT_CONSTRAINT, set_=update_columns)
+    )
+    return len(rows)
+
+
+@dataclass
+class ScoreMatrix:
+    """Component scores and realized forward returns, one row per (ticker, date).
+
+    Attributes:
+        tickers: Ticker per row (object array)
+        dates: Signal date per row (datetime64[D])
+        scores: (n x 7) component scores in SCORE_COMPONENTS order
+        forward_returns: Close-to-close return over `horizon` bars (NaN when
+            the horizon is not yet available)
+        horizon: Forward return horizon in trading bars
+    """
+
+    tickers: np.ndarray
+    dates: np.ndarray
+    scores: np.ndarray
+    forward_returns: np.ndarray
+    horizon: int
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def select(self, mask: np.ndarray) -> "ScoreMatrix":
+        """Get the rows selected by a boolean mask."""
+        return ScoreMatrix(
+            tickers=self.tickers[mask],
+            dates=self.dates[mask],
+            scores=self.scores[mask],
+            forward_returns=self.forward_returns[mask],
+            horizon=self.horizon,
+        )
+
+
+def load_score_matrix(
+    session: Session,
+    start_date: date,
+    end_date: date,
+    horizon: int = 10,
+    tickers: list[str] | None = None,
+) -> ScoreMatrix:
+    """Load persisted component scores and their realized forward returns.
+
+    Args:
+        session: Database session
+        start_date: First signal date (inclusive)
+        end_date: Last signal date (inclusive)
+        horizon: Forward return horizon in trading bars
+        tickers: Optional ticker filter (None loads all)
+
+    Returns:
+        ScoreMatrix ordered by ticker and date
+    """
+    start = time.time()
+    query = session.query(
+        SignalComponentScore.ticker,
+        SignalComponentScore.signal_date,
+        *(getattr(SignalComponentScore, component) for component in SCORE_COMPONENTS),
+    ).filter(
+        SignalComponentScore.signal_date >= start_date,
+        SignalComponentScore.signal_date <= end_date,
+    )
+    if tickers is not None:
+        query = query.filter(SignalComponentScore.ticker.in_(tickers))
+    rows = query.order_by(SignalComponentScore.ticker, SignalComponentScore.signal_date).all()
+
+    n = len(rows)
+    row_tickers = np.array([row[0] for row in rows], dtype=object)
+    row_dates = np.array([row[1] for row in rows], dtype="datetime64[D]")
+    scores = np.array([row[2:] for row in rows], dtype=np.float64).reshape(n, len(SCORE_COMPONENTS))
+    forward_returns = np.full(n, np.nan)
+
+    if n:
+        # Enough calendar days for `horizon` trading bars after end_date
+        panel = load_price_panel(
+            session,
+            sorted(set(row_tickers)),
+            start_date,
+            end_date + timedelta(days=horizon * 2 + 10),
+        )
+        boundaries = np.flatnonzero(row_tickers[1:] != row_tickers[:-1]) + 1
+        for block in np.split(np.arange(n), boundaries):
+            ticker = row_tickers[block[0]]
+            i = panel.row(ticker)
+            if i is None:
+                continue
+            count = int(panel.counts[i])
+            bar_dates = np.asarray(panel.dates[i], dtype="datetime64[D]")
+            closes = panel.close[i, panel.width - count :]
+
+            positions = np.searchsorted(bar_dates, row_dates[block])
+            exact = positions < count
+            exact[exact] = bar_dates[positions[exact]] == row_dates[block][exact]
+            ahead = positions + horizon
+            ok = exact & (ahead < count)
+            entry = closes[positions[ok]]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                forward_returns[block[ok]] = np.where(
+                    entry > 0, closes[ahead[ok]] / entry - 1.0, np.nan
+                )
+
+    logger.info(
+        f"Loaded score matrix: {n} rows, {np.isfinite(forward_returns).sum()} with "
+        f"{horizon}-bar returns in {time.time() - start:.1f}s"
+    )
+    return ScoreMatrix(
+        tickers=row_tickers,
+        dates=row_dates,
+        scores=scores,
+        forward_returns=forward_returns,
+        horizon=horizon,
+    )
+
+
+def random_candidates(
+    count: int,
+    seed: int | None = None,
+    buy_range: tuple[float, float] = (0.2, 0.6),
+    sell_range: tuple[float, float] = (-0.6, -0.2),
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Draw random weight and threshold candidates.
+
+    Weights are sampled uniformly from the simplex (they sum to 1.0 like the
+    engine defaults); thresholds uniformly from the given ranges.
+
+    Args:
+        count: Number of candidates
+        seed: Optional random seed
+        buy_range: (low, high) for BUY thresholds
+        sell_range: (low, high) for SELL thresholds
+
+    Returns:
+        Tuple of (weights (count x 7), buy thresholds (count,), sell thresholds (count,))
+    """
+    rng = np.random.default_rng(seed)
+    weights = rng.dirichlet(np.ones(len(SCORE_COMPONENTS)), size=count)
+    buy = rng.uniform(*buy_range, size=count)
+    sell = rng.uniform(*sell_range, size=count)
+    return weights, buy, sell
+
+
+def rescore(
+    scores: np.ndarray,
+    forward_returns: np.ndarray,
+    weights: np.ndarray,
+    buy_thresholds: np.ndarray,
+    sell_thresholds: np.ndarray,
+    min_trades: int = 20,
+) -> dict[str, np.ndarray]:
+    """Evaluate many weight/threshold candidates against realized returns.
+
+    Total scores for all candidates are one (n x 7) @ (7 x k) product; BUY
+    rows earn the forward return and SELL rows its negative. Candidates are
+    processed in blocks to bound memory.
+
+    Args:
+        scores: (n x 7) component scores
+        forward_returns: (n,) forward returns (rows with NaN are ignored)
+        weights: (k x 7) candidate weight vectors
+        buy_thresholds: (k,) BUY thresholds
+        sell_thresholds: (k,) SELL thresholds
+        min_trades: Candidates with fewer trades get objective -inf
+
+    Returns:
+        Dict of (k,) arrays: trades, buy_trades, sell_trades, avg_return,
+        hit_rate and objective (avg_return, or -inf below min_trades)
+    """
+    valid = np.isfinite(forward_returns)
+    scores = scores[valid]
+    returns = forward_returns[valid]
+    weights = np.atleast_2d(weights)
+    k = len(weights)
+
+    result = {
+        name: np.zeros(k)
+        for name in ("trades", "buy_trades", "sell_trades", "avg_return", "hit_rate")
+    }
+
+    if len(returns):
+        up = (returns > 0).astype(np.float64)
+        down = (returns < 0).astype(np.float64)
+        block = max(1, RESCORE_BLOCK_ELEMENTS // len(returns))
+
+        for start in range(0, k, block):
+            cols = slice(start, start + block)
+            totals = scores @ weights[cols].T
+            buys = (totals >= buy_thresholds[cols]).astype(np.float64)
+            sells = (totals <= sell_thresholds[cols]).astype(np.float64)
+
+            buy_trades = buys.sum(axis=0)
+            sell_trades = sells.sum(axis=0)
+            trades = buy_trades + sell_trades
+            profit = returns @ buys - returns @ sells
+            hits = up @ buys + down @ sells
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                result["avg_return"][cols] = np.where(trades > 0, profit / trades, 0.0)
+                result["hit_rate"][cols] = np.where(trades > 0, hits / trades, 0.0)
+            result["trades"][cols] = trades
+            result["buy_trades"][cols] = buy_trades
+            result["sell_trades"][cols] = sell_trades
+
+    result["objective"] = np.where(
+        result["trades"] >= min_trades, result["avg_return"], -np.inf
+    )
+    return result
+
+
+def _evaluate_fold(
+    train_scores: np.ndarray,
+    train_returns: np.ndarray,
+    test_scores: np.ndarray,
+    test_returns: np.ndarray,
+    weights: np.ndarray,
+    buy_thresholds: np.ndarray,
+    sell_thresholds: np.ndarray,
+    min_trades: int,
+) -> dict:
+    """Pick the best candidate on a training window and score it out of sample.
+
+    Module-level so it can run in a ProcessPoolExecutor worker.
+    """
+    train = rescore(
+        train_scores, train_returns, weights, buy_thresholds, sell_thresholds, min_trades
+    )
+    best = int(np.argmax(train["objective"]))
+    if not np.isfinite(train["objective"][best]):
+        return {"best_index": None}
+
+    test = rescore(
+        test_scores,
+        test_returns,
+        weights[best : best + 1],
+        buy_thresholds[best : best + 1],
+        sell_thresholds[best : best + 1],
+        min_trades=0,
+    )
+    return {
+        "best_index": best,
+        "train_avg_return": float(train["avg_return"][best]),
+        "train_hit_rate": float(train["hit_rate"][best]),
+        "train_trades": int(train["trades"][best]),
+        "test_avg_return": float(test["avg_return"][0]),
+        "test_hit_rate": float(test["hit_rate"][0]),
+        "test_trades": int(test["trades"][0]),
+    }
+
+
+class WalkForwardOptimizer:
+    """Walk-forward selection of engine weights and thresholds.
+
+    Each fold selects the candidate with the best training objective on a
+    rolling window of signal dates and evaluates it on the following test
+    window. The last `horizon` training dates are dropped (embargo) because
+    their forward returns overlap the test window. Folds are independent and
+    run in parallel.
+
+    Attributes:
+        train_days: Signal dates per training window
+        test_days: Signal dates per test window
+        step_days: Signal dates between fold starts
+        min_trades: Minimum training trades for a candidate to be eligible
+        execution_mode: 'sequential', 'thread', or 'process'
+        max_workers: Maximum number of parallel workers
+    """
+
+    EXECUTION_MODES = ["sequential", "thread", "process"]
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(
+        self,
+        train_days: int = 250,
+        test_days: int = 60,
+        step_days: int | None = None,
+        min_trades: int = 20,
+        execution_mode: str = "thread",
+        max_workers: int | None = None,
+    ):
+        """Initialize walk-forward optimizer.
+
+        Args:
+            train_days: Signal dates per training window
+            test_days: Signal dates per test window
+            step_days: Signal dates between fold starts (default: test_days)
+            min_trades: Minimum training trades for a candidate to be eligible
+            execution_mode: How to run folds ('sequential', 'thread', 'process')
+            max_workers: Maximum number of parallel workers (default: 4)
+
+        Raises:
+            ValueError: If execution_mode is not valid
+        """
+        if execution_mode not in self.EXECUTION_MODES:
+            raise ValueError(
+                f"Invalid execution_mode: {execution_mode}. Must be one of {self.EXECUTION_MODES}"
+            )
+
+        self.train_days = train_days
+        self.test_days = test_days
+        self.step_days = step_days or test_days
+        self.min_trades = min_trades
+        self.execution_mode = execution_mode
+        self.max_workers = max_workers or self.DEFAULT_MAX_WORKERS
+
+    def folds(self, matrix: ScoreMatrix) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Split a score matrix into (train mask, test mask) pairs by signal date.
+
+        The last `horizon` dates of each train window are embargoed, so their
+        forward returns do not overlap the test window.
+
+        Raises:
+            ValueError: If train_days does not exceed the matrix horizon (the
+                embargo would leave no train dates)
+        """
+        embargo = matrix.horizon
+        if self.train_days <= embargo:
+            raise ValueError(
+                f"train_days ({self.train_days}) must exceed the score matrix horizon "
+                f"({embargo} days embargoed per train window)"
+            )
+        signal_dates = np.unique(matrix.dates)
+        folds = []
+
+        start = 0
+        while start + self.train_days + self.test_days <= len(signal_dates):
+            train_dates = signal_dates[start : start + self.train_days - embargo]
+            test_dates = signal_dates[
+                start + self.train_days : start + self.train_days + self.test_days
+            ]
+            folds.append(
+                (
+                    (matrix.dates >= train_dates[0]) & (matrix.dates <= train_dates[-1]),
+                    (matrix.dates >= test_dates[0]) & (matrix.dates <= test_dates[-1]),
+                )
+            )
+            start += self.step_days
+
+        return folds
+
+    def optimize(
+        self,
+        matrix: ScoreMatrix,
+        weights: np.ndarray,
+        buy_thresholds: np.ndarray,
+        sell_thresholds: np.ndarray,
+    ) -> dict:
+        """Run walk-forward optimization over candidate vectors.
+
+        Args:
+            matrix: Score matrix with forward returns
+            weights: (k x 7) candidate weight vectors
+            buy_thresholds: (k,) BUY thresholds
+            sell_thresholds: (k,) SELL thresholds
+
+        Returns:
+            Dict with:
+            {
+                "folds": [per-fold dates, selected candidate and train/test metrics],
+                "test_avg_return": float,  # trade-weighted across test windows
+                "test_trades": int,
+                "best": {"weights": dict, "buy_threshold": float, "sell_threshold": float}
+                        # candidate selected on the latest fold (None if no fold)
+            }
+
+        Raises:
+            ValueError: If train_days does not exceed the matrix horizon
+        """
+        start = time.time()
+        folds = self.folds(matrix)
+        jobs = [
+            (
+                matrix.scores[train],
+                matrix.forward_returns[train],
+                matrix.scores[test],
+                matrix.forward_returns[test],
+                weights,
+                buy_thresholds,
+                sell_thresholds,
+                self.min_trades,
+            )
+            for train, test in folds
+        ]
+
+        if self.execution_mode == "sequential" or len(jobs) <= 1:
+            outcomes = [_evaluate_fold(*job) for job in jobs]
+        else:
+            executor_class = (
+                ProcessPoolExecutor if self.execution_mode == "process" else ThreadPoolExecutor
+            )
+            with executor_class(max_workers=self.max_workers) as executor:
+                outcomes = list(executor.map(_evaluate_fold, *zip(*jobs, strict=True)))
+
+        fold_results = []
+        for (train, test), outcome in zip(folds, outcomes, strict=True):
+            fold = {
+                "train_start": str(matrix.dates[train].min()),
+                "train_end": str(matrix.dates[train].max()),
+                "test_start": str(matrix.dates[test].min()),
+                "test_end": str(matrix.dates[test].max()),
+                **outcome,
+            }
+            if outcome["best_index"] is not None:
+                fold.update(self._candidate(weights, buy_thresholds, sell_thresholds, outcome))
+            fold_results.append(fold)
+
+        selected = [fold for fold in fold_results if fold["best_index"] is not None]
+        test_trades = sum(fold["test_trades"] for fold in selected)
+        test_profit = sum(fold["test_avg_return"] * fold["test_trades"] for fold in selected)
+
+        logger.info(
+            f"Walk-forward optimization: {len(weights)} candidates x {len(folds)} folds "
+            f"in {time.time() - start:.1f}s"
+        )
+        return {
+            "folds": fold_results,
+            "test_avg_return": test_profit / test_trades if test_trades else 0.0,
+            "test_trades": test_trades,
+            "best": (
+                {key: selected[-1][key] for key in ("weights", "buy_threshold", "sell_threshold")}
+                if selected
+                else None
+            ),
+        }
+
+    @staticmethod
+    def _candidate(
+        weights: np.ndarray, buy_thresholds: np.ndarray, sell_thresholds: np.ndarray, outcome: dict
+    ) -> dict:
+        """Engine-ready weights and thresholds of a fold's selected candidate."""
+        best = outcome["best_index"]
+        return {
+            "weights": {
+                component: float(weight)
+                for component, weight in zip(SCORE_COMPONENTS, weights[best], strict=True)
+            },
+            "buy_threshold": float(buy_thresholds[best]),
+            "sell_threshold": float(sell_thresholds[best]),
+        }
@@ -331,6 +331,51 @@ class SectorManager:
 
         return rs
 
+    def calculate_relative_strengths(
+        self, tickers: list[str], daily_returns: dict[str, float]
+    ) -> dict[str, float]:
+        """Calculate relative strength for many stocks from precomputed returns.
+
+        Bulk counterpart of get_relative_strength(): sector returns are averaged
+        once from the supplied 1-day returns instead of being re-queried for
+        every stock. Stocks without a return (no bar on the target date) get a
+        neutral 1.0, matching the per-ticker path.
+
+        Args:
+            tickers: Stock ticker symbols to score
+            daily_returns: Mapping ticker -> 1-day return on the target date,
+                covering the tickers and their sector constituents
+
+        Returns:
+            Dict mapping ticker to relative strength ratio
+        """
+        self._ensure_loaded()
+
+        sector_returns: dict[str, float] = {}
+        strengths: dict[str, float] = {}
+
+        for ticker in tickers:
+            sector = self.get_sector(ticker)
+            stock_return = daily_returns.get(ticker)
+            if sector is None or stock_return is None:
+                strengths[ticker] = 1.0
+                continue
+
+            if sector not in sector_returns:
+                returns = [
+                    daily_returns[t] for t in self.get_sector_tickers(sector) if t in daily_returns
+                ]
+                sector_returns[sector] = sum(returns) / len(returns) if returns else 0.0
+
+            sector_return = sector_returns[sector]
+            if sector_return == -1.0:
+                strengths[ticker] = 1.0
+                continue
+
+            strengths[ticker] = (1 + stock_return) / (1 + sector_return)
+
+        return strengths
+
     def detect_sector_rotation(
         self, target_date: date, session: Session | None = None
     ) -> dict[str, list[str]]:
@@ -0,0 +1,39 @@
+"""Shared fixtures for the signal engine tests."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+BARS = 300
+
+
+def make_history(bars: int = BARS, seed: int = 0) -> pd.DataFrame:
+    """Random-walk daily OHLCV bars with gaps and uneven ranges.
+
+    Opens gap away from the previous close and highs/lows extend a random
+    distance beyond the body, so directional movement, stochastic ranges and
+    money flow vary from bar to bar.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, bars)))
+    open_ = np.concatenate(([close[0]], close[:-1])) * np.exp(rng.normal(0, 0.005, bars))
+    high = np.maximum(open_, close) * (1 + rng.exponential(0.01, bars))
+    low = np.minimum(open_, close) * (1 - rng.exponential(0.01, bars))
+    return pd.DataFrame(
+        {
+            "date": [date(2024, 1, 1) + timedelta(days=i) for i in range(bars)],
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": np.round(rng.lognormal(10, 0.5, bars)),
+        }
+    )
+
+
+@pytest.fixture(params=[3, 11], ids=lambda seed: f"seed{seed}")
+def history(request):
+    """300 daily bars for one ticker (one set per seed)."""
+    return make_history(seed=request.param)
@@ -0,0 +1,215 @@
+"""Parity of the bulk signal path with the per-ticker path on synthetic prices."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from src.database.market_data import build_ohlcv_arrays
+from src.engine import signal_engine
+from src.engine.profile_cache import ProfileRecord
+from src.engine.signal_engine import AdaptiveSignalEngine
+from src.engine.signal_panel import build_price_panel
+
+TARGET_DATE = date(2025, 6, 30)
+
+NUMERIC_FIELDS = (
+    "total_score",
+    "confidence",
+    "entry_price",
+    "target_price",
+    "stop_loss",
+    "risk_reward",
+    "trailing_stop",
+)
+
+
+class _NoSectors:
+    def get_sector(self, ticker):
+        return None
+
+    def calculate_relative_strengths(self, tickers, daily_returns):
+        return dict.fromkeys(tickers, 0.0)
+
+
+class _Profiles:
+    def __init__(self, profiles):
+        self.profiles = profiles
+
+    def get(self, ticker, session):
+        return self.profiles.get(ticker)
+
+    def get_many(self, tickers, session):
+        return {ticker: self.profiles[ticker] for ticker in tickers if ticker in self.profiles}
+
+
+class _Sink:
+    def __init__(self):
+        self.tracked = []
+
+    def track_signal(self, **kwargs):
+        self.tracked.append(kwargs)
+
+
+def _rows(ticker, bars, rng):
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, bars)))
+    return [
+        (
+            ticker,
+            TARGET_DATE - timedelta(days=bars - 1 - i),
+            close[i],
+            close[i] * 1.01,
+            close[i] * 0.99,
+            close[i],
+            float(1000 + 10 * i),
+        )
+        for i in range(bars)
+    ]
+
+
+def _profile(ticker, k, last_close):
+    return ProfileRecord(
+        ticker=ticker,
+        rsi_overbought=70.0,
+        rsi_oversold=30.0,
+        volatility_category=("high", "low", "medium")[k % 3],
+        avg_true_range=None,
+        typical_volume=None,
+        high_volume_threshold=2.5 if k % 2 else None,
+        support_levels=(last_close * 0.985,),
+        resistance_levels=(last_close * 1.04,),
+        last_calibrated_at=None,
+        updated_at=None,
+    )
+
+
+@pytest.fixture
+def universe():
+    """Tickers with varied history lengths, profiles and indicator snapshots."""
+    rng = np.random.default_rng(7)
+    lengths = {"AAA": 64, "BBB": 64, "CCC": 45, "DDD": 33, "EEE": 20, "FFF": 64}
+    rows = {ticker: _rows(ticker, bars, rng) for ticker, bars in lengths.items()}
+    profiles = {
+        ticker: _profile(ticker, k, rows[ticker][-1][5])
+        for k, ticker in enumerate(lengths)
+        if ticker != "FFF"  # Not calibrated yet
+    }
+    indicators = {
+        "AAA": {"rsi": 25.0, "rvol": 2.7, "weekly_trend": "strong_oversold"},
+        "CCC": {"adx": 35.0, "atr": 1.5, "rvol": 0.4},
+    }
+    return rows, profiles, indicators
+
+
+@pytest.fixture
+def engine(monkeypatch, universe):
+    rows, profiles, indicators = universe
+    engine = AdaptiveSignalEngine(session=object(), sector_manager=_NoSectors())
+    engine.profile_cache = _Profiles(profiles)
+    engine.signal_sink = _Sink()
+    monkeypatch.setattr(
+        engine,
+        "_check_index_trend",
+        lambda target_date, session, signal_type: {
+            "index_trend": "neutral",
+            "confidence_adjustment": 0.0,
+        },
+    )
+    monkeypatch.setattr(
+        engine,
+        "_fetch_indicators",
+        lambda ticker, target_date, session: dict(indicators.get(ticker, {})),
+    )
+    monkeypatch.setattr(
+        signal_engine,
+        "load_ohlcv",
+        lambda session, ticker, start, end: build_ohlcv_arrays(rows[ticker], [ticker]),
+    )
+    return engine
+
+
+@pytest.mark.parametrize("detail", AdaptiveSignalEngine.DETAIL_LEVELS)
+def test_bulk_signals_match_per_ticker_signals(engine, universe, detail):
+    """Every ticker gets the same signal from the panel path as from generate_signal()."""
+    rows, profiles, indicators = universe
+    tickers = list(rows)
+    panel = build_price_panel(rows)
+
+    bulk = engine._signals_from_panel(
+        tickers,
+        TARGET_DATE,
+        engine._session,
+        panel,
+        engine.profile_cache.get_many(tickers, engine._session),
+        dict.fromkeys(tickers),
+        indicators,
+        track=False,
+        detail=detail,
+    )
+    single = {
+        ticker: signal
+        for ticker in tickers
+        if (signal := engine.generate_signal(ticker, TARGET_DATE, detail, use_cache=False))
+    }
+
+    # Uncalibrated and short histories are skipped by both paths
+    assert set(bulk) == set(single) == {"AAA", "BBB", "CCC", "DDD"}
+    for ticker, expected in single.items():
+        signal = bulk[ticker]
+        assert signal.signal_type == expected.signal_type
+        assert signal.recommended_hold_period == expected.recommended_hold_period
+        for name in NUMERIC_FIELDS:
+            assert getattr(signal, name) == pytest.approx(getattr(expected, name), abs=1e-9)
+        assert signal.scores.keys() == expected.scores.keys()
+        for key, value in expected.scores.items():
+            assert signal.scores[key] == pytest.approx(value, abs=1e-9)
+
+
+def test_bulk_generation_tracks_like_per_ticker(engine, universe):
+    """The bulk entry point records one signal per generated ticker through the sink."""
+    rows, profiles, indicators = universe
+    panel = build_price_panel(rows)
+
+    signals = engine._signals_from_panel(
+        list(rows),
+        TARGET_DATE,
+        engine._session,
+        panel,
+        engine.profile_cache.get_many(list(rows), engine._session),
+        dict.fromkeys(rows),
+        indicators,
+    )
+
+    assert sorted(call["ticker"] for call in engine.signal_sink.tracked) == sorted(signals)
+
+
+def test_chunked_scan_loads_panel_once(engine, universe, monkeypatch):
+    """iter_signals_bulk() scores every chunk from one shared price panel."""
+    rows, profiles, indicators = universe
+    loads = []
+
+    def load_price_panel(session, tickers, start, end):
+        loads.append(list(tickers))
+        return build_price_panel({ticker: rows[ticker] for ticker in tickers})
+
+    monkeypatch.setattr(signal_engine, "load_price_panel", load_price_panel)
+    monkeypatch.setattr(
+        engine,
+        "_fetch_indicators_bulk",
+        lambda tickers, target_date, session: {
+            ticker: indicators[ticker] for ticker in tickers if ticker in indicators
+        },
+    )
+    monkeypatch.setattr(engine.signal_cache, "data_version", lambda session=None: ("test",))
+    monkeypatch.setattr(engine.signal_cache, "get", lambda key: None)
+    monkeypatch.setattr(engine.signal_cache, "set", lambda key, signal: None)
+
+    chunked = {}
+    for signals in engine.iter_signals_bulk(list(rows), TARGET_DATE, "minimal", chunk_size=2):
+        chunked.update(signals)
+
+    assert loads == [list(rows)]
+    whole = engine.generate_signals_bulk(list(rows), TARGET_DATE, "minimal", use_cache=False)
+    assert {t: s.total_score for t, s in chunked.items()} == {
+        t: s.total_score for t, s in whole.items()
+    }
@@ -0,0 +1,52 @@
+"""DriftAuditor against concurrent IncrementalCalculator updates."""
+
+import threading
+
+import pytest
+
+from src.engine.drift_auditor import DriftAuditor
+from src.engine.incremental_calculator import IncrementalCalculator
+
+
+@pytest.fixture
+def calculator(history):
+    """Calculator whose GP state ends on the second-to-last bar."""
+    calculator = IncrementalCalculator()
+    calculator.update_indicators(
+        "GP", history.iloc[-2].to_dict(), historical_data=history.iloc[:-2]
+    )
+    return calculator
+
+
+def test_bar_applied_during_history_load_is_not_reseeded_away(calculator, history):
+    """A state advanced while history loads is skipped, not rebuilt from stale history."""
+
+    def load_history(ticker, days):
+        stale = history.iloc[:-1].copy()
+        calculator.update_indicators(ticker, history.iloc[-1].to_dict())
+        return stale
+
+    auditor = DriftAuditor(calculator, load_history, tolerance=0.0)
+    state = calculator.get_cached_state("GP")
+
+    result = auditor.audit_ticker("GP")
+
+    assert result["status"] == "skipped"
+    assert not result["reseeded"]
+    assert calculator.get_cached_state("GP") is state
+    assert state.last_date == history["date"].iloc[-1]
+
+
+def test_audit_waits_for_state_lock(calculator, history):
+    """The compare-and-reseed step runs only while no update holds the lock."""
+    auditor = DriftAuditor(calculator, lambda ticker, days: history.iloc[:-1], tolerance=0.0)
+    results = []
+
+    with calculator.state_lock:
+        worker = threading.Thread(target=lambda: results.append(auditor.audit_ticker("GP")))
+        worker.start()
+        worker.join(timeout=0.2)
+        assert worker.is_alive()
+
+    worker.join(timeout=5)
+    assert results[0]["status"] in ("ok", "drift")
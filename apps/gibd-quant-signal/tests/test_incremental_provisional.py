@@ -0,0 +1,111 @@
+"""Intraday peeks and closing-bar commits on IncrementalCalculator."""
+
+import pytest
+
+from src.engine.incremental_calculator import IncrementalCalculator
+
+START = 270  # First bar after the initialization history
+
+
+def _bar(history, i, **changes):
+    return {**history.iloc[i].to_dict(), **changes}
+
+
+@pytest.fixture
+def calculator(history):
+    """Calculator whose GP state ends on bar START."""
+    calculator = IncrementalCalculator()
+    calculator.update_indicators("GP", _bar(history, START), historical_data=history.iloc[:START])
+    return calculator
+
+
+@pytest.fixture
+def updates(calculator, monkeypatch):
+    """Records bars committed through update_indicators()."""
+    calls = []
+    update_indicators = calculator.update_indicators
+
+    def recording(ticker, new_day_data, *args, **kwargs):
+        calls.append(new_day_data)
+        return update_indicators(ticker, new_day_data, *args, **kwargs)
+
+    monkeypatch.setattr(calculator, "update_indicators", recording)
+    return calls
+
+
+def _snapshot(state):
+    return (
+        state.last_date,
+        state.sma_20_window.tolist(),
+        state.stoch_high_window.tolist(),
+        state.mfi_pos_window.tolist(),
+        state.avg_gain,
+        state.avg_loss,
+        state.obv,
+        state.prev_adx,
+    )
+
+
+def test_repeated_peeks_leave_committed_state_untouched(calculator, history):
+    """Peeking the same partial bar many times neither moves nor corrupts the state."""
+    state = calculator.get_cached_state("GP")
+    before = _snapshot(state)
+    partial = _bar(history, START + 1)
+
+    first = calculator.peek_indicators("GP", partial)
+    for scale in (0.98, 1.01, 1.0):
+        latest = calculator.peek_indicators("GP", {**partial, "close": partial["close"] * scale})
+
+    assert first["method"] == latest["method"] == "provisional"
+    assert latest["indicators"] == pytest.approx(first["indicators"])
+    assert calculator.get_cached_state("GP") is state
+    assert _snapshot(state) == before
+
+
+def test_commit_adopts_peeked_state(calculator, history, updates):
+    """Committing the peeked bar on an unchanged base reuses the peek without recomputing."""
+    bar = _bar(history, START + 1)
+    peeked = calculator.peek_indicators("GP", bar)
+    expected = IncrementalCalculator()
+    expected.update_indicators("GP", _bar(history, START), historical_data=history.iloc[:START])
+
+    result = calculator.commit_bar("GP")
+
+    assert updates == []
+    assert result["method"] == "incremental"
+    assert result["indicators"] is peeked["indicators"]
+    assert result["indicators"] == pytest.approx(
+        expected.update_indicators("GP", bar)["indicators"]
+    )
+    assert calculator.get_cached_state("GP").last_date == bar["date"]
+
+
+def test_commit_recomputes_when_bar_differs(calculator, history, updates):
+    """A closing bar other than the peeked one goes through update_indicators()."""
+    partial = _bar(history, START + 1)
+    calculator.peek_indicators("GP", {**partial, "close": partial["close"] * 0.95})
+
+    result = calculator.commit_bar("GP", partial)
+
+    assert [bar["close"] for bar in updates] == [partial["close"]]
+    assert result["method"] == "incremental"
+    assert calculator.get_cached_state("GP").prev_close == partial["close"]
+
+
+def test_commit_recomputes_when_base_moved(calculator, history, updates):
+    """A bar committed between peek and commit invalidates the peeked state."""
+    calculator.peek_indicators("GP", _bar(history, START + 2))
+    calculator.update_indicators("GP", _bar(history, START + 1))
+    updates.clear()
+
+    result = calculator.commit_bar("GP")
+
+    assert [bar["date"] for bar in updates] == [history["date"][START + 2]]
+    assert result["method"] == "incremental"
+
+    expected = IncrementalCalculator()
+    expected.update_indicators("GP", _bar(history, START), historical_data=history.iloc[:START])
+    expected.update_indicators("GP", _bar(history, START + 1))
+    assert result["indicators"] == pytest.approx(
+        expected.update_indicators("GP", _bar(history, START + 2))["indicators"]
+    )
@@ -0,0 +1,91 @@
+"""Rollback of restated and late bars through IncrementalCalculator's journal."""
+
+import pytest
+
+from src.engine.incremental_calculator import IncrementalCalculator
+
+START = 270  # First incrementally applied bar
+
+
+def _bar(history, i, **changes):
+    return {**history.iloc[i].to_dict(), **changes}
+
+
+def _run(history, bars, journal_size=IncrementalCalculator.JOURNAL_SIZE):
+    """Calculator initialized on history[:START] that then applied the given bars."""
+    calculator = IncrementalCalculator(journal_size=journal_size)
+    first, *rest = bars
+    calculator.update_indicators("GP", first, historical_data=history.iloc[:START])
+    for bar in rest:
+        calculator.update_indicators("GP", bar)
+    return calculator
+
+
+def _assert_same(result, expected):
+    assert result.keys() == expected.keys()
+    for name, value in expected.items():
+        assert result[name] == pytest.approx(value, rel=1e-9, abs=1e-9), name
+
+
+def test_restated_bar_matches_recompute(history):
+    """Correcting a journaled bar replays to the same state as a run with the fix."""
+    bars = [_bar(history, i) for i in range(START, START + 6)]
+    calculator = _run(history, bars)
+    corrected = {**bars[2], "close": bars[2]["close"] * 1.03, "volume": 5000}
+
+    result = calculator.restate_bars("GP", [corrected])
+
+    assert result["method"] == "restated"
+    assert result["rolled_back"] == 4
+    assert [r["date"] for r in result["results"]] == [bar["date"] for bar in bars[2:]]
+
+    fresh_bars = [*bars[:2], corrected, *bars[3:]]
+    fresh = _run(history, fresh_bars)
+    following = _bar(history, START + 6)
+    _assert_same(
+        calculator.update_indicators("GP", following)["indicators"],
+        fresh.update_indicators("GP", following)["indicators"],
+    )
+
+
+def test_late_bar_fills_gap(history):
+    """A missing day arriving late is inserted in date order and later bars replayed."""
+    bars = [_bar(history, i) for i in range(START, START + 5)]
+    calculator = _run(history, bars[:2] + bars[3:])
+
+    result = calculator.update_indicators("GP", bars[2])
+
+    assert result["method"] == "restated"
+    assert [r["date"] for r in result["replayed"]] == [bar["date"] for bar in bars[3:]]
+    assert calculator.get_cached_state("GP").last_date == bars[-1]["date"]
+    expected = _run(history, bars[:-1]).update_indicators("GP", bars[-1])["indicators"]
+    _assert_same(result["replayed"][-1]["indicators"], expected)
+
+def test_bar_older_than_journal_fails(history):
+    """A restatement before the oldest journaled bar is refused and changes nothing."""
+    bars = [_bar(history, i) for i in range(START, START + 6)]
+    calculator = _run(history, bars, journal_size=3)
+    state = calculator.get_cached_state("GP")
+    last_date = state.last_date
+
+    result = calculator.restate_bars("GP", [{**bars[1], "close": bars[1]["close"] + 1}])
+
+    assert result["method"] == "failed"
+    assert "older than the rollback journal" in result["error"]
+    assert calculator.get_cached_state("GP") is state
+    assert state.last_date == last_date
+
+
+def test_identical_bar_is_unchanged(history):
+    """Re-sending an applied bar is a no-op."""
+    bars = [_bar(history, i) for i in range(START, START + 4)]
+    calculator = _run(history, bars)
+    state = calculator.get_cached_state("GP")
+    sma_20 = state.sma_20_window.tolist()
+
+    result = calculator.restate_bars("GP", [bars[2]])
+
+    assert result["method"] == "unchanged"
+    assert result["results"] == []
+    assert calculator.get_cached_state("GP") is state
+    assert state.sma_20_window.tolist() == sma_20
@@ -0,0 +1,148 @@
+"""Persisted IncrementalState snapshots: encoding, store and warm restarts."""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from src.engine import state_store
+from src.engine.incremental_calculator import (
+    IncrementalCalculator,
+    IncrementalState,
+    validate_incremental_accuracy,
+)
+from src.engine.ring_buffer import RingBuffer
+from src.engine.state_store import IncrementalStateStore, decode_state, encode_state
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = IncrementalStateStore(str(tmp_path / "state.sqlite"))
+    yield store
+    store.close()
+
+
+def _bar(history, i):
+    return history.iloc[i].to_dict()
+
+
+def test_stale_snapshot_with_history_is_reinitialized(store, history):
+    """A snapshot behind the given history is discarded, not updated past the gap."""
+    writer = IncrementalCalculator(state_store=store)
+    writer.update_indicators("GP", _bar(history, 250), historical_data=history.iloc[:250])
+
+    restarted = IncrementalCalculator(state_store=store)
+    assert restarted.get_cached_state("GP") is None  # Snapshots load on update only
+    result = restarted.update_indicators(
+        "GP", _bar(history, 253), historical_data=history.iloc[:253]
+    )
+
+    expected = IncrementalCalculator().update_indicators(
+        "GP", _bar(history, 253), historical_data=history.iloc[:253]
+    )
+    assert result["method"] == "incremental"
+    assert result["indicators"]["sma_20"] == pytest.approx(history["close"][234:254].mean())
+    assert result["indicators"] == pytest.approx(expected["indicators"])
+
+
+def test_clear_state_keeps_snapshot_unless_persisted(store, history):
+    """clear_state() drops memory only; persisted=True also deletes the snapshot."""
+    calculator = IncrementalCalculator(state_store=store)
+    calculator.update_indicators("GP", _bar(history, 250), historical_data=history.iloc[:250])
+
+    calculator.clear_state("GP")
+    assert calculator.get_cached_state("GP") is None
+    assert store.load("GP", IncrementalState) is not None
+
+    calculator.clear_state("GP", persisted=True)
+    assert store.load("GP", IncrementalState) is None
+
+
+def test_validation_leaves_live_states_untouched(store, history):
+    """validate_incremental_accuracy() never replaces the calculator's states."""
+    pytest.importorskip("talib")
+    calculator = IncrementalCalculator(state_store=store)
+    calculator.update_indicators("GP", _bar(history, 280), historical_data=history.iloc[:280])
+    state = calculator.get_cached_state("GP")
+    snapshot = store.load("GP", IncrementalState)
+
+    result = validate_incremental_accuracy(calculator, "GP", history)
+
+    assert result["valid"]
+    assert calculator.get_cached_state("GP") is state
+    assert store.load("GP", IncrementalState).last_date == snapshot.last_date
+
+
+def test_encode_decode_round_trip():
+    """Wrapped and partial windows keep their order and stats; dates become dates."""
+    wrapped = RingBuffer(4)
+    for value in range(1, 8):
+        wrapped.push(float(value))  # Head has moved past slot 0
+    partial = RingBuffer(5)
+    for value in (2.0, 4.0, 9.0):
+        partial.push(value)
+    state = IncrementalState(
+        ticker="GP",
+        last_date=pd.Timestamp("2024-03-15 00:00"),
+        avg_gain=0.25,
+        sma_20_window=wrapped,
+        cci_window=partial,
+        obv=12345.0,
+        needs_reseed=True,
+    )
+
+    decoded = decode_state(encode_state(state), IncrementalState)
+
+    assert decoded.last_date == date(2024, 3, 15)
+    assert decoded.sma_20_window.tolist() == [4.0, 5.0, 6.0, 7.0]
+    assert decoded.cci_window.tolist() == [2.0, 4.0, 9.0]
+    assert len(decoded.cci_window) == 3 and not decoded.cci_window.full
+    assert decoded.cci_window.mean() == pytest.approx(partial.mean())
+    assert decoded.cci_window.std() == pytest.approx(partial.std())
+    decoded.sma_20_window.push(8.0)
+    assert decoded.sma_20_window.tolist() == [5.0, 6.0, 7.0, 8.0]
+    assert (decoded.avg_gain, decoded.obv, decoded.needs_reseed) == (0.25, 12345.0, True)
+    assert decoded.sma_50_window is None
+
+
+def test_old_format_snapshots_are_ignored(store, history, monkeypatch):
+    """Rows written with another format version load as missing."""
+    calculator = IncrementalCalculator(state_store=store)
+    calculator.update_indicators("GP", _bar(history, 250), historical_data=history.iloc[:250])
+
+    monkeypatch.setattr(state_store, "STATE_FORMAT_VERSION", state_store.STATE_FORMAT_VERSION + 1)
+
+    assert store.load("GP", IncrementalState) is None
+    assert store.load_many(IncrementalState) == {}
+
+
+def test_forked_process_opens_its_own_connection(store, monkeypatch):
+    """A connection inherited through fork is replaced, not shared."""
+    with store._lock:
+        parent = store._connect()
+
+    monkeypatch.setattr(state_store.os, "getpid", lambda: -1)
+    store.save(IncrementalState(ticker="GP", last_date=date(2024, 1, 2)))
+
+    assert store._connection is not parent
+    assert store.load("GP", IncrementalState).last_date == date(2024, 1, 2)
+
+
+def test_restored_state_updates_like_in_memory_state(store, history):
+    """A fresh calculator restored from the store continues exactly like the original."""
+    in_memory = IncrementalCalculator()
+    persisted = IncrementalCalculator(state_store=store)
+    for calculator in (in_memory, persisted):
+        calculator.update_indicators("GP", _bar(history, 270), historical_data=history.iloc[:270])
+        for i in range(271, 280):
+            calculator.update_indicators("GP", _bar(history, i))
+
+    restarted = IncrementalCalculator(state_store=store)
+    assert restarted.restore_states() == 1
+    expected = in_memory.update_indicators("GP", _bar(history, 280))
+    result = restarted.update_indicators("GP", _bar(history, 280))
+
+    assert result["method"] == "incremental"
+    assert result["indicators"].keys() == expected["indicators"].keys()
+    for name, value in expected["indicators"].items():
+        assert result["indicators"][name] == pytest.approx(value, rel=1e-9), name
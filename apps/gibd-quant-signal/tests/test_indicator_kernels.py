@@ -0,0 +1,42 @@
+"""Wilder-smoothed kernels against TA-Lib."""
+
+import numpy as np
+import pytest
+
+from src.engine import indicator_kernels as kernels
+
+talib = pytest.importorskip("talib")
+
+
+def _bars(count: int, seed: int = 1) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, count)))
+    high = close * (1 + rng.uniform(0, 0.02, count))
+    low = close * (1 - rng.uniform(0, 0.02, count))
+    return high, low, close
+
+
+@pytest.mark.parametrize("count", [27, 28, 40, 300])
+def test_wilder_adx_matches_talib(count):
+    """Same values and the same warm-up bars as talib.ADX."""
+    high, low, close = _bars(count)
+
+    result = kernels.adx(high, low, close, 14, smoothing="wilder")[0]
+    expected = talib.ADX(high, low, close, 14)
+
+    np.testing.assert_allclose(result, expected, rtol=0, atol=1e-9, equal_nan=True)
+
+
+def test_wilder_adx_padded_rows():
+    """Left-padded panel rows are seeded at their own first bar."""
+    high, low, close = _bars(60)
+    panel = np.full((3, 2, 60), np.nan)
+    for k, series in enumerate((high, low, close)):
+        panel[k, 0] = series
+        panel[k, 1, 20:] = series[:40]
+
+    result = kernels.adx(*panel, 14, smoothing="wilder")
+
+    expected = talib.ADX(high[:40], low[:40], close[:40], 14)
+    np.testing.assert_allclose(result[1, 20:], expected, atol=1e-9, equal_nan=True)
+    assert np.isnan(result[1, :20]).all()
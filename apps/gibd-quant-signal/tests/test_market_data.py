@@ -0,0 +1,87 @@
+"""load_ohlcv() against the ORM row-by-row path it replaced."""
+
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.database.market_data import load_ohlcv
+from src.database.models import WsDseDailyPrice
+
+BARS = {"AAA": 30, "BBB": 12, "CCC": 25}
+
+
+@pytest.fixture
+def session(history):
+    """SQLite session with differently sized histories per ticker."""
+    engine = create_engine("sqlite://")
+    WsDseDailyPrice.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    for k, (ticker, bars) in enumerate(BARS.items()):
+        rows = history.iloc[k * 40 : k * 40 + bars]
+        session.add_all(
+            WsDseDailyPrice(
+                txn_date=date(2024, 1, 1) + timedelta(days=i),
+                txn_scrip=ticker,
+                txn_open=round(row.open, 2),
+                txn_high=round(row.high, 2),
+                txn_low=round(row.low, 2),
+                txn_close=round(row.close, 2),
+                txn_volume=int(row.volume),
+            )
+            for i, row in enumerate(rows.itertuples())
+        )
+    session.commit()
+    yield session
+    session.close()
+
+
+def _orm_frame(session, ticker, limit=None):
+    """Previous per-ticker path: ORM objects, Decimal -> float in Python."""
+    query = (
+        session.query(WsDseDailyPrice)
+        .filter(WsDseDailyPrice.txn_scrip == ticker)
+        .order_by(WsDseDailyPrice.txn_date.desc())
+    )
+    stock_data = (query.limit(limit) if limit else query).all()
+    stock_data.reverse()
+    return pd.DataFrame(
+        {
+            "date": [row.txn_date for row in stock_data],
+            "open": [float(row.txn_open) for row in stock_data],
+            "high": [float(row.txn_high) for row in stock_data],
+            "low": [float(row.txn_low) for row in stock_data],
+            "close": [float(row.txn_close) for row in stock_data],
+            "volume": [int(row.txn_volume) for row in stock_data],
+        }
+    )
+
+
+@pytest.mark.parametrize("limit", [None, 20])
+def test_single_ticker_frame_matches_orm(session, limit):
+    """One ticker loads the same frame as the ORM path, with and without a limit."""
+    for ticker in BARS:
+        pd.testing.assert_frame_equal(
+            load_ohlcv(session, ticker, limit=limit).to_frame(),
+            _orm_frame(session, ticker, limit),
+        )
+
+
+@pytest.mark.parametrize("limit", [None, 20])
+def test_batched_load_matches_orm(session, limit):
+    """A multi-ticker load slices into the same per-ticker frames."""
+    bars = load_ohlcv(session, [*BARS, "ZZZ"], limit=limit)
+
+    assert bars.count("ZZZ") == 0
+    for ticker in BARS:
+        assert bars.count(ticker) == min(BARS[ticker], limit or BARS[ticker])
+        pd.testing.assert_frame_equal(bars.to_frame(ticker), _orm_frame(session, ticker, limit))
+
+
+def test_date_range_filters_bars(session):
+    """start_date and end_date are inclusive."""
+    bars = load_ohlcv(session, "AAA", date(2024, 1, 5), date(2024, 1, 10))
+
+    assert list(bars.to_frame()["date"]) == [date(2024, 1, d) for d in range(5, 11)]
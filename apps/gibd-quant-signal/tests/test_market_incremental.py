@@ -0,0 +1,50 @@
+"""States exported by MarketIncrementalEngine and reused by IncrementalCalculator."""
+
+import pytest
+
+from src.engine.incremental_calculator import IncrementalCalculator
+from src.engine.market_incremental import MarketIncrementalEngine
+from src.engine.signal_panel import build_price_panel
+from src.engine.state_store import IncrementalStateStore
+
+
+@pytest.fixture
+def calculator(tmp_path, history):
+    """Calculator whose store holds the engine's export for all but the last bar."""
+    rows = [("GP", *bar) for bar in history.iloc[:-1].itertuples(index=False)]
+    engine = MarketIncrementalEngine.from_panel(build_price_panel({"GP": rows}))
+    store = IncrementalStateStore(str(tmp_path / "state.sqlite"))
+    store.save_many(engine.to_states().values())
+    return IncrementalCalculator(state_store=store)
+
+
+def test_exported_states_need_reseed(history):
+    """Exports carry no extended indicator state and say so."""
+    rows = [("GP", *bar) for bar in history.itertuples(index=False)]
+    engine = MarketIncrementalEngine.from_panel(build_price_panel({"GP": rows}))
+
+    state = engine.to_states()["GP"]
+
+    assert state.needs_reseed
+    assert state.stoch_high_window is None
+
+
+def test_calculator_reseeds_exported_state_from_history(calculator, history):
+    """With history, the first update rebuilds the state and returns extended values."""
+    bar = history.iloc[-1].to_dict()
+
+    result = calculator.update_indicators("GP", bar, historical_data=history.iloc[:-1])
+
+    assert result["method"] == "incremental"
+    assert result["indicators"]["adx"] is not None
+    assert result["indicators"]["mfi"] is not None
+    assert not calculator.get_cached_state("GP").needs_reseed
+
+
+def test_calculator_keeps_core_indicators_without_history(calculator, history):
+    """Without history the exported state still updates the core indicators."""
+    result = calculator.update_indicators("GP", history.iloc[-1].to_dict())
+
+    assert result["indicators"]["rsi"] is not None
+    assert result["indicators"].get("adx") is None
+    assert calculator.get_cached_state("GP").needs_reseed
@@ -0,0 +1,71 @@
+"""SignalSink flush behaviour when part of a batch cannot be written."""
+
+from datetime import date
+
+import pytest
+
+from src.engine.signal_sink import SignalSink
+
+
+@pytest.fixture
+def sink(monkeypatch):
+    """Sink whose writes fail for any batch containing a "BAD" ticker."""
+    sink = SignalSink(batch_size=10_000, flush_interval_seconds=3600, max_attempts=2)
+    sink.written = []
+    sink.write_calls = 0
+
+    def write(rows):
+        sink.write_calls += 1
+        if any(row["ticker"].startswith("BAD") for row in rows):
+            raise RuntimeError("value out of range")
+        sink.written.extend(row["ticker"] for row in rows)
+
+    monkeypatch.setattr(sink, "_write", write)
+    yield sink
+    sink.close()
+
+
+def _submit(sink, tickers):
+    for ticker in tickers:
+        sink.submit({"ticker": ticker, "signal_date": date(2025, 6, 30), "confidence": 0.5})
+
+
+def test_failed_batch_is_split_and_good_rows_written(sink):
+    """Rows next to a failing row are written in the same flush."""
+    tickers = [f"T{i}" for i in range(16)]
+    _submit(sink, tickers[:5] + ["BAD"] + tickers[5:])
+
+    assert sink.flush() == 16
+    assert sorted(sink.written) == sorted(tickers)
+    stats = sink.get_stats()
+    assert stats["written"] == 16
+    assert stats["buffered"] == 1
+    assert stats["failed_flushes"] == 1
+
+
+def test_row_dropped_after_max_attempts(sink):
+    """A row that keeps failing is retried max_attempts times, then dropped."""
+    _submit(sink, ["GP", "BAD"])
+
+    assert sink.flush() == 1
+    assert sink.get_stats()["buffered"] == 1
+
+    assert sink.flush() == 0
+    stats = sink.get_stats()
+    assert stats["buffered"] == 0
+    assert stats["dropped"] == 1
+
+    calls = sink.write_calls
+    assert sink.flush() == 0
+    assert sink.write_calls == calls
+
+
+def test_resubmitted_row_gets_fresh_attempts(sink):
+    """A new row for a failing key is not dropped for the old row's failures."""
+    _submit(sink, ["BAD"])
+    sink.flush()
+    _submit(sink, ["BAD"])
+
+    sink.flush()
+    assert sink.get_stats()["buffered"] == 1
+    assert sink.get_stats()["dropped"] == 0
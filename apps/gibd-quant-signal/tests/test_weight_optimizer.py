@@ -0,0 +1,38 @@
+"""Walk-forward fold construction."""
+
+import numpy as np
+import pytest
+
+from src.engine.weight_optimizer import SCORE_COMPONENTS, ScoreMatrix, WalkForwardOptimizer
+
+
+def _matrix(days: int, horizon: int) -> ScoreMatrix:
+    dates = np.datetime64("2024-01-01") + np.arange(days)
+    return ScoreMatrix(
+        tickers=np.array(["GP"] * days, dtype=object),
+        dates=dates,
+        scores=np.zeros((days, len(SCORE_COMPONENTS))),
+        forward_returns=np.zeros(days),
+        horizon=horizon,
+    )
+
+
+def test_folds_embargo_train_window():
+    """Train windows end `horizon` dates before their test window starts."""
+    matrix = _matrix(100, horizon=5)
+    folds = WalkForwardOptimizer(train_days=30, test_days=10).folds(matrix)
+
+    assert len(folds) == 7
+    train, test = folds[0]
+    assert train.sum() == 25
+    assert test.sum() == 10
+    assert matrix.dates[train][-1] + np.timedelta64(5, "D") < matrix.dates[test][0]
+
+
+@pytest.mark.parametrize("train_days", [5, 3])
+def test_folds_reject_train_window_within_horizon(train_days):
+    """A train window the embargo would empty is rejected up front."""
+    optimizer = WalkForwardOptimizer(train_days=train_days, test_days=10)
+
+    with pytest.raises(ValueError, match="must exceed the score matrix horizon"):
+        optimizer.folds(_matrix(100, horizon=5))